@@ -170,6 +170,7 @@ __all__ = [  # noqa: RUF022
     "Settings",
     "SizeMix",
     "Spacer",
+    "SpreadsheetWriter",
     "Span",
     "Spreadsheet",
     "Style",
@@ -241,11 +242,17 @@ __all__ = [  # noqa: RUF022
     "default_percentage_style",
     "default_time_style",
     "default_toc_level_style",
+    "enable_class_lookup",
+    "enable_wrapper_cache",
     "hex2rgb",
     "hexa_color",
+    "iter_table_rows",
+    "iter_tables_rows",
     "make_table_cell_border_string",
     "remove_tree",
     "rgb2hex",
+    "set_xpath_cache_size",
+    "xpath_cache_info",
 ]
 from .annotation import Annotation, AnnotationEnd, AnnotationMixin
 from .body import (
@@ -274,7 +281,18 @@ from .container import Container
 from .content import Content
 from .document import Document
 from .draw_page import DrawPage
-from .element import FIRST_CHILD, LAST_CHILD, NEXT_SIBLING, PREV_SIBLING, Element, EText
+from .element import (
+    FIRST_CHILD,
+    LAST_CHILD,
+    NEXT_SIBLING,
+    PREV_SIBLING,
+    Element,
+    EText,
+    enable_class_lookup,
+    enable_wrapper_cache,
+    set_xpath_cache_size,
+    xpath_cache_info,
+)
 from .element_typed import ElementTyped
 from .form import Form, FormMixin
 from .form_controls import (
@@ -397,6 +415,7 @@ from .shapes import (
 )
 from .smil import AnimPar, AnimSeq, AnimTransFilter
 from .spacer import Spacer
+from .stream import SpreadsheetWriter, iter_table_rows, iter_tables_rows
 from .style import (
     BackgroundImage,
     Style,
@@ -33,11 +33,13 @@ from datetime import timedelta
 from decimal import ConversionSyntax, Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any
 
+from lxml.etree import SubElement  # ty: ignore[unresolved-import]
+
 from .annotation import AnnotationMixin
 from .const import CellValue
 from .datatype import Boolean, Date, DateTime, Duration
-from .element import Element, register_element_class_list
-from .element_typed import ElementTyped
+from .element import Element, _get_lxml_tag, register_element_class_list
+from .element_typed import ElementTyped, _encode_typed_value
 from .mixin_list import ListMixin
 from .mixin_toc import TocMixin
 from .section import SectionMixin
@@ -46,8 +48,118 @@ _int = builtins.int
 _float = builtins.float
 _bool = builtins.bool
 if TYPE_CHECKING:
+    from lxml.etree import _Element  # ty: ignore[unresolved-import]
+
     from .style import Style
 
+_VALUE_TYPE = _get_lxml_tag("office:value-type")
+_VALUE = _get_lxml_tag("office:value")
+_BOOLEAN_VALUE = _get_lxml_tag("office:boolean-value")
+_DATE_VALUE = _get_lxml_tag("office:date-value")
+_TIME_VALUE = _get_lxml_tag("office:time-value")
+_STRING_VALUE = _get_lxml_tag("office:string-value")
+_PARAGRAPH = _get_lxml_tag("text:p")
+_CELL = _get_lxml_tag("table:table-cell")
+_COLUMNS_REPEATED = _get_lxml_tag("table:number-columns-repeated")
+_STYLE_NAME = _get_lxml_tag("table:style-name")
+
+
+def _decode_value_and_type(
+    cell: _Element,
+) -> tuple[CellValue | None, str | None] | None:
+    """Decode the value and type of a cell directly from its XML element.
+
+    Same result as Cell.get_value(get_type=True), without wrapping the cell.
+    Return None if the cell needs the Cell API: paragraphs containing
+    markup, missing value attribute or unknown type.
+
+    Args:
+        cell: The lxml element of a table cell.
+
+    Returns:
+        tuple[CellValue | None, str | None] | None: The value and the ODF
+            type, or None.
+    """
+    value_type = cell.get(_VALUE_TYPE)
+    if value_type is None:
+        return None, None
+    if value_type == "string":
+        string = cell.get(_STRING_VALUE)
+        if string is not None:
+            return string, value_type
+        texts = []
+        for para in cell.iterchildren(_PARAGRAPH):
+            if len(para):
+                return None
+            texts.append(para.text or "")
+        if texts:
+            return "\n".join(texts), value_type
+        return None, value_type
+    if value_type in {"float", "percentage", "currency"}:
+        read_number = cell.get(_VALUE)
+        if read_number is None:
+            return None
+        number = Decimal(read_number)
+        with contextlib.suppress(ValueError):
+            if _int(number) == number:
+                return _int(number), value_type
+        return number, value_type
+    if value_type == "date":
+        read_date = cell.get(_DATE_VALUE)
+        if read_date is None:
+            return None
+        if "T" in read_date:
+            return DateTime.decode(read_date), value_type
+        return Date.decode(read_date), value_type
+    if value_type == "boolean":
+        return Boolean.decode(cell.get(_BOOLEAN_VALUE)), value_type
+    if value_type == "time":
+        read_time = cell.get(_TIME_VALUE)
+        if read_time is None:
+            return None
+        return Duration.decode(read_time), value_type
+    return None
+
+
+def _append_cell_xml(
+    row: _Element,
+    value: CellValue | None,
+    repeated: _int = 1,
+    style: str | None = None,
+    cell_type: str | None = None,
+    currency: str | None = None,
+) -> _Element:
+    """Append the XML of a cell to a row, without wrapping it in a Cell.
+
+    Same result as Cell(value, cell_type=cell_type, currency=currency,
+    repeated=repeated, style=style), much faster to build many cells.
+
+    Args:
+        row: The lxml element of the table row.
+        value: The Python value of the cell.
+        repeated: The number of columns covered by the cell.
+        style: The name of the style of the cell.
+        cell_type: The ODF value type, guessed from the value if not provided.
+        currency: A three-letter currency code, for the 'currency' type.
+
+    Returns:
+        _Element: The lxml element of the new cell.
+    """
+    attributes, text = _encode_typed_value(value, cell_type, None, currency)
+    attrib = {
+        _get_lxml_tag(name): str(attr_value)
+        for name, attr_value in attributes
+        if attr_value is not None
+    }
+    if repeated > 1:
+        attrib[_COLUMNS_REPEATED] = str(repeated)
+    if style is not None:
+        attrib[_STYLE_NAME] = style
+    cell = SubElement(row, _CELL, attrib)
+    if text is not None:
+        SubElement(cell, _PARAGRAPH).text = text
+    return cell
+
 
 class Cell(ListMixin, TocMixin, SectionMixin, AnnotationMixin, ElementTyped):
     """A cell of a table, "table:table-cell" and "table:covered-table-cell"."""
@@ -28,13 +28,25 @@ import contextlib
 import io
 import os
 import shutil
+import struct
 import sys
 import textwrap
 import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from functools import cache
 from pathlib import Path, PurePath
-from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipfile, ZipFile, is_zipfile
+from typing import Any, BinaryIO
+from zipfile import (
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    BadZipfile,
+    ZipFile,
+    ZipInfo,
+    is_zipfile,
+)
 
 from lxml.etree import (  # ty: ignore[unresolved-import]
     Element,
@@ -67,6 +79,37 @@ from .security import SecurityError, security, validate_zip_safety
 from .utils import bytes_to_str, str_to_bytes
 
 CHUNK_SIZE = 65536  # 64KB for incremental ZIP reading
+ZIP_LOCAL_HEADER_SIZE = 30
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+ZIP_DATA_DESCRIPTOR_FLAG = 0x08
+# Function writing the bytes of a part into a binary stream
+PartWriter = Callable[[BinaryIO], None]
+# Media already compressed, that gain nothing from deflate
+COMPRESSED_MEDIA_SUFFIXES = {
+    ".avi",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".m4a",
+    ".mkv",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".odb",
+    ".odc",
+    ".odf",
+    ".odg",
+    ".odp",
+    ".ods",
+    ".odt",
+    ".ogg",
+    ".png",
+    ".svgz",
+    ".webm",
+    ".webp",
+    ".zip",
+}
 TAB = "  "
 TEXT_CONTENT = {
     "config:config-item",
@@ -285,6 +328,180 @@ def normalize_path(path: str) -> str:
     return PurePath(path).as_posix()
 
 
+class _ZipPartReader(io.RawIOBase):
+    """Read a ZIP entry while checking its decompressed size (internal)."""
+
+    def __init__(self, stream: BinaryIO, name: str) -> None:
+        super().__init__()
+        self._stream = stream
+        self._name = name
+        self._total_size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = self._stream.readinto(buffer)  # ty: ignore
+        self._total_size += size
+        if self._total_size > security.max_uncompressed_size:
+            raise SecurityError(
+                f"odfdo detected a breach of security, see security.py limits. "
+                f"ZIP entry '{self._name}' decompressed size ({self._total_size} bytes) "
+                f"exceeds limit ({security.max_uncompressed_size} bytes)."
+            )
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+        super().close()
+
+
+# Private attributes of ZipFile used to write already compressed members
+_RAW_WRITE_ATTRIBUTES = (
+    "_lock",
+    "_seekable",
+    "_writecheck",
+    "_didModify",
+    "start_dir",
+    "fp",
+)
+
+
+def _can_write_raw(filezip: ZipFile) -> bool:
+    """Return True if the ZipFile has the private attributes needed to write
+    already compressed members (internal).
+
+    Otherwise, the members are written with the public ZipFile.open().
+    """
+    return all(hasattr(filezip, name) for name in _RAW_WRITE_ATTRIBUTES)
+
+
+def _write_zip_entry(
+    filezip: ZipFile,
+    zinfo: ZipInfo,
+    chunks: Iterable[bytes],
+) -> None:
+    """Write a member with its already compressed data (internal).
+
+    The CRC, sizes and compression type of zinfo must describe the data.
+    Requires _can_write_raw(filezip).
+
+    Args:
+        filezip: The ZipFile opened for writing.
+        zinfo: The ZipInfo of the member.
+        chunks: The compressed data of the member.
+    """
+    # sizes are known, so no data descriptor after the data
+    zinfo.flag_bits &= ~ZIP_DATA_DESCRIPTOR_FLAG
+    # Same steps as ZipFile.open(..., "w"), without compressor
+    with filezip._lock:
+        if filezip._seekable:
+            filezip.fp.seek(filezip.start_dir)
+        zinfo.header_offset = filezip.fp.tell()
+        filezip._writecheck(zinfo)
+        filezip._didModify = True
+        filezip.fp.write(zinfo.FileHeader())
+        for chunk in chunks:
+            filezip.fp.write(chunk)
+        filezip.start_dir = filezip.fp.tell()
+        filezip.filelist.append(zinfo)
+        filezip.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_raw_zip_entry(
+    filezip: ZipFile,
+    path: str,
+    info: ZipInfo,
+    source: BinaryIO,
+) -> None:
+    """Copy a member of a source archive without decompressing it.
+
+    The compressed bytes of the member are copied as they are, with the CRC
+    and sizes already known from the source archive.
+
+    Args:
+        filezip: The ZipFile opened for writing.
+        path: The name of the member in the target archive.
+        info: The ZipInfo of the member in the source archive.
+        source: The source archive, opened in binary mode.
+    """
+    if not _can_write_raw(filezip):
+        # decompress and compress again with the public API
+        zinfo = ZipInfo(path, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.external_attr = info.external_attr
+        with (
+            ZipFile(source) as source_zip,
+            source_zip.open(info) as reader,
+            filezip.open(zinfo, "w", force_zip64=True) as writer,
+        ):
+            shutil.copyfileobj(reader, writer, CHUNK_SIZE)
+        return
+    source.seek(info.header_offset)
+    header = source.read(ZIP_LOCAL_HEADER_SIZE)
+    if len(header) != ZIP_LOCAL_HEADER_SIZE or header[:4] != ZIP_LOCAL_HEADER_SIGNATURE:
+        raise BadZipfile(f"Bad local file header for {info.filename!r}")
+    name_length, extra_length = struct.unpack("<2H", header[26:30])
+    source.seek(info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+    zinfo = ZipInfo(path, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zinfo.external_attr = info.external_attr
+    zinfo.flag_bits = info.flag_bits
+
+    def read_chunks() -> Iterator[bytes]:
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = source.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise BadZipfile(f"Truncated data for {info.filename!r}")
+            remaining -= len(chunk)
+            yield chunk
+
+    _write_zip_entry(filezip, zinfo, read_chunks())
+
+
+def _compress_zip_entry(
+    path: str,
+    data: bytes,
+    compress_type: int,
+    compression_level: int | None,
+) -> tuple[ZipInfo, bytes]:
+    """Compress the data of a member, as ZipFile.writestr() would do.
+
+    Used to compress members in worker threads, zlib releasing the GIL.
+
+    Args:
+        path: The name of the member.
+        data: The uncompressed data.
+        compress_type: ZIP_DEFLATED or ZIP_STORED.
+        compression_level: The zlib compression level, or None for default.
+
+    Returns:
+        The ZipInfo of the member and its compressed data.
+    """
+    zinfo = ZipInfo(path, time.localtime(time.time())[:6])
+    if path.endswith("/"):
+        zinfo.external_attr = 0o40775 << 16  # drwxrwxr-x
+        zinfo.external_attr |= 0x10  # MS-DOS directory flag
+        compress_type = ZIP_STORED
+    else:
+        zinfo.external_attr = 0o600 << 16  # ?rw-------
+    zinfo.compress_type = compress_type
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    if compress_type == ZIP_DEFLATED:
+        if compression_level is None:
+            compression_level = zlib.Z_DEFAULT_COMPRESSION
+        compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+
 class Container:
     """Storage of the ODF document, as zip or other format."""
 
@@ -296,8 +513,13 @@ class Container:
         """
         self.__parts: dict[str, bytes | None] = {}
         self.__parts_ts: dict[str, int] = {}
+        # Parts changed since loaded from the Zip archive
+        self.__modified: set[str] = set()
         self.__path_like: Path | str | io.BytesIO | None = None
         self.__packaging: str = ZIP
+        # Opened archive of a Zip ODF file, with its validated index
+        self.__zipfile: ZipFile | None = None
+        self.__zip_infos: dict[str, ZipInfo] = {}
         self.path: Path | None = None  # or Path
         if path:
             self.open(path)
@@ -305,12 +527,38 @@ class Container:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} type={self.mimetype} path={self.path}>"
 
+    def __enter__(self) -> Container:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The opened archive is never shared between copies
+        state = self.__dict__.copy()
+        state["_Container__zipfile"] = None
+        state["_Container__zip_infos"] = {}
+        return state
+
+    def close(self) -> None:
+        """Close the archive of a Zip ODF file, if opened.
+
+        Parts already loaded stay available. The archive is opened again if
+        some other part is required later.
+        """
+        if self.__zipfile is not None:
+            self.__zipfile.close()
+        self.__zipfile = None
+        self.__zip_infos = {}
+
     def open(self, path_or_file: Path | str | io.BytesIO) -> None:
         """Load the content of an ODF file.
 
         Args:
             path_or_file: Path to the document, or an opened file.
         """
+        self.close()
+        self.__modified = set()
         self.__path_like = path_or_file
         if isinstance(path_or_file, (str, Path)):
             self.path = Path(path_or_file).expanduser()
@@ -380,6 +628,14 @@ class Container:
         return root.find(_ns_tag("body")) is not None
 
     def _read_zip(self) -> None:
+        if self.path is not None:
+            zf = self._zip_file()
+            mimetype = bytes_to_str(self._read_zip_entry(zf, "mimetype"))
+            if mimetype not in ODF_MIMETYPES:
+                self.close()
+                raise ValueError(f"Document of unknown type {mimetype}")
+            self.__parts["mimetype"] = str_to_bytes(mimetype)
+            return
         if isinstance(self.__path_like, io.BytesIO):
             self.__path_like.seek(0)
         with ZipFile(self.__path_like) as zf:  # ty: ignore
@@ -1026,20 +1282,46 @@ class Container:
             timestamp = -1
         return timestamp
 
+    def _zip_file(self) -> ZipFile:
+        """Get the opened archive of the Zip ODF file.
+
+        The archive is opened and checked against zip bombs only once, then
+        kept opened with an index of its members until close() is called.
+
+        Returns:
+            The opened ZipFile.
+        """
+        if self.__zipfile is None:
+            if self.path is None:
+                raise ValueError("Document path is not defined")
+            zf = ZipFile(self.path)
+            try:
+                # Security check for zip bombs
+                validate_zip_safety(zf)
+            except SecurityError:
+                zf.close()
+                raise
+            self.__zip_infos = {
+                normalize_path(info.filename): info for info in zf.infolist()
+            }
+            self.__zipfile = zf
+        return self.__zipfile
+
+    def _zip_infos(self) -> dict[str, ZipInfo]:
+        """Get the index of the members of the Zip ODF file."""
+        self._zip_file()
+        return self.__zip_infos
+
     def _get_zip_part(self, name: str) -> bytes | None:
         """Get bytes of a part from the Zip ODF file.
 
         No cache.
         """
-        if self.path is None:
-            raise ValueError("Document path is not defined")
         try:
-            with ZipFile(self.path) as zf:
-                # Security check for zip bombs
-                validate_zip_safety(zf)
-                upath = normalize_path(name)
-                self.__parts[upath] = self._read_zip_entry(zf, name)
-                return self.__parts[upath]
+            zf = self._zip_file()
+            upath = normalize_path(name)
+            self.__parts[upath] = self._read_zip_entry(zf, name)
+            return self.__parts[upath]
         except (BadZipfile, KeyError):
             return None
 
@@ -1048,62 +1330,195 @@ class Container:
 
         No cache.
         """
-        if self.path is None:
-            raise ValueError("Document path is not defined")
         try:
-            with ZipFile(self.path) as zf:
-                # Security check for zip bombs
-                validate_zip_safety(zf)
-                for name in zf.namelist():
-                    upath = normalize_path(name)
-                    self.__parts[upath] = self._read_zip_entry(zf, name)
+            zf = self._zip_file()
+            for name in zf.namelist():
+                upath = normalize_path(name)
+                self.__parts[upath] = self._read_zip_entry(zf, name)
         except BadZipfile:
             pass
 
-    def _save_zip(self, target: str | Path | io.BytesIO) -> None:
-        """Save a Zip ODF from the available parts."""
+    def _can_copy_raw(self, target: str | Path | io.BytesIO | None) -> bool:
+        """Return True if unchanged parts can be copied from the source archive.
+
+        Requires a Zip ODF file that is not the target of the save.
+        """
+        return (
+            self.__packaging == ZIP
+            and self.path is not None
+            and target is not None
+            and not self._is_source_path(target)
+        )
+
+    def _save_zip(
+        self,
+        target: str | Path | io.BytesIO,
+        compression_level: int | None = None,
+        store_media: bool = False,
+        workers: int = 1,
+        writers: Mapping[str, PartWriter] | None = None,
+    ) -> None:
+        """Save a Zip ODF from the available parts.
+
+        If possible, the parts not modified are copied from the source
+        archive without decompression and recompression.
+        """
+        writers = writers or {}
+        if self._can_copy_raw(target):
+            source_infos = self._zip_infos()
+            with open(self._zip_file().filename, "rb") as source:  # ty: ignore
+                self._write_zip(
+                    target,
+                    source_infos,
+                    source,
+                    compression_level,
+                    store_media,
+                    workers,
+                    writers,
+                )
+        else:
+            self._write_zip(
+                target,
+                {},
+                None,
+                compression_level,
+                store_media,
+                workers,
+                writers,
+            )
+
+    def _zip_part_names(
+        self,
+        source_infos: dict[str, ZipInfo],
+        writers: Mapping[str, PartWriter],
+    ) -> list[str]:
+        """Return the names of the parts to save, in the saving order.
+
+        The mimetype is excluded, it is always saved first.
+        """
         parts = self.__parts
-        with ZipFile(target, "w", compression=ZIP_DEFLATED) as filezip:
-            # Parts to save, except manifest at the end
-            part_names = list(parts.keys())
-            try:
-                part_names.remove(ODF_MANIFEST)
-            except ValueError:
-                printwarn(f"Missing '{ODF_MANIFEST}'")
-            # "Pretty-save" parts in some order
-            # mimetype requires to be first and uncompressed
-            mimetype = parts.get("mimetype")
-            if mimetype is None:
-                raise ValueError("Mimetype is not defined")
-            try:
-                filezip.writestr("mimetype", mimetype, ZIP_STORED)
-                part_names.remove("mimetype")
-            except (
-                ValueError,
-                KeyError,
+        # Parts to save, except manifest at the end
+        part_names = list(parts.keys())
+        part_names.extend(path for path in source_infos if path not in parts)
+        part_names.extend(
+            path for path in writers if path not in parts and path not in source_infos
+        )
+        try:
+            part_names.remove(ODF_MANIFEST)
+        except ValueError:
+            printwarn(f"Missing '{ODF_MANIFEST}'")
+        with contextlib.suppress(ValueError):
+            part_names.remove("mimetype")
+        # "Pretty-save" parts in some order
+        ordered: list[str] = []
+        # XML parts
+        for path in ODF_CONTENT, ODF_META, ODF_SETTINGS, ODF_STYLES:
+            if path not in part_names:
+                printwarn(f"Missing '{path}'")
+                continue
+            part_names.remove(path)
+            ordered.append(path)
+        # Everything else
+        ordered.extend(part_names)
+        if (
+            ODF_MANIFEST in parts
+            or ODF_MANIFEST in source_infos
+            or ODF_MANIFEST in writers
+        ):
+            ordered.append(ODF_MANIFEST)
+        # Deleted parts
+        return [
+            path
+            for path in ordered
+            if path in writers or path not in parts or parts[path] is not None
+        ]
+
+    def _write_zip(
+        self,
+        target: str | Path | io.BytesIO,
+        source_infos: dict[str, ZipInfo],
+        source: BinaryIO | None,
+        compression_level: int | None,
+        store_media: bool,
+        workers: int,
+        writers: Mapping[str, PartWriter],
+    ) -> None:
+        parts = self.__parts
+        modified = self.__modified
+
+        def is_raw(path: str) -> bool:
+            return (
+                source is not None
+                and path in source_infos
+                and path not in modified
+                and path not in writers
+            )
+
+        def compress_type(path: str) -> int:
+            if (
+                store_media
+                and PurePath(path).suffix.lower() in COMPRESSED_MEDIA_SUFFIXES
             ):
-                printwarn("Missing 'mimetype'")
-            # XML parts
-            for path in ODF_CONTENT, ODF_META, ODF_SETTINGS, ODF_STYLES:
-                if path not in parts:
-                    printwarn(f"Missing '{path}'")
-                    continue
-                part = parts[path]
-                if part is None:
-                    continue
-                filezip.writestr(path, part)
-                part_names.remove(path)
-            # Everything else
-            for path in part_names:
-                data = parts[path]
-                if data is None:
-                    # Deleted
-                    continue
-                filezip.writestr(path, data)
-            with contextlib.suppress(KeyError):
-                part = parts[ODF_MANIFEST]
-                if part is not None:
-                    filezip.writestr(ODF_MANIFEST, part)
+                return ZIP_STORED
+            return ZIP_DEFLATED
+
+        # mimetype requires to be first and uncompressed
+        mimetype = parts.get("mimetype")
+        if mimetype is None:
+            raise ValueError("Mimetype is not defined")
+        part_names = self._zip_part_names(source_infos, writers)
+        compressed: dict[str, Future[tuple[ZipInfo, bytes]]] = {}
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            with ZipFile(
+                target,
+                "w",
+                compression=ZIP_DEFLATED,
+                compresslevel=compression_level,
+            ) as filezip:
+                if executor is not None and _can_write_raw(filezip):
+                    # zlib releases the GIL, compress in parallel
+                    for path in part_names:
+                        if not is_raw(path) and path not in writers:
+                            compressed[path] = executor.submit(
+                                _compress_zip_entry,
+                                path,
+                                parts[path],  # ty: ignore[invalid-argument-type]
+                                compress_type(path),
+                                compression_level,
+                            )
+                try:
+                    filezip.writestr("mimetype", mimetype, ZIP_STORED)
+                except (
+                    ValueError,
+                    KeyError,
+                ):
+                    printwarn("Missing 'mimetype'")
+                for path in part_names:
+                    if is_raw(path):
+                        _write_raw_zip_entry(
+                            filezip,
+                            path,
+                            source_infos[path],
+                            source,  # ty: ignore[invalid-argument-type]
+                        )
+                    elif path in compressed:
+                        # written in order, as soon as available
+                        zinfo, data = compressed.pop(path).result()
+                        _write_zip_entry(filezip, zinfo, (data,))
+                    elif path in writers:
+                        # the part is streamed into the Zip member
+                        with filezip.open(path, "w", force_zip64=True) as stream:
+                            writers[path](stream)
+                    else:
+                        filezip.writestr(
+                            path,
+                            parts[path],  # ty: ignore[invalid-argument-type]
+                            compress_type(path),
+                        )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     def _save_folder(self, folder: Path | str) -> None:
         """Save a folder ODF from the available parts."""
@@ -1454,12 +1869,7 @@ class Container:
             # maybe a file like zip archive or xml
             return list(self.__parts.keys())
         if self.__packaging == ZIP:
-            parts = []
-            with ZipFile(self.path) as zf:
-                for name in zf.namelist():
-                    upath = normalize_path(name)
-                    parts.append(upath)
-            return parts
+            return list(self._zip_infos())
         elif self.__packaging == FOLDER:
             return self._get_folder_parts()
         elif self.__packaging == XML:
@@ -1477,6 +1887,36 @@ class Container:
         """
         return self.get_parts()
 
+    def open_part(self, path: str) -> BinaryIO:
+        """Open a part of the ODF Container as a binary stream.
+
+        Unlike get_part(), the part is not loaded in memory: for Zip and
+        folder packaging, its content is read from the file while the stream
+        is consumed. The stream should be closed after use.
+
+        Args:
+            path: path of the required part.
+
+        Returns:
+            A readable binary file-like object.
+
+        Raises:
+            KeyError: If the part is not found in a ZIP or XML container.
+            FileNotFoundError: If the part is not found in a folder container.
+            ValueError: If the part was explicitly deleted from the container.
+        """
+        path = str(path)
+        if path in self.__parts:
+            part = self.get_part(path)
+            return io.BytesIO(part)  # ty: ignore[invalid-argument-type]
+        if self.__packaging == ZIP and self.path is not None:
+            zf = self._zip_file()
+            stream = _ZipPartReader(zf.open(path), path)  # ty: ignore
+            return io.BufferedReader(stream, CHUNK_SIZE)
+        if self.__packaging == FOLDER and self.path is not None:
+            return (self.path / path).open("rb")
+        raise KeyError(path)
+
     def get_part(self, path: str) -> str | bytes | None:
         """Get the actual content of a part of the ODF Container.
 
@@ -1570,6 +2010,7 @@ class Container:
             self.__parts["mimetype"] = mimetype
         else:
             raise TypeError(f'Wrong mimetype "{mimetype!r}"')
+        self.__modified.add("mimetype")
 
     def set_part(self, path: str, data: bytes) -> None:
         """Replace or add a new part.
@@ -1579,6 +2020,7 @@ class Container:
             data: Content of the part.
         """
         self.__parts[path] = data
+        self.__modified.add(path)
 
     def del_part(self, path: str) -> None:
         """Mark a part for deletion.
@@ -1587,6 +2029,7 @@ class Container:
             path: The relative path in the Container.
         """
         self.__parts[path] = None
+        self.__modified.add(path)
 
     @property
     def clone(self) -> Container:
@@ -1652,14 +2095,30 @@ class Container:
                 target = target.split(".folder", 1)[0]
         return target  # ty: ignore
 
+    def _is_source_path(self, target: str | Path | io.BytesIO) -> bool:
+        """Return True if target is the path of the opened Zip ODF file."""
+        if self.path is None or not isinstance(target, (str, Path)):
+            return False
+        try:
+            return Path(target).resolve() == self.path.resolve()
+        except OSError:  # pragma: nocover
+            return False
+
     def _save_as_zip(
         self,
         target: str | Path | io.BytesIO,
         backup: bool,
+        compression_level: int | None = None,
+        store_media: bool = False,
+        workers: int = 1,
+        writers: Mapping[str, PartWriter] | None = None,
     ) -> None:
+        if self._is_source_path(target):
+            # All parts are loaded, release the archive before overwriting it
+            self.close()
         if isinstance(target, (str, Path)) and backup:
             self._do_backup(target)
-        self._save_zip(target)
+        self._save_zip(target, compression_level, store_media, workers, writers)
 
     def _save_as_folder(self, target: str | Path, backup: bool) -> None:
         if not isinstance(target, (str, Path)):
@@ -1699,6 +2158,10 @@ class Container:
         packaging: str | None = None,
         backup: bool = False,
         pretty: bool = False,
+        compression_level: int | None = None,
+        store_media: bool = False,
+        workers: int = 1,
+        writers: Mapping[str, PartWriter] | None = None,
     ) -> None:
         """Save the container to the given target, a path or a file-like
         object.
@@ -1706,6 +2169,9 @@ class Container:
         Package the output document in the same format than current document,
         unless "packaging" is different.
 
+        The compression options only apply to the 'zip' packaging, and to the
+        parts that are not copied unchanged from the source archive.
+
         Args:
             target: The path, file-like object, or Path object where the
                 document will be saved.
@@ -1713,14 +2179,37 @@ class Container:
                 'folder'. If None, the current packaging is used.
             backup: If True, a backup of the original file is created.
             pretty: If True, the XML output will be pretty-printed.
+            compression_level: The zlib compression level, from 0 to 9
+                (1 is the fastest). If None, the zlib default level is used.
+            store_media: If True, already compressed media (images, audio,
+                video, archives) are stored without compression.
+            workers: Number of threads used to compress the parts. If more
+                than 1, the parts are compressed in parallel.
+            writers: Parts to produce while saving, mapping a part path to a
+                function writing the part bytes into a binary stream. With
+                the 'zip' packaging, they are written straight into the Zip
+                member, without building the part bytes in memory. Their
+                content is not kept in the container.
         """
+        if compression_level is not None and not 0 <= compression_level <= 9:
+            msg = f"Compression level must be between 0 and 9: {compression_level!r}"
+            raise ValueError(msg)
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1: {workers!r}")
         parts = self.__parts
         packaging = self._clean_save_packaging(packaging)
-        # Load parts else they will be considered deleted
-        for path in self.parts:
-            if path not in parts:
-                self.get_part(path)
         target = self._clean_save_target(target)
+        if packaging != ZIP or not self._can_copy_raw(target):
+            # Load parts else they will be considered deleted
+            for path in self.parts:
+                if path not in parts and not (writers and path in writers):
+                    self.get_part(path)
+        if writers and packaging != ZIP:
+            for path, writer in writers.items():
+                stream = io.BytesIO()
+                writer(stream)
+                self.set_part(path, stream.getvalue())
+            writers = None
         if packaging == FOLDER:
             if isinstance(target, io.BytesIO):
                 msg = "Impossible to save on io.BytesIO with 'folder' packaging"
@@ -1730,4 +2219,11 @@ class Container:
             self._save_as_xml(target, backup, pretty)
         else:
             # default:
-            self._save_as_zip(target, backup)
+            self._save_as_zip(
+                target,
+                backup,
+                compression_level,
+                store_media,
+                workers,
+                writers,
+            )
@@ -39,10 +39,10 @@ class Content(XmlPart):
 
     def _get_style_contexts(self, family: str | None) -> tuple:
         if family == "font-face":
-            return (self.get_element("//office:font-face-decls"),)
+            return (self._get_root_child("office:font-face-decls"),)
         return (
-            self.get_element("//office:font-face-decls"),
-            self.get_element("//office:automatic-styles"),
+            self._get_root_child("office:font-face-decls"),
+            self._get_root_child("office:automatic-styles"),
         )
 
     def __str__(self) -> str:
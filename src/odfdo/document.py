@@ -28,6 +28,7 @@ from __future__ import annotations
 import contextlib
 import io
 import posixpath
+from collections.abc import Iterable, Iterator
 from contextlib import suppress
 from copy import deepcopy
 from functools import cache
@@ -51,7 +52,7 @@ from .const import (
     XML,
     ZIP,
 )
-from .container import Container
+from .container import CHUNK_SIZE, Container, PartWriter
 from .content import Content
 from .datatype import Boolean
 from .element import Element
@@ -62,6 +63,7 @@ from .mixin_md import MDDocument
 from .settings import Settings
 from .style import Style
 from .style_base import StyleBase
+from .style_index import CONTENT, STYLES, StyleIndex
 from .styles import Styles
 from .table import Table
 from .utils import (
@@ -281,6 +283,8 @@ class Document(MDDocument):
         self.__xmlparts: dict[str, XmlPart] = {}
         # Cache of the body
         self.__body: Element | None = None
+        # Index of the styles, built on first use
+        self.__style_index: StyleIndex | None = None
         self.container: Container | None = None
         if isinstance(target, bytes):
             # eager conversion
@@ -319,6 +323,21 @@ class Document(MDDocument):
         except NotImplementedError:
             return str(self.body)
 
+    def __enter__(self) -> Document:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the file resources held by the document's container.
+
+        The document remains usable: already loaded parts are kept, and the
+        archive is opened again if some other part is required later.
+        """
+        if self.container:
+            self.container.close()
+
     @classmethod
     def new(cls, template: str | Path | io.BytesIO = "text") -> Document:
         """Create a new Document from a template.
@@ -423,6 +442,43 @@ class Document(MDDocument):
             self.__xmlparts[path] = part = cls(path, self.container)
         return part
 
+    def iter_part_chunks(
+        self,
+        path: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Iterate over the bytes of the given part, chunk by chunk.
+
+        The part is read from the document's archive while iterating, so
+        large media can be copied to a file or a socket without loading
+        them in memory. XML parts modified in the document are serialized
+        with their current content.
+
+        Args:
+            path: relative path or one of 'content', 'meta', 'settings',
+                'styles' or 'manifest'.
+            chunk_size: maximum size of the yielded chunks.
+
+        Yields:
+            bytes: the successive chunks of the part.
+        """
+        if not self.container:
+            raise ValueError("Empty Container")
+        path = path.lstrip("./")
+        path = _get_part_path(path)
+        xml_part = self.__xmlparts.get(path)
+        if xml_part is not None and xml_part.is_modified:
+            data = xml_part.serialize()
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+            return
+        with self.container.open_part(path) as stream:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
     def set_part(self, path: str, data: bytes) -> None:
         """Set the bytes of a given part within the document's archive.
 
@@ -801,7 +857,7 @@ class Document(MDDocument):
         """
         clone = object.__new__(self.__class__)
         for name in self.__dict__:
-            if name == "_Document__body":
+            if name in {"_Document__body", "_Document__style_index"}:
                 setattr(clone, name, None)
             elif name == "_Document__xmlparts":
                 setattr(clone, name, {})
@@ -901,6 +957,9 @@ class Document(MDDocument):
         packaging: str = ZIP,
         pretty: bool | None = None,
         backup: bool = False,
+        compression_level: int | None = None,
+        store_media: bool = False,
+        workers: int = 1,
     ) -> None:
         """Save the document to a target path or file-like object.
 
@@ -920,6 +979,14 @@ class Document(MDDocument):
                 it defaults to `True` for 'folder' and 'xml' packaging.
             backup: If `True`, a backup of the existing file will be created
                 before saving.
+            compression_level: For 'zip' packaging, the zlib compression
+                level from 0 to 9 (1 is the fastest). If `None` (default), the
+                zlib default level is used.
+            store_media: For 'zip' packaging, if `True`, already compressed
+                media (images, audio, video, archives) are stored without
+                compression.
+            workers: For 'zip' packaging, the number of threads used to
+                compress the parts in parallel. Defaults to 1.
 
         Raises:
             ValueError: If the document's container is empty or an unsupported
@@ -947,6 +1014,7 @@ class Document(MDDocument):
         if packaging != FOLDER:
             self._ensure_odf14()
             self._check_manifest_rdf()
+        writers: dict[str, PartWriter] = {}
         if pretty and packaging != XML:
             for path, part in self.__xmlparts.items():
                 if part is not None:
@@ -964,10 +1032,23 @@ class Document(MDDocument):
                 self.__xmlparts[path] = part = cls(path, container)
                 container.set_part(path, part.pretty_serialize())
         else:
-            for path, part in self.__xmlparts.items():
-                if part is not None:
-                    container.set_part(path, part.serialize())
-        container.save(target, packaging=packaging, backup=backup, pretty=pretty)
+            # Parts only read keep their original bytes in the container,
+            # modified parts are serialized while written
+            writers = {
+                path: part.write
+                for path, part in self.__xmlparts.items()
+                if part is not None and part.is_modified
+            }
+        container.save(
+            target,
+            packaging=packaging,
+            backup=backup,
+            pretty=pretty,
+            compression_level=compression_level,
+            store_media=store_media,
+            workers=workers,
+            writers=writers,
+        )
 
     @property
     def content(self) -> Content:
@@ -1001,6 +1082,18 @@ class Document(MDDocument):
 
     # Styles over several parts
 
+    def _get_style_index(self) -> StyleIndex:
+        """Return the index of the styles of "content.xml" and "styles.xml",
+        built on first use."""
+        content = self.content
+        styles = self.styles
+        index = self.__style_index
+        if index is None or index.content is not content or index.styles is not styles:
+            index = self.__style_index = StyleIndex(content, styles)
+        else:
+            index.check()
+        return index
+
     def get_styles(
         self,
         family: str | bytes = "",
@@ -1053,17 +1146,25 @@ class Document(MDDocument):
             StyleBase | DrawFillImage | DrawMarker | None: The matching style-like,
                 instance, or `None` if no matching style is found.
         """
-        # 1. content.xml
-        element = self.content.get_style(
-            family, name_or_element=name_or_element, display_name=display_name
-        )
-        if element is not None:
-            return element
-        # 2. styles.xml
-        return self.styles.get_style(
-            family,
-            name_or_element=name_or_element,
-            display_name=display_name,
+        if (
+            isinstance(name_or_element, Element)
+            or family not in FAMILY_MAPPING
+            or (name_or_element and display_name)
+        ):
+            # 1. content.xml
+            element = self.content.get_style(
+                family, name_or_element=name_or_element, display_name=display_name
+            )
+            if element is not None:
+                return element
+            # 2. styles.xml
+            return self.styles.get_style(
+                family,
+                name_or_element=name_or_element,
+                display_name=display_name,
+            )
+        return self._get_style_index().get_style(  # ty: ignore[invalid-return-type]
+            family, name_or_element or None, display_name
         )
 
     def get_parent_style(
@@ -1088,6 +1189,38 @@ class Document(MDDocument):
             return None
         return self.get_style(family, parent_style_name)
 
+    def resolve_style(
+        self,
+        family: str,
+        name: str,
+        area: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the effective properties of a style, including the
+        properties inherited from its parent styles and from the default
+        style of its family.
+
+        The properties of the style override those of its parent, which
+        override those of the default style. The result is cached until the
+        next modification of "content.xml" or "styles.xml", so exporters can
+        resolve the style of each element at the cost of a dict lookup.
+
+        Args:
+            family: The style family (e.g., 'paragraph', 'text', 'table-cell').
+            name: The internal name of the style.
+            area: An optional string specifying a sub-area of properties (e.g.,
+                'paragraph', 'text', 'table-cell'), by default the family.
+
+        Returns:
+            A dictionary of the inherited style properties, or `None` if the
+            style is not found.
+
+        Raises:
+            ValueError: If the family is unknown.
+        """
+        if family not in FAMILY_MAPPING:
+            raise ValueError(f"Unknown family: {family!r}")
+        return self._get_style_index().resolve_properties(family, name, area)
+
     def get_list_style(self, style: StyleBase) -> StyleBase | None:
         """Get the list style associated with a given style.
 
@@ -1114,40 +1247,32 @@ class Document(MDDocument):
         return ""
 
     def _set_automatic_name(self, style: StyleBase, family: str) -> None:
-        """Generate a name for the new automatic style."""
-        try:
-            name = style.name
-        except AttributeError:
+        """Generate a name for the new automatic style.
+
+        The names are allocated by the style index, which reads the existing
+        automatic styles of the family only once.
+        """
+        if not hasattr(style, "name"):
             # do nothing
             return
-        if not name:
-            name = None
-        styles = self.get_styles(family=family, automatic=True)
-        max_index = 0
-        for existing_style in styles:
-            if existing_style is None:
-                continue
-            try:
-                existing_name = existing_style.name
-            except AttributeError:
-                continue
-            if not existing_name or not existing_name.startswith(AUTOMATIC_PREFIX):
-                continue
-            try:
-                index = int(existing_name[len(AUTOMATIC_PREFIX) :])
-            except ValueError:
-                continue
-            max_index = max(max_index, index)
 
-        style.name = f"{AUTOMATIC_PREFIX}{max_index + 1}"
+        def existing_names() -> Iterator[str]:
+            for existing_style in self.get_styles(family=family, automatic=True):
+                name = getattr(existing_style, "name", None)
+                if name:
+                    yield name
+
+        style.name = self._get_style_index().next_automatic_name(
+            AUTOMATIC_PREFIX, family, existing_names
+        )
 
     def _insert_style_get_common_styles(
         self,
         family: str,
         name: str,
     ) -> tuple[Any, Any]:
-        style_container = self.styles.get_element("office:styles")
-        existing = self.styles.get_style(family, name)
+        style_container = self.styles._get_root_child("office:styles")
+        existing = self._get_style_index().get_style(family, name, part=STYLES)
         return existing, style_container
 
     def _insert_style_get_automatic_styles(
@@ -1157,12 +1282,12 @@ class Document(MDDocument):
         name: str,
     ) -> tuple[Any, Any]:
         # fixme: manage forbidden family None (see also v1.4)
-        style_container = self.content.get_element("office:automatic-styles")
+        style_container = self.content._get_root_child("office:automatic-styles")
         # A name ?
         if name:
             with contextlib.suppress(AttributeError):
                 style.name = name
-            existing = self.content.get_style(family, name)
+            existing = self._get_style_index().get_style(family, name, part=CONTENT)
         else:
             self._set_automatic_name(style, family)
             existing = None
@@ -1174,12 +1299,12 @@ class Document(MDDocument):
         family: str,
         name: str,
     ) -> tuple[Any, Any]:
-        style_container = self.styles.get_element("office:styles")
+        style_container = self.styles._get_root_child("office:styles")
         style.tag = "style:default-style"
         if name:
             with contextlib.suppress(KeyError):
                 style.del_attribute("style:name")
-        existing = self.styles.get_style(family)
+        existing = self._get_style_index().get_style(family, part=STYLES)
         return existing, style_container
 
     def _insert_style_get_master_page(
@@ -1187,8 +1312,8 @@ class Document(MDDocument):
         family: str,
         name: str,
     ) -> tuple[Any, Any]:
-        style_container = self.styles.get_element("office:master-styles")
-        existing = self.styles.get_style(family, name)
+        style_container = self.styles._get_root_child("office:master-styles")
+        existing = self._get_style_index().get_style(family, name, part=STYLES)
         return existing, style_container
 
     def _insert_style_get_font_face_default(
@@ -1196,8 +1321,8 @@ class Document(MDDocument):
         family: str,
         name: str,
     ) -> tuple[Any, Any]:
-        style_container = self.styles.get_element("office:font-face-decls")
-        existing = self.styles.get_style(family, name)
+        style_container = self.styles._get_root_child("office:font-face-decls")
+        existing = self._get_style_index().get_style(family, name, part=STYLES)
         return existing, style_container
 
     def _insert_style_get_font_face(
@@ -1205,8 +1330,8 @@ class Document(MDDocument):
         family: str,
         name: str,
     ) -> tuple[Any, Any]:
-        style_container = self.content.get_element("office:font-face-decls")
-        existing = self.content.get_style(family, name)
+        style_container = self.content._get_root_child("office:font-face-decls")
+        existing = self._get_style_index().get_style(family, name, part=CONTENT)
         return existing, style_container
 
     def _insert_style_get_page_layout(
@@ -1215,8 +1340,8 @@ class Document(MDDocument):
         name: str,
     ) -> tuple[Any, Any]:
         # force to automatic
-        style_container = self.styles.get_element("office:automatic-styles")
-        existing = self.styles.get_style(family, name)
+        style_container = self.styles._get_root_child("office:automatic-styles")
+        existing = self._get_style_index().get_style(family, name, part=STYLES)
         return existing, style_container
 
     @staticmethod
@@ -1240,9 +1365,9 @@ class Document(MDDocument):
         if automatic:
             style_container = self.styles.get_element(
                 "office:automatic-styles"
-            ) or self.content.get_element("office:automatic-styles")
+            ) or self.content._get_root_child("office:automatic-styles")
         else:
-            style_container = self.styles.get_element("office:styles")
+            style_container = self.styles._get_root_child("office:styles")
 
         if style_container is None:
             raise ValueError("Target style container not found in document")
@@ -1289,6 +1414,7 @@ class Document(MDDocument):
         name: str = "",
         automatic: bool = False,
         default: bool = False,
+        dedupe: bool = False,
     ) -> Any:
         """Insert the given style object into the document.
 
@@ -1311,9 +1437,14 @@ class Document(MDDocument):
             default: If `True`, the style is inserted as a default style,
                 replacing any existing default style of the same family.
                 `name` and `display_name` are ignored in this case.
+            dedupe: If `True` with `automatic`, the style is not inserted if
+                an automatic style with the same family, attributes and
+                properties already exists (whatever its name), and the name
+                of the existing style is returned.
 
         Returns:
-            The name of the inserted style (str).
+            The name of the inserted style (str), or of the equivalent
+            existing style.
 
         Raises:
             TypeError: If the provided `style` is not a `StyleBase` object or a string.
@@ -1356,6 +1487,12 @@ class Document(MDDocument):
             existing, style_container = self._insert_style_get_page_layout(family, name)
         # Common style with family
         elif family and family in FAMILY_MAPPING:
+            if dedupe and automatic and not default:
+                equivalent = self._get_style_index().find_equivalent(
+                    style_element._xml_element
+                )
+                if equivalent:
+                    return equivalent
             existing, style_container = self._insert_style_standard(
                 style_element,
                 name,
@@ -1376,11 +1513,50 @@ class Document(MDDocument):
             )
 
         # Insert it!
+        index = self._get_style_index()
+        moved = index.is_indexed_tree(style_element._xml_element)
         if existing is not None:
+            index.remove(existing._xml_element)
             style_container.delete(existing)
         style_container.append(style_element)
+        if moved:
+            # the style was taken from another place of the document
+            index.invalidate()
+        else:
+            index.add(style_element._xml_element)
         return name or self._get_style_element_name(style_element)
 
+    def insert_styles(
+        self,
+        styles: Iterable[StyleBase | str],
+        automatic: bool = False,
+        default: bool = False,
+        dedupe: bool = False,
+    ) -> list[str]:
+        """Insert several styles into the document, see `insert_style()`.
+
+        The names of the automatic styles are allocated by a counter of the
+        document, so inserting many styles takes a time proportional to
+        their number.
+
+        Args:
+            styles: The `StyleBase` objects to insert, or strings representing
+                XML style definitions.
+            automatic: If `True`, the styles are inserted as automatic styles.
+            default: If `True`, the styles are inserted as default styles.
+            dedupe: If `True` with `automatic`, reuse the existing equivalent
+                automatic styles.
+
+        Returns:
+            The names of the inserted styles, in the order of insertion.
+        """
+        return [
+            self.insert_style(
+                style, automatic=automatic, default=default, dedupe=dedupe
+            )
+            for style in styles
+        ]
+
     def get_styled_elements(self, name: str = "") -> list[Element]:
         """Search for elements (paragraphs, tables, etc.) using a given style name.
 
@@ -1523,8 +1699,24 @@ class Document(MDDocument):
             #    continue
             style.delete()
             deleted += 1
+        self._get_style_index().invalidate()
         return deleted
 
+    def dedupe_automatic_styles(self) -> int:
+        """Merge the equivalent automatic styles of the document.
+
+        Automatic styles with the same tag, attributes and content (like the
+        styles created for each cell of a generated spreadsheet) are
+        replaced by the first one of them, and the references to the
+        removed styles are rewritten in one walk of the XML tree of their
+        part. Styles whose name is also used by another style of the
+        document, in any family, are kept.
+
+        Returns:
+            The number of removed styles.
+        """
+        return self._get_style_index().dedupe_automatic_styles()
+
     def _copy_image_from_document(self, document: Document, url: str) -> None:
         """Copy image from another document.
 
@@ -1549,6 +1741,7 @@ class Document(MDDocument):
         Args:
             document: The source `Document` object from which to merge styles.
         """
+        index = self._get_style_index()
         for style in document.get_styles():
             tagname = style.tag
             family = style.family
@@ -1577,16 +1770,25 @@ class Document(MDDocument):
                 "office:font-face-decls",
             }:
                 raise NotImplementedError(container_name)
-            dest = part.get_element(f"//{container_name}")
+            dest = part._get_root_child(container_name)
             if not dest:
                 continue
             # Implemented style types
             # if tagname not in registered_styles:
             #    raise NotImplementedError(tagname)
-            duplicate = part.get_style(family, stylename)
+            if family in FAMILY_MAPPING:
+                duplicate = index.get_style(
+                    family,
+                    stylename,
+                    part=STYLES if part is self.styles else CONTENT,
+                )
+            else:
+                duplicate = part.get_style(family, stylename)
             if duplicate is not None:
+                index.remove(duplicate._xml_element)
                 duplicate.delete()
             dest.append(style)
+            index.add(style._xml_element)
             # Copy images from the header/footer
             if tagname == "style:master-page":
                 images = cast(
@@ -1657,7 +1859,8 @@ class Document(MDDocument):
 
         Properties are retrieved from the cell's own style, or from its row's
         style, or from its column's default cell style, in that order of
-        precedence.
+        precedence. The properties inherited from the parent styles and the
+        default style of the family are included, see `resolve_style()`.
 
         Args:
             table: The name (str) or index (int) of the table.
@@ -1673,22 +1876,16 @@ class Document(MDDocument):
             return {}
         cell = sheet.get_cell(coord, clone=False)
         if cell.style:
-            return (
-                self.get_style_properties("table-cell", cell.style, "table-cell") or {}
-            )
+            return self.resolve_style("table-cell", cell.style, "table-cell") or {}
         try:
             row = sheet.get_row(cell.y, clone=False, create=False)  # ty: ignore
             if row.style:  # noqa: SIM102
-                if props := self.get_style_properties(
-                    "table-row", row.style, "table-cell"
-                ):
+                if props := self.resolve_style("table-row", row.style, "table-cell"):
                     return props
             column = sheet.get_column(cell.x)  # ty: ignore
             style = column.default_cell_style
             if style:  # noqa: SIM102
-                if props := self.get_style_properties(
-                    "table-cell", style, "table-cell"
-                ):
+                if props := self.resolve_style("table-cell", style, "table-cell"):
                     return props
         except ValueError:
             pass
@@ -1769,14 +1966,14 @@ class Document(MDDocument):
         Returns:
             A unique style name string.
         """
-        current = {style.name for style in self.get_styles() if hasattr(style, "name")}
-        idx = 0
-        while True:
-            name = f"{base}_{idx}"
-            if name in current:
-                idx += 1
-                continue
-            return name
+
+        def existing_names() -> Iterator[str]:
+            for style in self.get_styles():
+                name = getattr(style, "name", None)
+                if name:
+                    yield name
+
+        return self._get_style_index().unique_name(base, existing_names)
 
     def set_table_displayed(self, table: str | int, displayed: bool) -> None:
         """Set the `table:display` property of the table's style.
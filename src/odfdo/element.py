@@ -26,17 +26,23 @@ from __future__ import annotations
 
 import contextlib
 import re
+import threading
 from collections.abc import Callable, Iterable
 from copy import deepcopy
 from datetime import datetime, timedelta
 from decimal import Decimal
-from functools import cache
+from functools import lru_cache
+from itertools import islice
 from re import search
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from weakref import WeakValueDictionary
 from xml.etree.ElementTree import canonicalize
 
 from lxml.etree import Element as lxml_Element  # ty: ignore[unresolved-import]
 from lxml.etree import (  # ty: ignore[unresolved-import]
+    ElementBase,
+    ElementNamespaceClassLookup,
+    XMLParser,
     XPath,
     _Element,
     fromstring,
@@ -62,6 +68,8 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from functools import _CacheInfo
+
     from .body import Body
     from .draw_page import DrawPage
     from .frame import Frame
@@ -149,6 +157,8 @@ def _generate_odf_namespaces() -> dict[str, str]:
 
 
 ODF_NAMESPACES = _generate_odf_namespaces()
+# first prefix declared for each URI
+_ODF_PREFIXES = {uri: prefix for prefix, uri in reversed(ODF_NAMESPACES.items())}
 FIRST_CHILD = 0
 LAST_CHILD = 1
 NEXT_SIBLING = 2
@@ -219,12 +229,18 @@ def _uri_to_prefix(uri: str) -> str:
     Raises:
         ValueError: If the URI is not found in the known ODF namespaces.
     """
-    for key, value in ODF_NAMESPACES.items():
-        if value == uri:
-            return key
-    raise ValueError(f"uri {uri!r} not found")
+    try:
+        return _ODF_PREFIXES[uri]
+    except KeyError as e:
+        raise ValueError(f"uri {uri!r} not found") from e
 
 
+# Maximum number of names kept in the caches of tag conversions, the names
+# can come from the user or from the parsed documents
+TAG_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
 def _get_prefixed_name(tag: str) -> str:
     """Convert an lxml-style tag name (e.g., "{uri}name") to a prefixed name (e.g., "prefix:name").
 
@@ -241,6 +257,7 @@ def _get_prefixed_name(tag: str) -> str:
     return f"{prefix}:{name}"
 
 
+@lru_cache(maxsize=TAG_CACHE_SIZE)
 def _get_lxml_tag(qname: str) -> str:
     """Convert a prefixed qualified name (e.g., "prefix:name") to an lxml-style tag name (e.g., "{uri}name").
 
@@ -254,6 +271,7 @@ def _get_lxml_tag(qname: str) -> str:
     return f"{{{uri}}}{name}"
 
 
+@lru_cache(maxsize=TAG_CACHE_SIZE)
 def _get_lxml_tag_or_name(qname: str) -> str:
     """Convert a prefixed qualified name to an lxml-style tag name or just the local name.
 
@@ -290,13 +308,24 @@ def _family_style_tagname(family: str) -> str:
         raise ValueError(f"Unknown family: {family!r}") from e
 
 
-@cache
+# Default maximum number of compiled XPath queries kept in cache
+XPATH_CACHE_SIZE = 1024
+
+
+def _xpath_compile(path: str) -> XPath:
+    return XPath(path, namespaces=ODF_NAMESPACES, regexp=False)
+
+
+_xpath_compile_cached = lru_cache(maxsize=XPATH_CACHE_SIZE)(_xpath_compile)
+
+
 def xpath_compile(path: str) -> XPath:
     """Compile an XPath query string into an `lxml.etree.XPath` object.
 
     This function pre-compiles XPath expressions for efficiency and
-    automatically includes ODF namespaces. It is cached to avoid recompiling
-    the same XPath query multiple times.
+    automatically includes ODF namespaces. The compiled queries are kept in
+    a bounded LRU cache to avoid recompiling the same XPath query multiple
+    times, see `set_xpath_cache_size()`.
 
     Args:
         path: The XPath query string.
@@ -304,10 +333,36 @@ def xpath_compile(path: str) -> XPath:
     Returns:
         XPath: A compiled `lxml.etree.XPath` object.
     """
-    return XPath(path, namespaces=ODF_NAMESPACES, regexp=False)
+    return _xpath_compile_cached(path)
+
+
+def set_xpath_cache_size(maxsize: int | None = XPATH_CACHE_SIZE) -> None:
+    """Set the maximum number of compiled XPath queries kept in cache.
+
+    The current cache is emptied.
+
+    Args:
+        maxsize: The maximum number of queries, or None for an unbounded
+            cache.
+    """
+    global _xpath_compile_cached
+    _xpath_compile_cached = lru_cache(maxsize=maxsize)(_xpath_compile)
+
+
+def xpath_cache_info() -> _CacheInfo:
+    """Return the statistics of the cache of compiled XPath queries.
+
+    Returns:
+        _CacheInfo: A named tuple (hits, misses, maxsize, currsize).
+    """
+    return _xpath_compile_cached.cache_info()
 
 
-def xpath_return_elements(xpath: XPath, target: _Element) -> list[_Element]:
+def xpath_return_elements(
+    xpath: XPath,
+    target: _Element,
+    variables: dict[str, Any] | None = None,
+) -> list[_Element]:
     """Execute a compiled XPath query and return a list of matching lxml elements.
 
     This function filters the raw XPath results to ensure only `lxml.etree._Element`
@@ -316,11 +371,12 @@ def xpath_return_elements(xpath: XPath, target: _Element) -> list[_Element]:
     Args:
         xpath: A compiled `lxml.etree.XPath` object.
         target: The lxml element on which to apply the XPath query.
+        variables: Optional values of the XPath variables of the query.
 
     Returns:
         list[_Element]: A list of matching `lxml.etree._Element` objects.
     """
-    elements = xpath(target)
+    elements = xpath(target, **variables) if variables else xpath(target)
     try:
         return [e for e in elements if isinstance(e, _Element)]
     except TypeError as e:  # pragma: nocover
@@ -358,10 +414,273 @@ _xpath_text_descendant_no_annotation = xpath_compile(
     "descendant::text()[not (parent::office:annotation)]"
 )
 
+# Mutation counters of the XML trees loaded by XmlPart instances, keyed by
+# the lxml root element of the tree.
+_tree_mutations: dict[_Element, int] = {}
+# Mutation counters of the style containers of the same trees, counting the
+# modifications of the root, of the containers and of their children
+_tree_style_mutations: dict[_Element, int] = {}
+_STYLE_CONTAINER_TAGS = {
+    _get_lxml_tag(tag)
+    for tag in (
+        "office:font-face-decls",
+        "office:styles",
+        "office:automatic-styles",
+        "office:master-styles",
+    )
+}
+# Mutation counter of all the XML trees, registered or not
+_mutation_epoch = 0
+# Last node counted by _touch_tree(), with the registered root of its tree
+# (or None), whether its mutations are style mutations, and the mutation
+# counter after it. It is reused while no other mutation is counted: the
+# methods moving an element count the mutation of its new parent last.
+_last_touched: tuple[_Element, _Element | None, bool, int] | None = None
+
+
+def _forget_touched() -> None:
+    """Forget the last node counted by _touch_tree(), after a change of its
+    tag or of its tree not counted as a mutation."""
+    global _last_touched
+    _last_touched = None
+
+
+def _register_tree(root: _Element) -> None:
+    """Start counting the mutations of the XML tree of the given root.
+
+    Args:
+        root: The lxml root element of the tree.
+    """
+    _forget_touched()
+    _tree_mutations.setdefault(root, 0)
+    _tree_style_mutations.setdefault(root, 0)
+
+
+def _unregister_tree(root: _Element) -> None:
+    """Stop counting the mutations of the XML tree of the given root.
+
+    Args:
+        root: The lxml root element of the tree.
+    """
+    _forget_touched()
+    _tree_mutations.pop(root, None)
+    _tree_style_mutations.pop(root, None)
+
+
+def _tree_mutation_count(root: _Element) -> int:
+    """Return the number of mutations counted for the tree of the given root.
+
+    Args:
+        root: The lxml root element of the tree.
+
+    Returns:
+        int: The mutation counter, 0 if the tree is not registered.
+    """
+    return _tree_mutations.get(root, 0)
+
+
+def _tree_style_mutation_count(root: _Element) -> int:
+    """Return the number of mutations counted for the style containers of
+    the tree of the given root.
+
+    The modifications of the root, of the style containers (like
+    "office:automatic-styles") and of their children (like the name of a
+    style) are counted, not the modifications inside the styles.
+
+    Args:
+        root: The lxml root element of the tree.
+
+    Returns:
+        int: The mutation counter, 0 if the tree is not registered.
+    """
+    return _tree_style_mutations.get(root, 0)
+
+
+def _tree_mutation_stamp(node: _Element) -> tuple[_Element | None, int]:
+    """Return a stamp that changes when the XML tree containing the node is
+    modified.
+
+    For a tree not registered, like a table not yet inserted in a document,
+    the stamp changes when any XML tree is modified.
+
+    Args:
+        node: An lxml element of the tree.
+
+    Returns:
+        tuple[_Element | None, int]: The registered root of the tree, or
+            None, and the mutation counter.
+    """
+    root = node.getroottree().getroot()
+    count = _tree_mutations.get(root)
+    if count is None:
+        return None, _mutation_epoch
+    return root, count
+
+
+def _touch_tree(node: _Element) -> None:
+    """Count a mutation of the registered XML tree containing the node.
+
+    Args:
+        node: The lxml element being modified.
+    """
+    global _mutation_epoch, _last_touched
+    epoch = _mutation_epoch
+    _mutation_epoch = epoch + 1
+    if not _tree_mutations:
+        return
+    last = _last_touched
+    if last is not None and last[0] is node and last[3] == epoch:
+        # same node as the previous mutation, the tree is unchanged
+        root, is_style = last[1], last[2]
+    else:
+        root = node.getroottree().getroot()
+        is_style = False
+        if root not in _tree_mutations:
+            root = None
+        elif node.tag in _STYLE_CONTAINER_TAGS:
+            is_style = True
+        else:
+            parent = node.getparent()
+            is_style = parent is None or parent.tag in _STYLE_CONTAINER_TAGS
+    _last_touched = (node, root, is_style, epoch + 1)
+    if root is not None:
+        _tree_mutations[root] += 1
+        if is_style:
+            _tree_style_mutations[root] += 1
+
+
+# Python wrappers of the lxml elements, when the cache is enabled
+_wrapper_cache: WeakValueDictionary[_Element, Element] | None = None
+
+
+def enable_wrapper_cache(enabled: bool = True) -> None:
+    """Enable or disable the cache of the Element wrappers.
+
+    When enabled, `Element.from_tag()` returns the same Python wrapper for an
+    XML node as long as the wrapper is referenced, with the caches it already
+    computed (like the row and cell indexes of a `Table`). Navigating a large
+    document then allocates far fewer objects.
+
+    The cache is disabled by default: a cached wrapper does not see
+    modifications of its XML node done through another wrapper that would
+    invalidate its own computed caches.
+
+    Args:
+        enabled: True to enable the cache, False to disable and empty it.
+    """
+    global _wrapper_cache
+    if not enabled:
+        _wrapper_cache = None
+    elif _wrapper_cache is None:
+        _wrapper_cache = WeakValueDictionary()
+
+
+def wrapper_cache_enabled() -> bool:
+    """Return True if the cache of the Element wrappers is enabled.
+
+    Returns:
+        bool: the state of the cache.
+    """
+    return _wrapper_cache is not None
+
+
 _class_registry: dict[str, type[Element]] = {}
 _tag_class_registry: dict[str, type[Element]] = {}
 
 
+class _OdfElementBase(ElementBase):
+    """Base of the lxml classes of the elements with a registered tag, when
+    the class lookup is enabled (internal).
+
+    The lxml class of an element gives the Python class registered for its
+    tag, so Element.from_tag() does not read the tag of the element.
+    """
+
+    _odf_class: type[Element]
+
+
+# lxml classes of the registered tags, by Python class
+_lxml_classes: dict[type[Element], type[_OdfElementBase]] = {}
+# Lookup of the lxml classes by tag, built on first use
+_class_lookup: ElementNamespaceClassLookup | None = None
+_class_lookup_enabled = False
+# Parser using the class lookup, one per thread
+_thread_parsers = threading.local()
+
+
+def _add_lxml_class(
+    lookup: ElementNamespaceClassLookup, tag: str, cls: type[Element]
+) -> None:
+    """Attach the lxml class of a Python class to an lxml tag."""
+    lxml_class = _lxml_classes.get(cls)
+    if lxml_class is None:
+        lxml_class = type(
+            f"_Lxml{cls.__name__}", (_OdfElementBase,), {"_odf_class": cls}
+        )
+        _lxml_classes[cls] = lxml_class
+    if tag.startswith("{"):
+        uri, name = tag[1:].split("}", 1)
+        lookup.get_namespace(uri)[name] = lxml_class
+    else:
+        lookup.get_namespace(None)[tag] = lxml_class
+
+
+def enable_class_lookup(enabled: bool = True) -> None:
+    """Enable or disable the lxml class lookup of the ODF elements.
+
+    When enabled, the XML parts are parsed with an lxml parser attaching an
+    `lxml.etree.ElementBase` subclass to the elements whose tag has a
+    registered Python class (`Paragraph`, `Table`, `Cell`...), with an
+    `lxml.etree.ElementNamespaceClassLookup`. `Element.from_tag()` then finds
+    the Python class of an element from its lxml class, without building
+    the tag string of the element and looking it up in the registry of
+    classes.
+
+    The lookup applies to the XML parts loaded and the elements created
+    while it is enabled. It is disabled by default. The Python wrappers of
+    the elements, which keep their own state like the caches of a `Table`,
+    are still created by `Element.from_tag()`, see `enable_wrapper_cache()`
+    to reuse them.
+
+    Args:
+        enabled: True to enable the lookup, False to disable it.
+    """
+    global _class_lookup, _class_lookup_enabled
+    if enabled and _class_lookup is None:
+        # the other elements keep the default lxml class
+        lookup = ElementNamespaceClassLookup()
+        for tag, cls in _class_registry.items():
+            _add_lxml_class(lookup, tag, cls)
+        _class_lookup = lookup
+    _class_lookup_enabled = enabled
+
+
+def class_lookup_enabled() -> bool:
+    """Return True if the lxml class lookup of the ODF elements is enabled.
+
+    Returns:
+        bool: the state of the lookup.
+    """
+    return _class_lookup_enabled
+
+
+def _xml_parser() -> XMLParser | None:
+    """Return the parser of the XML content, None for the default parser of
+    lxml.
+
+    Returns:
+        XMLParser | None: The parser using the class lookup, if enabled.
+    """
+    if not _class_lookup_enabled:
+        return None
+    parser = getattr(_thread_parsers, "parser", None)
+    if parser is None:
+        parser = XMLParser()
+        parser.set_element_class_lookup(_class_lookup)
+        _thread_parsers.parser = parser
+    return parser
+
+
 def register_element_class(cls: type[Element]) -> None:
     """(internal function) Associate a qualified element name to a Python class
     that handles this type of element.
@@ -405,6 +724,8 @@ def _register_element_class(cls: type[Element], qname: str) -> None:
         msg = f"Class with tag {qname!r} already seen: {_class_registry[tag]!r}"
         raise RuntimeError(msg)
     _class_registry[tag] = cls
+    if _class_lookup is not None:
+        _add_lxml_class(_class_lookup, tag, cls)
     if qname in _tag_class_registry:  # pragma: nocover
         msg = f"Class with tag {qname!r} already seen: {_tag_class_registry[qname]!r}"
         raise RuntimeError(msg)
@@ -521,6 +842,8 @@ class Element(MDBase):
             self._do_init = True
             tag = kwargs.pop("tag", self._tag)
             self.__element = self._make_etree_element(tag)
+            if _wrapper_cache is not None:
+                _wrapper_cache[self.__element] = self
         else:
             # called with an existing lxml element, sould be a result of
             # from_tag() casting, do not execute the subclass __init__
@@ -551,8 +874,18 @@ class Element(MDBase):
             elem = cls._make_etree_element(tag_or_elem)
         else:
             elem = tag_or_elem
-        klass = _class_registry.get(elem.tag, cls)
-        return klass(tag_or_elem=elem)
+        if _class_lookup_enabled and isinstance(elem, _OdfElementBase):
+            # class found by lxml when the element was parsed or created
+            klass = elem._odf_class
+        else:
+            klass = _class_registry.get(elem.tag, cls)
+        if _wrapper_cache is None:
+            return klass(tag_or_elem=elem)
+        element = _wrapper_cache.get(elem)
+        if element is None or element.__class__ is not klass:
+            element = klass(tag_or_elem=elem)
+            _wrapper_cache[elem] = element
+        return element
 
     @classmethod
     def from_tag_for_clone(
@@ -574,7 +907,14 @@ class Element(MDBase):
         """
         tag = to_str(tree_element.tag)
         klass = _class_registry.get(tag, cls)
-        element: Element = klass(tag_or_elem=tree_element)
+        element: Element | None = None
+        if _wrapper_cache is not None:
+            element = _wrapper_cache.get(tree_element)
+            if element is None or element.__class__ is not klass:
+                element = klass(tag_or_elem=tree_element)
+                _wrapper_cache[tree_element] = element
+        else:
+            element = klass(tag_or_elem=tree_element)
         if cache:
             element._copy_cache(cache)
         return element
@@ -589,6 +929,17 @@ class Element(MDBase):
         """
         pass
 
+    def _get_cache(self) -> tuple | None:
+        """Returns the cache data to be copied to the elements found under
+        the element.
+
+        This method is intended to be redefined by subclasses that utilize caching.
+
+        Returns:
+            tuple | None: The cache data, or None.
+        """
+        return None
+
     @staticmethod
     def _make_etree_element(tag: str) -> _Element:
         """Create an lxml Element from an ODF tag string.
@@ -614,7 +965,7 @@ class Element(MDBase):
             # repeated namespace declarations
             tag = f"<{tag}/>"
         # XML fragment
-        root = fromstring(NAMESPACES_XML % str_to_bytes(tag))
+        root = fromstring(NAMESPACES_XML % str_to_bytes(tag), _xml_parser())
         return root[0]
 
     def _base_attrib_getter(self, attr_name: str) -> str | None:
@@ -643,6 +994,7 @@ class Element(MDBase):
             value: The value to set for the attribute. If None, the attribute
                 is removed. Boolean values are encoded.
         """
+        _touch_tree(self.__element)
         if value is None:
             with contextlib.suppress(KeyError):
                 del self.__element.attrib[_get_lxml_tag(attr_name)]
@@ -956,6 +1308,8 @@ class Element(MDBase):
         """
         current = self.__element
         xelement = element.__element
+        _touch_tree(xelement)
+        _touch_tree(current)
 
         # 1) before xor after is not None
         if (before is not None) ^ (after is not None):
@@ -1017,7 +1371,9 @@ class Element(MDBase):
         Args:
             qname: The new qualified name for the XML tag (e.g., "text:span").
         """
+        _touch_tree(self.__element)
         self.__element.tag = _get_lxml_tag(qname)
+        _forget_touched()
 
     def elements_repeated_sequence(
         self,
@@ -1056,20 +1412,25 @@ class Element(MDBase):
             result.append((idx, max(int_value, 1)))
         return result
 
-    def get_elements(self, xpath_query: XPath | str) -> list[Element]:
+    def get_elements(
+        self,
+        xpath_query: XPath | str,
+        variables: dict[str, Any] | None = None,
+    ) -> list[Element]:
         """Returns a list of elements obtained by applying an XPath query.
 
         Args:
             xpath_query: The XPath query string or a compiled `lxml.etree.XPath` object.
+            variables: Optional values of the XPath variables of the query.
 
         Returns:
             list[Element]: A list of Element instances matching the query.
         """
         if isinstance(xpath_query, str):
-            elements = xpath_return_elements(xpath_compile(xpath_query), self.__element)
-        else:
-            elements = xpath_return_elements(xpath_query, self.__element)
-        return [Element.from_tag_for_clone(e, None) for e in elements]
+            xpath_query = xpath_compile(xpath_query)
+        elements = xpath_return_elements(xpath_query, self.__element, variables)
+        cache = self._get_cache()
+        return [Element.from_tag_for_clone(e, cache) for e in elements]
 
     def get_element(self, xpath_query: str) -> Element | None:
         """Returns the first element obtained by applying an XPath query.
@@ -1240,6 +1601,7 @@ class Element(MDBase):
                 matches this default, the attribute is removed.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if value is None:
             value = False
@@ -1280,6 +1642,7 @@ class Element(MDBase):
             value: The string value to set for the attribute.
         """
         lxml_tag = _get_lxml_tag_or_name(name)
+        _touch_tree(self.__element)
         self.__element.set(lxml_tag, value)
 
     def _set_attribute_str_default(
@@ -1295,6 +1658,7 @@ class Element(MDBase):
                 matches this default, the attribute is removed.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if value is None or value == default:
             with contextlib.suppress(KeyError):
@@ -1332,6 +1696,7 @@ class Element(MDBase):
                 removed.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if value is None:
             with contextlib.suppress(KeyError):
@@ -1352,6 +1717,7 @@ class Element(MDBase):
                 matches this default, the attribute is removed.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if value is None or value == default:
             with contextlib.suppress(KeyError):
@@ -1376,6 +1742,7 @@ class Element(MDBase):
                 If the `value` to set matches this default, the attribute is removed.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if value is None or value == default:
             with contextlib.suppress(KeyError):
@@ -1405,6 +1772,7 @@ class Element(MDBase):
             if value != "transparent":
                 value = hexa_color(value)
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         if isinstance(value, bool):
             value = Boolean.encode(value)
@@ -1436,6 +1804,7 @@ class Element(MDBase):
             KeyError: If the specified attribute does not exist.
         """
         element = self.__element
+        _touch_tree(element)
         lxml_tag = _get_lxml_tag_or_name(name)
         del element.attrib[lxml_tag]
 
@@ -1445,6 +1814,7 @@ class Element(MDBase):
         Args:
             names: The qualified names of the attributes to delete.
         """
+        _touch_tree(self.__element)
         for name in names:
             with contextlib.suppress(KeyError):
                 del self.__element.attrib[_get_lxml_tag_or_name(name)]
@@ -1470,6 +1840,7 @@ class Element(MDBase):
         """
         if text is None:
             text = ""
+        _touch_tree(self.__element)
         try:
             self.__element.text = text
         except TypeError as e:
@@ -1526,6 +1897,7 @@ class Element(MDBase):
         Args:
             text: The new tail text. If None, it is set to an empty string.
         """
+        _touch_tree(self.__element)
         self.__element.tail = text or ""
 
     def search(self, pattern: str) -> int | None:
@@ -1778,6 +2150,7 @@ class Element(MDBase):
             # As "text_content" returned all text nodes, "text_content"
             # will overwrite all text nodes and children that may contain them
             element = paragraph.__element
+            _touch_tree(element)
             # Clear but the attributes
             del element[:]
             element.text = str(text)
@@ -1831,6 +2204,8 @@ class Element(MDBase):
         # child_tag = element.tag
         current = self.__element
         lx_element = element.__element
+        _touch_tree(lx_element)
+        _touch_tree(current)
         if start:
             text = current.text
             if text is not None:
@@ -1870,6 +2245,9 @@ class Element(MDBase):
         if odf_elements:
             current = self.__element
             elements = [element.__element for element in odf_elements]
+            for element in elements:
+                _touch_tree(element)
+            _touch_tree(current)
             current.extend(elements)
 
     def _xml_append(self, element: Element) -> None:
@@ -1878,6 +2256,8 @@ class Element(MDBase):
         Args:
             element: The Element instance whose underlying XML element will be appended.
         """
+        _touch_tree(element.__element)
+        _touch_tree(self.__element)
         self.__element.append(element.__element)
 
     @property
@@ -1910,6 +2290,9 @@ class Element(MDBase):
             return _re_anyspace.sub(" ", (text1 or "") + (text2 or ""))
 
         current = self.__element
+        if isinstance(str_or_element, Element):
+            _touch_tree(str_or_element.__element)
+        _touch_tree(current)
         if isinstance(str_or_element, str):
             # Has children ?
             children = list(current.iterchildren())
@@ -1949,6 +2332,7 @@ class Element(MDBase):
             child = self
         else:
             parent = self
+        _touch_tree(parent.__element)
         if keep_tail and child.__element.tail is not None:
             current = child.__element
             tail = str(current.tail)
@@ -1977,6 +2361,8 @@ class Element(MDBase):
             new_element: The new element to insert in place of `old_element`.
         """
         current = self.__element
+        _touch_tree(new_element.__element)
+        _touch_tree(current)
         current.replace(old_element.__element, new_element.__element)
 
     def xpath(self, xpath_query: str) -> list[Element | EText]:
@@ -2001,6 +2387,7 @@ class Element(MDBase):
 
     def clear(self) -> None:
         """Removes all text content, child elements, and attributes from the element."""
+        _touch_tree(self.__element)
         self.__element.clear()
 
     @property
@@ -3059,27 +3446,113 @@ class Element(MDBase):
         self,
         query_string: str,
         position: int,
+        content: str | None = None,
+        url: str | None = None,
+        svg_title: str | None = None,
+        svg_desc: str | None = None,
+        dc_creator: str | None = None,
+        dc_date: datetime | None = None,
         **kwargs: Any,
     ) -> Element | None:
         """Returns a single filtered element at a specific position.
 
+        Without regex filters, the position is part of the XPath query and
+        only the found element is wrapped. Otherwise the elements are
+        filtered one at a time, up to the requested one.
+
         Args:
             query_string: The XPath query string to apply.
             position: The 0-based index of the desired element from the filtered
                 results.
-            **kwargs: Additional keyword arguments to pass to `_filtered_elements`
-                for filtering criteria.
+            content: A regex pattern to match against the element's text content.
+            url: A regex pattern to match against the `xlink:href` attribute.
+            svg_title: A regex pattern to match against an inner `svg:title` element.
+            svg_desc: A regex pattern to match against an inner `svg:desc` element.
+            dc_creator: A regex pattern to match against an inner `dc:creator` element.
+            dc_date: A datetime object to match against an inner `dc:date` element.
+            **kwargs: Additional keyword arguments representing attribute filters,
+                see `_filtered_elements`.
 
         Returns:
             Element | None: The Element instance at the specified position, or None
                 if not found.
         """
-        results = self._filtered_elements(query_string, **kwargs)
+        variables: dict[str, str] = {}
+        if (
+            content is None
+            and url is None
+            and not (svg_title or svg_desc or dc_creator or dc_date)
+        ):
+            query = make_xpath_query(
+                query_string, position=position, variables=variables, **kwargs
+            )
+            results = self.get_elements(query, variables)
+            if results:
+                return results[0]
+            return None
+        query = make_xpath_query(query_string, variables=variables, **kwargs)
+        xpath_query = xpath_compile(query)
+        dt_dc_date = None if dc_date is None else DateTime.encode(dc_date)
+        cache = self._get_cache()
+        matches = (
+            element
+            for element in (
+                Element.from_tag_for_clone(e, cache)
+                for e in xpath_return_elements(xpath_query, self.__element, variables)
+            )
+            if element._match_filters(
+                content, url, svg_title, svg_desc, dc_creator, dt_dc_date
+            )
+        )
+        if position >= 0:
+            return next(islice(matches, position, None), None)
+        results = list(matches)
         try:
             return results[position]
         except IndexError:
             return None
 
+    def _match_filters(
+        self,
+        content: str | None,
+        url: str | None,
+        svg_title: str | None,
+        svg_desc: str | None,
+        dc_creator: str | None,
+        dc_date: str | None,
+    ) -> bool:
+        """Returns True if the element matches all the regex filters.
+
+        Args:
+            content: A regex pattern to match against the element's text content.
+            url: A regex pattern to match against the `xlink:href` attribute.
+            svg_title: A regex pattern to match against an inner `svg:title` element.
+            svg_desc: A regex pattern to match against an inner `svg:desc` element.
+            dc_creator: A regex pattern to match against an inner `dc:creator` element.
+            dc_date: An encoded date to match against an inner `dc:date` element.
+
+        Returns:
+            bool: True if the element matches.
+        """
+        if content is not None and not self.match(content):
+            return False
+        if url is not None:
+            url_attr = self.get_attribute("xlink:href")
+            if not isinstance(url_attr, str) or search(url, url_attr) is None:
+                return False
+        for variable, childname in [
+            (svg_title, "svg:title"),
+            (svg_desc, "svg:desc"),
+            (dc_creator, "descendant::dc:creator"),
+            (dc_date, "descendant::dc:date"),
+        ]:
+            if not variable:
+                continue
+            child = self.get_element(childname)
+            if not (child and child.match(variable)):
+                return False
+        return True
+
     def _filtered_elements(
         self,
         query_string: str,
@@ -3111,34 +3584,21 @@ class Element(MDBase):
         Returns:
             list[Element]: A list of Element instances that match all specified criteria.
         """
-        query = make_xpath_query(query_string, **kwargs)
-        elements = self.get_elements(query)
+        variables: dict[str, str] = {}
+        query = make_xpath_query(query_string, variables=variables, **kwargs)
+        elements = self.get_elements(query, variables)
         # Filter the elements with the regex (TODO use XPath)
-        if content is not None:
-            elements = [element for element in elements if element.match(content)]
-        if url is not None:
-            filtered = []
-            for element in elements:
-                url_attr = element.get_attribute("xlink:href")
-                if isinstance(url_attr, str) and search(url, url_attr) is not None:
-                    filtered.append(element)
-            elements = filtered
-        if dc_date is None:
-            dt_dc_date = None
-        else:
-            dt_dc_date = DateTime.encode(dc_date)
-        for variable, childname in [
-            (svg_title, "svg:title"),
-            (svg_desc, "svg:desc"),
-            (dc_creator, "descendant::dc:creator"),
-            (dt_dc_date, "descendant::dc:date"),
-        ]:
-            if not variable:
-                continue
-            filtered = []
-            for element in elements:
-                child = element.get_element(childname)
-                if child and child.match(variable):
-                    filtered.append(element)
-            elements = filtered
-        return elements
+        if (
+            content is None
+            and url is None
+            and not (svg_title or svg_desc or dc_creator or dc_date)
+        ):
+            return elements
+        dt_dc_date = None if dc_date is None else DateTime.encode(dc_date)
+        return [
+            element
+            for element in elements
+            if element._match_filters(
+                content, url, svg_title, svg_desc, dc_creator, dt_dc_date
+            )
+        ]
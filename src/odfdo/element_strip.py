@@ -25,7 +25,7 @@ import sys
 from collections.abc import Iterable
 from typing import cast
 
-from .element import Element, _get_lxml_tag
+from .element import Element, _forget_touched, _get_lxml_tag, _touch_tree
 
 
 def strip_elements(
@@ -54,7 +54,9 @@ def strip_elements(
         sub_elements = (sub_elements,)
     replacer = _get_lxml_tag("text:this-will-be-removed")
     for elem in sub_elements:
+        _touch_tree(elem._xml_element)
         elem._xml_element.tag = replacer
+    _forget_touched()
     strip = ("text:this-will-be-removed",)
     return strip_tags(element, strip=strip, default=None)
 
@@ -32,6 +32,105 @@ from .element import Element
 from .utils import bytes_to_str
 
 
+def _encode_typed_value(
+    value: CellValue | None,
+    value_type: str | None = None,
+    text: str | None = None,
+    currency: str | None = None,
+) -> tuple[list[tuple[str, Any]], str | None]:
+    """Encode a value into the ODF attributes of a typed element.
+
+    Args:
+        value: The value to encode.
+        value_type: The ODF value type, inferred from the type of `value`
+            if not provided.
+        text: The textual representation of the value, generated if not
+            provided.
+        currency: The currency symbol, used when `value_type` is "currency".
+
+    Returns:
+        tuple[list[tuple[str, Any]], str | None]: The (name, value)
+            attributes to set, in order, and the textual representation.
+
+    Raises:
+        TypeError: If the type of `value` is not supported.
+    """
+    if isinstance(value, bytes):
+        value = bytes_to_str(value)
+    if isinstance(value_type, bytes):
+        value_type = bytes_to_str(value_type)
+    if isinstance(text, bytes):
+        text = bytes_to_str(text)
+    if isinstance(currency, bytes):
+        currency = bytes_to_str(currency)
+    if value is None:
+        return [], text
+    if isinstance(value, bool):
+        if value_type is None:
+            value_type = "boolean"
+        if text is None:
+            text = "true" if value else "false"
+        value = Boolean.encode(value)
+    elif isinstance(value, (int, float, Decimal)):
+        if value_type == "percentage":
+            text = f"{int(value * 100)} %"
+        if value_type is None:
+            value_type = "float"
+        if value_type == "boolean":
+            if text is None:
+                text = "true" if bool(value) else "false"
+            value = Boolean.encode(value)
+        else:
+            if text is None:
+                text = str(value)
+            value = str(value)
+    elif isinstance(value, datetime):
+        if value_type is None:
+            value_type = "date"
+        if text is None:
+            text = str(DateTime.encode(value))
+        value = DateTime.encode(value)
+    elif isinstance(value, date):
+        if value_type is None:
+            value_type = "date"
+        if text is None:
+            text = str(Date.encode(value))
+        value = Date.encode(value)
+    elif isinstance(value, str):
+        if value_type is None:
+            value_type = "string"
+        if text is None:
+            text = value
+    elif isinstance(value, timedelta):
+        if value_type is None:
+            value_type = "time"
+        if text is None:
+            text = str(Duration.encode(value))
+        value = Duration.encode(value)
+    else:
+        raise TypeError(f"Type unknown: '{value!r}'")
+
+    attributes: list[tuple[str, Any]] = []
+    if isinstance(value_type, str):
+        attributes.append(("office:value-type", value_type))
+        attributes.append(("calcext:value-type", value_type))
+    if value_type == "boolean":
+        attributes.append(("office:boolean-value", value))
+    elif value_type == "currency":
+        attributes.append(("office:value", value))
+        attributes.append(("office:currency", currency))
+    elif value_type == "date":
+        attributes.append(("office:date-value", value))
+    elif value_type in ("float", "percentage"):
+        attributes.append(("office:value", value))
+        attributes.append(("calcext:value", value))
+    elif value_type == "string":
+        attributes.append(("office:string-value", value))
+    elif value_type == "time":
+        attributes.append(("office:time-value", value))
+    return attributes, text
+
+
 class ElementTyped(Element):
     """Subclass of Element for classes managing typed values."""
 
@@ -118,80 +217,12 @@ class ElementTyped(Element):
         """
         # Remove possible previous value and type
         self.clear_attrinutes()
-        if isinstance(value, bytes):
-            value = bytes_to_str(value)
-        if isinstance(value_type, bytes):
-            value_type = bytes_to_str(value_type)
-        if isinstance(text, bytes):
-            text = bytes_to_str(text)
-        if isinstance(currency, bytes):
-            currency = bytes_to_str(currency)
+        attributes, text = _encode_typed_value(value, value_type, text, currency)
         if value is None:
             self._erase_text_content()
             return text
-        if isinstance(value, bool):
-            if value_type is None:
-                value_type = "boolean"
-            if text is None:
-                text = "true" if value else "false"
-            value = Boolean.encode(value)
-        elif isinstance(value, (int, float, Decimal)):
-            if value_type == "percentage":
-                text = f"{int(value * 100)} %"
-            if value_type is None:
-                value_type = "float"
-            if value_type == "boolean":
-                if text is None:
-                    text = "true" if bool(value) else "false"
-                value = Boolean.encode(value)
-            else:
-                if text is None:
-                    text = str(value)
-                value = str(value)
-        elif isinstance(value, datetime):
-            if value_type is None:
-                value_type = "date"
-            if text is None:
-                text = str(DateTime.encode(value))
-            value = DateTime.encode(value)
-        elif isinstance(value, date):
-            if value_type is None:
-                value_type = "date"
-            if text is None:
-                text = str(Date.encode(value))
-            value = Date.encode(value)
-        elif isinstance(value, str):
-            if value_type is None:
-                value_type = "string"
-            if text is None:
-                text = value
-        elif isinstance(value, timedelta):
-            if value_type is None:
-                value_type = "time"
-            if text is None:
-                text = str(Duration.encode(value))
-            value = Duration.encode(value)
-        else:
-            raise TypeError(f"Type unknown: '{value!r}'")
-
-        if isinstance(value_type, str):
-            self.set_attribute("office:value-type", value_type)
-            self.set_attribute("calcext:value-type", value_type)
-        if value_type == "boolean":
-            self.set_attribute("office:boolean-value", value)
-        elif value_type == "currency":
-            self.set_attribute("office:value", value)
-            self.set_attribute("office:currency", currency)
-        elif value_type == "date":
-            self.set_attribute("office:date-value", value)
-        elif value_type in ("float", "percentage"):
-            self.set_attribute("office:value", value)
-            self.set_attribute("calcext:value", value)
-        elif value_type == "string":
-            self.set_attribute("office:string-value", value)
-        elif value_type == "time":
-            self.set_attribute("office:time-value", value)
-
+        for name, attr_value in attributes:
+            self.set_attribute(name, attr_value)
         return text
 
     def _get_typed_value_boolean(self) -> bool:
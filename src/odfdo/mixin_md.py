@@ -170,6 +170,16 @@ def _md_tail(tail: str | None, post_styler: Callable = _as_none) -> str:
     return text if text.strip() else ""
 
 
+def _md_text_properties(document: Any, family: str, name: str) -> dict[str, Any] | None:
+    """Return the inherited text properties of a style, with the boolean
+    values of StyleProps.get_text_properties() ("italic", "bold", ...)."""
+    prop = document.resolve_style(family, name, "text")
+    if prop is None:
+        return None
+    document.get_style(family, name)._update_boolean_styles(prop)
+    return prop
+
+
 class MDStyle:
     def _md_is_fixed_paragraph(self) -> bool:
         if self.tag != "text:p" or not self.style:
@@ -177,32 +187,17 @@ class MDStyle:
         document = MD_GLOBAL.get("document")
         if not document:
             return False
-        style = document.get_style("paragraph", self.style)
-        if not style:
+        prop = _md_text_properties(document, "paragraph", self.style)
+        if prop is None:
             return False
-        parent_style = document.get_parent_style(style)
-        if parent_style:
-            prop = parent_style.get_text_properties()
-            prop.update({k: v for k, v in style.get_text_properties().items() if v})
-        else:
-            prop = style.get_text_properties()
         return bool(prop["fixed"])
 
     def _md_styling(self) -> Callable:
         def get_text_props(document: Any, name: str) -> dict[str, Any]:
-            prop: dict[str, Any] = {}
-            style = document.get_style("text", name)
-            if not style:
-                style = document.get_style("paragraph", name)
-            if not style:
-                return prop
-            parent_style = document.get_parent_style(style)
-            if parent_style:
-                prop = parent_style.get_text_properties()
-                prop.update({k: v for k, v in style.get_text_properties().items() if v})
-            else:
-                prop = style.get_text_properties()
-            return prop
+            prop = _md_text_properties(document, "text", name)
+            if prop is None:
+                prop = _md_text_properties(document, "paragraph", name)
+            return prop or {}
 
         if not self.style:
             return _as_none
@@ -29,24 +29,22 @@ import contextlib
 from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, cast
 
-from .cell import Cell
+from .cell import Cell, _decode_value_and_type
 from .const import CellValue
 from .element import (
     Element,
+    _get_lxml_tag,
     register_element_class,
-    xpath_compile,
     xpath_return_elements,
 )
-from .table_cache import _XP_CELL_IDX, RowCache, TableCache
+from .table_cache import _XP_CELL, _XP_CELL_IDX, RowCache, TableCache
 from .utils import convert_coordinates, increment, isiterable, translate_from_any
 
 if TYPE_CHECKING:
-    from lxml.etree import XPath  # ty: ignore[unresolved-import]
-
     from .style import Style
 
 
-_XPATH_CELL = xpath_compile("(table:table-cell|table:covered-table-cell)")
+_COLUMNS_REPEATED = _get_lxml_tag("table:number-columns-repeated")
 
 
 class Row(Element):
@@ -98,27 +96,14 @@ class Row(Element):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} y={self.y}>"
 
-    def get_elements(self, xpath_query: XPath | str) -> list[Element]:
-        """Get a list of elements matching the XPath query.
-
-        Args:
-            xpath_query: The XPath query.
+    def _get_cache(self) -> tuple:
+        """Returns the table and row caches, to be copied to the elements
+        found under the row.
 
         Returns:
-            list[Element]: A list of matching elements.
+            tuple: The table cache and the row cache.
         """
-        if isinstance(xpath_query, str):
-            elements = xpath_return_elements(
-                xpath_compile(xpath_query),
-                self._xml_element,
-            )
-        else:
-            elements = xpath_return_elements(
-                xpath_query,
-                self._xml_element,
-            )
-        cache = (self._table_cache, self._row_cache)
-        return [Element.from_tag_for_clone(e, cache) for e in elements]
+        return (self._table_cache, self._row_cache)
 
     def _copy_cache(self, cache: tuple) -> None:
         """Copy cache when cloning.
@@ -132,12 +117,12 @@ class Row(Element):
 
     def clear(self) -> None:
         """Remove text, children and attributes from the Row."""
-        self._xml_element.clear()
+        super().clear()
         self._table_cache = TableCache()
         self._row_cache = RowCache()
 
     def _get_cells(self) -> list[Cell]:
-        return cast(list[Cell], self.get_elements(_XPATH_CELL))
+        return cast(list[Cell], self.get_elements(_XP_CELL))
 
     def _translate_row_coordinates(
         self,
@@ -155,10 +140,8 @@ class Row(Element):
         return (x, z)
 
     def _compute_row_cache(self) -> None:
-        idx_repeated_seq = self.elements_repeated_sequence(
-            _XPATH_CELL, "table:number-columns-repeated"
-        )
-        self._row_cache.make_cell_map(idx_repeated_seq)
+        # The map is read again from the XML on next positional access
+        self._row_cache.invalidate(self._xml_element)
 
     # Public API
 
@@ -242,32 +225,68 @@ class Row(Element):
     def _translate_x_from_any(self, x: str | int) -> int:
         return translate_from_any(x, self.width, 0)
 
-    def _yield_odf_cells(self) -> Iterator[Cell]:
+    def iter_cell_runs(
+        self,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, int, Cell]]:
+        """Yields the runs of repeated cells, without expanding repetitions.
+
+        Each run is a tuple (x, repeat, cell): the position of the first cell
+        of the run, the number of cells of the run within the requested
+        range, and the Cell element itself, not a copy. A cell repeated a
+        million times is thus handled once. The Cell should not be modified
+        through this method, since the modification would apply to the whole
+        run; use `set_cell()` to apply changes.
+
+        Args:
+            start: The starting cell index (0-based). Defaults to 0.
+            end: The ending cell index (inclusive). Defaults to 2**32.
+
+        Yields:
+            tuple[int, int, Cell]: The position, the repetition and the Cell
+                of the next run in the specified range.
+        """
+        if start is None:
+            start = 0
+        start = max(0, start)
+        if end is None:
+            end = 2**32
+        if end < start:
+            return
+        x = 0
         for cell in self._get_cells():
-            if cell.repeated is None:
-                yield cell
-            else:
-                for _ in range(cell.repeated):
-                    cell_copy = cell.clone
-                    cell_copy.repeated = None
-                    yield cell_copy
+            repeated = cell.repeated
+            if repeated is None:
+                repeated = 1
+            last = x + repeated - 1
+            if last >= start and repeated > 0:
+                first = max(x, start)
+                cell.x = first
+                cell.y = self.y
+                yield first, min(last, end) - first + 1, cell
+            if last >= end:
+                return
+            x += max(repeated, 0)
 
-    def iter_cells(
+    def _iter_value_runs(
         self,
         start: int | None = None,
         end: int | None = None,
-    ) -> Iterator[Cell]:
-        """Yields Cell elements, expanding repetitions.
+    ) -> Iterator[tuple[int, int, CellValue | None, str | None]]:
+        """Yields the values of the runs of repeated cells (internal).
 
-        This method produces individual Cell objects. The yielded
-        Cell are copies; use `set_cell()` to apply changes.
+        Like `iter_cell_runs()`, but yields (x, repeat, value, type) tuples,
+        reading the values from the XML cells without wrapping them in Cell
+        objects when possible.
 
         Args:
             start: The starting cell index (0-based). Defaults to 0.
             end: The ending cell index (inclusive). Defaults to 2**32.
 
         Yields:
-            Cell: The next Cell element in the specified range..
+            tuple[int, int, CellValue | None, str | None]: The position, the
+                repetition, the value and the ODF type of the next run.
         """
         if start is None:
             start = 0
@@ -276,16 +295,61 @@ class Row(Element):
             end = 2**32
         if end < start:
             return
-        x: int = -1
-        for cell in self._yield_odf_cells():
-            x += 1
-            if x < start:
-                continue
-            if x > end:
+        x = 0
+        for cell in xpath_return_elements(_XP_CELL, self._xml_element):
+            read_repeated = cell.get(_COLUMNS_REPEATED)
+            repeated = 1 if read_repeated is None else int(read_repeated)
+            last = x + repeated - 1
+            if last >= start and repeated > 0:
+                first = max(x, start)
+                value_type = _decode_value_and_type(cell)
+                if value_type is None:
+                    value_type = cast(
+                        tuple[CellValue | None, str | None],
+                        Cell.from_tag(cell).get_value(get_type=True),
+                    )
+                yield first, min(last, end) - first + 1, value_type[0], value_type[1]
+            if last >= end:
                 return
-            cell.x = x
-            cell.y = self.y
-            yield cell
+            x += max(repeated, 0)
+
+    def iter_cells(
+        self,
+        start: int | None = None,
+        end: int | None = None,
+        view: bool = False,
+    ) -> Iterator[Cell]:
+        """Yields Cell elements, expanding repetitions.
+
+        This method produces individual Cell objects. The yielded
+        Cell are copies; use `set_cell()` to apply changes.
+
+        With `view` set to True, the repeated cells are not copied: the same
+        Cell element is yielded for each repetition, with its `x` attribute
+        updated. This read-only mode avoids cloning the XML of long runs of
+        repeated cells.
+
+        Args:
+            start: The starting cell index (0-based). Defaults to 0.
+            end: The ending cell index (inclusive). Defaults to 2**32.
+            view: If True, do not copy the repeated cells.
+
+        Yields:
+            Cell: The next Cell element in the specified range..
+        """
+        for x, repeat, cell in self.iter_cell_runs(start, end):
+            if cell.repeated is None:
+                yield cell
+                continue
+            for idx in range(repeat):
+                if view:
+                    current = cell
+                else:
+                    current = cell.clone
+                    current.repeated = None
+                    current.y = self.y
+                current.x = x + idx
+                yield current
 
     traverse = iter_cells
 
@@ -652,23 +716,28 @@ class Row(Element):
         if cell_type:
             cell_type = cell_type.lower().strip()
             values: list[CellValue | tuple[CellValue | None, str | None] | None] = []
-            for cell in self.iter_cells(start=x, end=z):
+            for _x, repeat, value, ctype in self._iter_value_runs(start=x, end=z):
                 # Filter the cells by cell_type
-                ctype = cell.type
                 if not ctype or not (ctype == cell_type or cell_type == "all"):
                     if complete:
                         if get_type:
-                            values.append((None, None))
+                            values.extend([(None, None)] * repeat)
                         else:
-                            values.append(None)
+                            values.extend([None] * repeat)
                     continue
-                values.append(cell.get_value(get_type=get_type))
+                if get_type:
+                    values.extend([(value, ctype)] * repeat)
+                else:
+                    values.extend([value] * repeat)
             return values
         else:
-            return [
-                cell.get_value(get_type=get_type)
-                for cell in self.iter_cells(start=x, end=z)
-            ]
+            values = []
+            for _x, repeat, value, ctype in self._iter_value_runs(start=x, end=z):
+                if get_type:
+                    values.extend([(value, ctype)] * repeat)
+                else:
+                    values.extend([value] * repeat)
+            return values
 
     def get_sub_elements(
         self,
@@ -808,7 +877,10 @@ class Row(Element):
             list[str, bool, int, Decimal, date, datetime, timedelta, None]:
                 The list of values of cells in their appropriate Python type.
         """
-        return [cell.value for cell in self.iter_cells()]
+        values: list[CellValue | None] = []
+        for _x, repeat, cell in self.iter_cell_runs():
+            values.extend([cell.value] * repeat)
+        return values
 
     @values.setter
     def values(self, values: Iterable[CellValue | None]) -> None:
@@ -837,7 +909,7 @@ class Row(Element):
             int: The length of the row.
         """
         idx_repeated_seq = self.elements_repeated_sequence(
-            _XPATH_CELL, "table:number-columns-repeated"
+            _XP_CELL, "table:number-columns-repeated"
         )
         repeated = [item[1] for item in idx_repeated_seq]
         if repeated:
@@ -852,7 +924,7 @@ class Row(Element):
             int: The minimized width of the row.
         """
         idx_repeated_seq = self.elements_repeated_sequence(
-            _XPATH_CELL, "table:number-columns-repeated"
+            _XP_CELL, "table:number-columns-repeated"
         )
         repeated = [item[1] for item in idx_repeated_seq]
         if repeated:
@@ -28,10 +28,13 @@ from __future__ import annotations
 import io
 import sys
 from argparse import ArgumentParser, Namespace
+from contextlib import ExitStack
 from pathlib import Path
+from typing import IO
 
-from odfdo import Document, Table, __version__
-from odfdo.utils.script_utils import detect_stdin_timeout, save_document
+from odfdo import SpreadsheetWriter, __version__
+from odfdo.table import CSV_TYPES, iter_csv_values
+from odfdo.utils.script_utils import detect_stdin_timeout
 
 PROG = "odfdo-from-csv"
 STDIN_TIMEOUT = 0.5
@@ -46,6 +49,8 @@ def configure_parser() -> ArgumentParser:
     epilog = (
         "The CSV format detection is handled automatically by the Python CSV module, "
         "providing basic functionality for importing tabular data. "
+        "The type of each column is guessed from its first values, "
+        "unless given with the --types option. "
         "Input can be from a specified file or standard input. "
         "Output can be to a specified file or standard output."
     )
@@ -84,6 +89,18 @@ def configure_parser() -> ArgumentParser:
         required=False,
         help=f"table name, if option not present, default to '{DEFAULT_NAME}'",
     )
+    parser.add_argument(
+        "--types",
+        action="store",
+        dest="types",
+        metavar="TYPES",
+        required=False,
+        default=None,
+        help=(
+            "comma separated types of the columns, empty to guess the type, "
+            f"among: {', '.join(CSV_TYPES)}"
+        ),
+    )
     return parser
 
 
@@ -92,27 +109,40 @@ def parse_cli_args(cli_args: list[str] | None = None) -> Namespace:
     return parser.parse_args(cli_args)
 
 
-def read_document(input_file: str | None) -> str:
+def open_input(stack: ExitStack, input_file: str | None) -> IO[str]:
     if input_file:
-        csv_content = Path(input_file).read_text()
+        return stack.enter_context(Path(input_file).open(newline="", encoding="utf-8"))
     else:  # pragma: no cover
         detect_stdin_timeout()
-        content = io.BytesIO(sys.stdin.buffer.read())
-        csv_content = content.getvalue().decode()
-        content.close()
-    return csv_content
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+
+
+def parse_types(types: str | None) -> list[str | None] | None:
+    if not types:
+        return None
+    result: list[str | None] = []
+    for type_name in types.split(","):
+        type_name = type_name.strip().lower()
+        if type_name and type_name not in CSV_TYPES:
+            raise ValueError(f"Unknown column type: {type_name!r}")
+        result.append(type_name or None)
+    return result
 
 
 def from_csv(args: Namespace) -> None:
-    csv_content = read_document(args.input_file)
-    document = Document("ods")
-    table = Table.from_csv(
-        content=csv_content,
-        name=args.table_name or DEFAULT_NAME,
-    )
-    document.body.clear()
-    document.body.append(table)
-    save_document(document, args.output_file)
+    types = parse_types(args.types)
+    with ExitStack() as stack:
+        lines = open_input(stack, args.input_file)
+        if args.output_file:
+            target: Path | io.BytesIO = Path(args.output_file)
+        else:
+            target = stack.enter_context(io.BytesIO())
+        with SpreadsheetWriter(target) as writer:
+            writer.add_sheet(args.table_name or DEFAULT_NAME)
+            for values in iter_csv_values(lines, types=types):
+                writer.write_row(values)
+        if isinstance(target, io.BytesIO):
+            sys.stdout.buffer.write(target.getvalue())
 
 
 def main() -> int:
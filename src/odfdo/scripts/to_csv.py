@@ -26,11 +26,17 @@ standard output.
 
 from __future__ import annotations
 
+import csv
+import io
 import sys
 from argparse import ArgumentParser, Namespace
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any
 
-from odfdo import __version__
-from odfdo.utils.script_utils import read_document
+from odfdo import Container, __version__, iter_table_rows
+from odfdo.const import ODF_SPREADSHEET, ODF_SPREADSHEET_TEMPLATE
+from odfdo.utils.script_utils import detect_stdin_timeout
 
 PROG = "odfdo-to-csv"
 
@@ -97,25 +103,49 @@ def parse_cli_args(cli_args: list[str] | None = None) -> Namespace:
     return parser.parse_args(cli_args)
 
 
+def read_source(input_file: str | None) -> Path | io.BytesIO:
+    if input_file:
+        return Path(input_file)
+    else:  # pragma: no cover
+        detect_stdin_timeout()
+        return io.BytesIO(sys.stdin.buffer.read())
+
+
+def open_output(stack: ExitStack, output_file: str | None) -> IO[str]:
+    if output_file:
+        return stack.enter_context(
+            Path(output_file).open("w", newline="", encoding="utf-8")
+        )
+    stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+    # flush and detach, so sys.stdout remains usable
+    stack.callback(stdout.detach)
+    stack.callback(stdout.flush)
+    return stdout
+
+
 def to_csv(args: Namespace) -> None:
-    document = read_document(args.input_file)
-    if document.get_type() not in {"spreadsheet", "spreadsheet-template"}:
+    source = read_source(args.input_file)
+    container = Container()
+    container.open(source)
+    mimetype = container.mimetype
+    container.close()
+    if mimetype not in {ODF_SPREADSHEET, ODF_SPREADSHEET_TEMPLATE}:
         raise TypeError("Document must be a Spreadsheet type.")
-    if args.table_name:
-        table = document.body.get_table(name=args.table_name)
-        if not table:
-            raise ValueError(f"Table {args.table_name!r} not found")
-    else:
-        table = document.body.get_table()
-        if not table:  # pragma: no cover
-            raise ValueError("No table found")
+    if isinstance(source, io.BytesIO):  # pragma: no cover
+        source.seek(0)
     if args.unix:
         dialect = "unix"
     else:
         dialect = "excel"
-    content = table.to_csv(path_or_file=args.output_file, dialect=dialect)
-    if content is not None:  # pragma: no cover
-        sys.stdout.buffer.write(content.encode())
+    rows = iter_table_rows(source, args.table_name or 0, rstrip=False)
+    with ExitStack() as stack:
+        writer: Any = None
+        for values in rows:
+            if writer is None:
+                # the output is opened once the table is found
+                output = open_output(stack, args.output_file)
+                writer = csv.writer(output, dialect=dialect)
+            writer.writerow(["" if value is None else value for value in values])
 
 
 def main() -> int:
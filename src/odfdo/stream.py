@@ -0,0 +1,540 @@
+# Copyright 2018-2026 Jérôme Dumonteil
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Authors (odfdo project): jerome.dumonteil@gmail.com
+"""Streaming access to the tables of big spreadsheet documents.
+
+The functions of this module read the "content.xml" part while it is
+decompressed, and the SpreadsheetWriter writes it while the rows are
+provided, without building the XML tree of the tables, so the memory used
+does not depend on the size of the tables.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from itertools import groupby
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from lxml.etree import Element as XmlElement  # ty: ignore[unresolved-import]
+from lxml.etree import (  # ty: ignore[unresolved-import]
+    SubElement,
+    _Element,
+    iterparse,
+    tostring,
+    xmlfile,
+)
+
+from .cell import Cell, _append_cell_xml, _decode_value_and_type
+from .const import (
+    ODF_CONTENT,
+    ODF_MANIFEST,
+    ODF_META,
+    ODF_SETTINGS,
+    ODF_STYLES,
+    CellValue,
+)
+from .container import Container
+from .document import Document
+from .element import Element, _get_lxml_tag
+from .named_range import table_name_check
+from .utils import isiterable
+from .xmlpart import XML_HEADER, XmlPart
+
+_TABLE = _get_lxml_tag("table:table")
+_TABLE_NAME = _get_lxml_tag("table:name")
+_STYLE_NAME = _get_lxml_tag("table:style-name")
+_COLUMN = _get_lxml_tag("table:table-column")
+# Parents of the columns counted in the width of a table, like Table.width
+_COLUMN_PARENTS = {
+    _TABLE,
+    _get_lxml_tag("table:table-columns"),
+    _get_lxml_tag("table:table-header-columns"),
+}
+# Number of rows serialized at once by the SpreadsheetWriter
+_ROWS_BATCH_SIZE = 256
+_ROW = _get_lxml_tag("table:table-row")
+_CELL = _get_lxml_tag("table:table-cell")
+_COVERED_CELL = _get_lxml_tag("table:covered-table-cell")
+_ROWS_REPEATED = _get_lxml_tag("table:number-rows-repeated")
+_COLUMNS_REPEATED = _get_lxml_tag("table:number-columns-repeated")
+_BODY = _get_lxml_tag("office:body")
+_SPREADSHEET = _get_lxml_tag("office:spreadsheet")
+# Elements of office:spreadsheet that follow the tables
+_SPREADSHEET_TAIL = {
+    _get_lxml_tag("table:named-expressions"),
+    _get_lxml_tag("table:database-ranges"),
+    _get_lxml_tag("table:data-pilot-tables"),
+    _get_lxml_tag("table:consolidation"),
+    _get_lxml_tag("table:dde-links"),
+}
+
+
+def _repeated(element: Any, lxml_tag: str) -> int:
+    value = element.get(lxml_tag)
+    if value is None:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def _row_values(row: Any, get_type: bool, rstrip: bool) -> list[Any]:
+    """Decode the values of the cells of a row XML element."""
+    values: list[Any] = []
+    # length of the row without its trailing empty cells
+    used = 0
+    for cell in row.iterchildren(_CELL, _COVERED_CELL):
+        decoded = _decode_value_and_type(cell)
+        if decoded is None:
+            wrapped = Element.from_tag(cell)
+            if not isinstance(wrapped, Cell):  # pragma: nocover
+                raise TypeError(f"Not a cell: {wrapped!r}")
+            decoded = wrapped.get_value(get_type=True)  # type: ignore[assignment]
+        value, value_type = decoded  # type: ignore[misc]
+        item = (value, value_type) if get_type else value
+        values.extend([item] * _repeated(cell, _COLUMNS_REPEATED))
+        if value is not None:
+            used = len(values)
+    if rstrip:
+        del values[used:]
+    return values
+
+
+def _iter_rows(
+    path_or_file: Path | str | io.BytesIO,
+    get_type: bool,
+    rstrip: bool,
+) -> Iterator[tuple[int, str, list[Any] | None]]:
+    """Yield the (table index, table name, row values) of the rows of all
+    the tables of the document, and (table index, table name, None) at the
+    start of each table.
+
+    If rstrip is False, the rows are completed with None values up to the
+    width of the table defined by its columns, like Table.iter_values().
+
+    The processed XML elements are removed from the partial tree, so the
+    memory used stays constant whatever the size of the tables. Tables
+    nested in cells are read as the content of their cell.
+    """
+    missing: Any = (None, None) if get_type else None
+    with (
+        Container(path_or_file) as container,
+        container.open_part("content.xml") as stream,
+    ):
+        index = -1
+        name = ""
+        depth = 0
+        width = 0
+        # empty rows not yet yielded, waiting for a non empty row
+        pending_empty = 0
+        for event, element in iterparse(
+            stream, events=("start", "end"), tag=(_TABLE, _COLUMN, _ROW)
+        ):
+            if element.tag == _TABLE:
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        index += 1
+                        name = element.get(_TABLE_NAME) or ""
+                        pending_empty = 0
+                        width = 0
+                        # the table exists, even without rows
+                        yield index, name, None
+                    continue
+                depth -= 1
+                if depth:
+                    continue
+            elif event == "start" or depth != 1:
+                continue
+            elif element.tag == _COLUMN:
+                parent = element.getparent()
+                if parent is not None and parent.tag in _COLUMN_PARENTS:
+                    width += _repeated(element, _COLUMNS_REPEATED)
+                continue
+            else:
+                values = _row_values(element, get_type, rstrip)
+                if not rstrip and len(values) < width:
+                    values.extend([missing] * (width - len(values)))
+                repeated = _repeated(element, _ROWS_REPEATED)
+                if rstrip and not values:
+                    pending_empty += repeated
+                else:
+                    for _i in range(pending_empty):
+                        yield index, name, []
+                    pending_empty = 0
+                    for _i in range(repeated):
+                        yield index, name, values[:]
+            # free the memory of the processed elements
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
+def iter_table_rows(
+    path_or_file: Path | str | io.BytesIO,
+    table: int | str = 0,
+    get_type: bool = False,
+    rstrip: bool = True,
+) -> Iterator[list[Any]]:
+    """Yield the values of the rows of a table of a spreadsheet, without
+    loading the document in memory.
+
+    The "content.xml" part is parsed while it is read from the archive,
+    and the rows are removed from memory once decoded. Repeated rows and
+    cells are expanded when yielded, each row being a new list.
+
+    Args:
+        path_or_file: Path to the document, or an opened file.
+        table: Index or name of the table.
+        get_type: If True, the values are (value, type) tuples, like with
+            Row.get_values(get_type=True).
+        rstrip: If True (default), remove the empty cells at the end of
+            the rows and the empty rows at the end of the table. If False,
+            all the repeated cells and rows are yielded, and the rows are
+            completed up to the width of the table, like with
+            Table.iter_values().
+
+    Returns:
+        Iterator[list[Any]]: The list of the values of each row.
+
+    Raises:
+        ValueError: If the table is not found, once the document is read.
+    """
+    found = False
+    for index, name, values in _iter_rows(path_or_file, get_type, rstrip):
+        if isinstance(table, int):
+            if index < table:
+                continue
+            if index > table:
+                return
+        elif name != table:
+            continue
+        found = True
+        if values is not None:
+            yield values
+    if not found:
+        raise ValueError(f"Table {table!r} not found")
+
+
+def iter_tables_rows(
+    path_or_file: Path | str | io.BytesIO,
+    get_type: bool = False,
+    rstrip: bool = True,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Yield the name of the table and the values of the rows of all the
+    tables of a spreadsheet, without loading the document in memory.
+
+    See iter_table_rows() for the arguments.
+
+    Args:
+        path_or_file: Path to the document, or an opened file.
+        get_type: If True, the values are (value, type) tuples.
+        rstrip: If True (default), remove the trailing empty cells and rows.
+
+    Returns:
+        Iterator[tuple[str, list[Any]]]: The table name and the list of the
+            values of each row.
+    """
+    for _index, name, values in _iter_rows(path_or_file, get_type, rstrip):
+        if values is not None:
+            yield name, values
+
+
+def _write_element(xf: Any, element: _Element) -> None:
+    """Write an XML element in the xmlfile, declaring its namespaces only
+    if not already declared by its ancestors."""
+    if not isinstance(element.tag, str):
+        # comment or processing instruction
+        xf.write(element)
+        return
+    with xf.element(element.tag, dict(element.attrib)):
+        if element.text:
+            xf.write(element.text)
+        for child in element:
+            _write_element(xf, child)
+            if child.tail:
+                xf.write(child.tail)
+
+
+class SpreadsheetWriter:
+    """Write a spreadsheet document row by row, without building its tables
+    in memory.
+
+    The "content.xml" part is written into the Zip archive while the rows
+    are provided, identical adjacent cells and rows being merged into
+    repeated ones. The other parts come from the default spreadsheet
+    template.
+
+    The styles used by the tables must be inserted in the `document`
+    attribute before the first call to add_sheet().
+
+    Example:
+        with SpreadsheetWriter("report.ods") as writer:
+            writer.add_sheet("Data")
+            for record in records:
+                writer.write_row(record)
+    """
+
+    def __init__(self, target: Path | str | io.BytesIO) -> None:
+        """Create a spreadsheet document to be written row by row.
+
+        Args:
+            target: Path of the document to write, or a file-like object.
+        """
+        self.document = Document("spreadsheet")
+        body = self.document.body._xml_element
+        # The tables are written with the styles of the template table
+        model_table = body.find(_TABLE)
+        self._table_attrib: dict[str, str] = {}
+        self._column_attrib: dict[str, str] = {}
+        self._row_attrib: dict[str, str] = {}
+        if model_table is not None:
+            self._table_attrib = dict(model_table.attrib)
+            model_column = model_table.find(_COLUMN)
+            if model_column is not None:
+                self._column_attrib = dict(model_column.attrib)
+            model_row = model_table.find(_ROW)
+            if model_row is not None:
+                self._row_attrib = dict(model_row.attrib)
+        for table in body.findall(_TABLE):
+            body.remove(table)
+        self._target = target
+        self._zip: ZipFile | None = None
+        self._content: ExitStack | None = None
+        self._stream: Any = None
+        self._xf: Any = None
+        self._rows: _Element | None = None
+        self._sheet: ExitStack | None = None
+        self._width: int | None = None
+        self._columns = False
+        self._closed = False
+        self._pending_key: tuple | None = None
+        self._pending_row: _Element | None = None
+        self._pending_repeat = 0
+
+    def __enter__(self) -> SpreadsheetWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Open the archive and write the beginning of "content.xml", up to
+        the tables."""
+        self.document.meta.set_generator_default()
+        filezip = ZipFile(self._target, "w", ZIP_DEFLATED)
+        self._zip = filezip
+        # mimetype requires to be first and uncompressed
+        mimetype = self.document.container.get_part("mimetype")
+        filezip.writestr("mimetype", mimetype, ZIP_STORED)  # ty: ignore
+        content = ExitStack()
+        self._content = content
+        stream = content.enter_context(filezip.open(ODF_CONTENT, "w", force_zip64=True))
+        stream.write(XML_HEADER)
+        xf = content.enter_context(xmlfile(stream, encoding="UTF-8"))
+        self._stream = stream
+        self._xf = xf
+        root = self.document.content.root._xml_element
+        # rows are serialized by batches within an element declaring the
+        # namespaces of the document, like the rows of the real table
+        self._rows = XmlElement(_TABLE, nsmap=root.nsmap)
+        content.enter_context(xf.element(root.tag, dict(root.attrib), nsmap=root.nsmap))
+        for child in root:
+            if child.tag != _BODY:
+                _write_element(xf, child)
+                continue
+            content.enter_context(xf.element(child.tag, dict(child.attrib)))
+            for body in child:
+                if body.tag != _SPREADSHEET:
+                    _write_element(xf, body)
+                    continue
+                content.enter_context(xf.element(body.tag, dict(body.attrib)))
+                for element in body:
+                    if element.tag not in _SPREADSHEET_TAIL:
+                        _write_element(xf, element)
+                # the tables follow
+                return
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("The SpreadsheetWriter is closed")
+
+    def add_sheet(
+        self,
+        name: str,
+        width: int | None = None,
+        style: str | None = None,
+    ) -> None:
+        """Start a new sheet, the following rows are written into it.
+
+        The columns of the sheet are declared with the given width, or
+        with the width of its first row.
+
+        Args:
+            name: The name of the table.
+            width: The number of columns of the table.
+            style: The style name of the table, the style of the template
+                table is used by default.
+        """
+        self._check_open()
+        name = table_name_check(name)
+        if self._content is None:
+            self._start()
+        self._end_sheet()
+        attrib = dict(self._table_attrib)
+        attrib[_TABLE_NAME] = name
+        if style is not None:
+            attrib[_STYLE_NAME] = style
+        sheet = ExitStack()
+        sheet.enter_context(self._xf.element(_TABLE, attrib))
+        self._sheet = sheet
+        self._width = width
+        self._columns = False
+
+    def _write_columns(self, width: int) -> None:
+        column = XmlElement(_COLUMN, self._column_attrib)
+        if width > 1:
+            column.set(_COLUMNS_REPEATED, str(width))
+        _write_element(self._xf, column)
+        self._columns = True
+
+    def _write_rows(self) -> None:
+        """Write the batch of rows into "content.xml"."""
+        rows = self._rows
+        if not len(rows):
+            return
+        data = tostring(rows, encoding="UTF-8", xml_declaration=False)
+        # keep the rows, without the start and end tags of the batch
+        start = data.index(b">") + 1
+        end = data.rindex(b"</")
+        del rows[:]
+        self._xf.flush()
+        self._stream.write(data[start:end])
+
+    def _flush_row(self) -> None:
+        """Move the pending run of identical rows into the batch of rows."""
+        row = self._pending_row
+        if row is None:
+            return
+        if self._pending_repeat > 1:
+            row.set(_ROWS_REPEATED, str(self._pending_repeat))
+        self._rows.append(row)
+        if len(self._rows) >= _ROWS_BATCH_SIZE:
+            self._write_rows()
+        self._pending_key = None
+        self._pending_row = None
+        self._pending_repeat = 0
+
+    def write_row(
+        self,
+        values: Iterable[CellValue | None],
+        style: str | None = None,
+        cell_style: str | None = None,
+    ) -> None:
+        """Append a row of values to the current sheet.
+
+        The values are encoded like with Cell.set_value(). A row identical
+        to the previous one is written as a repetition of it.
+
+        Args:
+            values: The values of the cells of the row.
+            style: The style name of the row, the style of the rows of the
+                template table is used by default.
+            cell_style: The style name of the cells of the row.
+        """
+        self._check_open()
+        if self._sheet is None:
+            raise ValueError("No sheet to write to, use add_sheet() first")
+        if not isiterable(values):
+            # guard against str iterable
+            values = [values]  # ty: ignore[invalid-assignment]
+        cell_keys = tuple((type(value), value) for value in values)
+        key = (style, cell_style, cell_keys)
+        if key == self._pending_key:
+            self._pending_repeat += 1
+            return
+        self._flush_row()
+        if not self._columns:
+            self._write_columns(self._width or max(len(cell_keys), 1))
+        row = XmlElement(_ROW, self._row_attrib)
+        if style is not None:
+            row.set(_STYLE_NAME, style)
+        for (_value_type, value), run in groupby(cell_keys):
+            _append_cell_xml(row, value, sum(1 for _cell in run), cell_style)
+        if not len(row):
+            SubElement(row, _CELL)
+        self._pending_key = key
+        self._pending_row = row
+        self._pending_repeat = 1
+
+    def _end_sheet(self) -> None:
+        if self._sheet is None:
+            return
+        self._flush_row()
+        self._write_rows()
+        if not self._columns:
+            self._write_columns(self._width or 1)
+        self._sheet.close()
+        self._sheet = None
+
+    def close(self) -> None:
+        """Finish the current sheet and write the document.
+
+        Once closed, no more sheet or row can be written.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._content is None:
+            self._start()
+        self._end_sheet()
+        for element in self.document.body._xml_element:
+            if element.tag in _SPREADSHEET_TAIL:
+                _write_element(self._xf, element)
+        self._content.close()  # ty: ignore[possibly-missing-attribute]
+        filezip = self._zip
+        if filezip is None:  # pragma: nocover
+            return
+        with filezip:
+            container = self.document.container
+            for path in container.parts:
+                if path in {"mimetype", ODF_CONTENT, ODF_MANIFEST}:
+                    continue
+                if path in {ODF_META, ODF_SETTINGS, ODF_STYLES}:
+                    self._write_xml_part(filezip, path)
+                else:
+                    filezip.writestr(path, container.get_part(path))  # ty: ignore
+            self._write_xml_part(filezip, ODF_MANIFEST)
+
+    def _write_xml_part(self, filezip: ZipFile, path: str) -> None:
+        part = self.document.get_part(path)
+        if not isinstance(part, XmlPart):  # pragma: nocover
+            raise TypeError(f"Not an XML part: {path!r}")
+        with filezip.open(path, "w", force_zip64=True) as stream:
+            part.write(stream)
@@ -0,0 +1,875 @@
+# Copyright 2018-2026 Jérôme Dumonteil
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Authors (odfdo project): jerome.dumonteil@gmail.com
+# The odfdo project is a derivative work of the lpod-python project:
+# https://github.com/lpod/lpod-python
+"""Index of the styles of a document (internal)."""
+
+from __future__ import annotations
+
+import contextlib
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .element import (
+    _STYLE_CONTAINER_TAGS,
+    Element,
+    _get_lxml_tag,
+    _tree_mutation_count,
+    _tree_style_mutation_count,
+    xpath_compile,
+    xpath_return_elements,
+)
+from .styles import CONTEXT_MAPPING
+from .utils.style_constants import (
+    FALSE_FAMILY_MAP_REVERSE,
+    FAMILY_MAPPING,
+    FAMILY_ODF_STD,
+)
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element  # ty: ignore[unresolved-import]
+
+    from .content import Content
+    from .style_base import PropDict
+    from .styles import Styles
+
+CONTENT = "content"
+STYLES = "styles"
+
+_STYLE = _get_lxml_tag("style:style")
+_DEFAULT_STYLE = _get_lxml_tag("style:default-style")
+_STYLE_NAME = _get_lxml_tag("style:name")
+_DISPLAY_NAME = _get_lxml_tag("style:display-name")
+_FAMILY = _get_lxml_tag("style:family")
+_PARENT_STYLE_NAME = _get_lxml_tag("style:parent-style-name")
+_DRAW_NAME = _get_lxml_tag("draw:name")
+# Attributes ignored when comparing styles
+_NAME_ATTRIBUTES = {_STYLE_NAME, _DISPLAY_NAME}
+# Family of the styles without "style:family" attribute, by lxml tag
+_TAG_FAMILY = {
+    _get_lxml_tag(tag): family for tag, family in FALSE_FAMILY_MAP_REVERSE.items()
+}
+_AUTOMATIC_STYLES = _get_lxml_tag("office:automatic-styles")
+# Children of a container with a given name or display name
+_XP_NAMED = xpath_compile("*[@style:name=$value or @draw:name=$value]")
+_XP_DISPLAY_NAMED = xpath_compile("*[@style:display-name=$value]")
+
+# Containers searched for each family, in the order of Document.get_style():
+# "content.xml" first, then "styles.xml".
+_family_containers: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+def _get_family_containers(family: str) -> tuple[tuple[str, str], ...]:
+    """Return the (part, lxml tag) of the containers of a style family.
+
+    Args:
+        family: The style family.
+
+    Returns:
+        tuple[tuple[str, str], ...]: The containers, in search order.
+    """
+    containers = _family_containers.get(family)
+    if containers is None:
+        if family == "font-face":
+            content_tags: tuple[str, ...] = ("office:font-face-decls",)
+        else:
+            content_tags = ("office:font-face-decls", "office:automatic-styles")
+        styles_tags = CONTEXT_MAPPING.get(family) or (
+            "office:styles",
+            "office:automatic-styles",
+        )
+        containers = tuple((CONTENT, _get_lxml_tag(tag)) for tag in content_tags) + (
+            tuple((STYLES, _get_lxml_tag(tag)) for tag in styles_tags)
+        )
+        _family_containers[family] = containers
+    return containers
+
+
+def _style_key(family: str) -> tuple[str, str | None]:
+    """Return the tag and family attribute of the styles of a family, as
+    stored in the keys of the index.
+
+    Args:
+        family: The style family, a key of FAMILY_MAPPING.
+
+    Returns:
+        tuple[str, str | None]: The lxml tag and the "style:family" value.
+    """
+    if family in FAMILY_ODF_STD:
+        return _STYLE, family
+    return _get_lxml_tag(FAMILY_MAPPING[family]), None
+
+
+def style_fingerprint(element: _Element) -> tuple:
+    """Return a hashable form of a style, equal for styles having the same
+    tag, attributes and content, whatever their name.
+
+    Args:
+        element: The lxml element of the style.
+
+    Returns:
+        tuple: The fingerprint of the style.
+    """
+    attributes = tuple(
+        sorted(
+            (key, value)
+            for key, value in element.attrib.items()
+            if key not in _NAME_ATTRIBUTES
+        )
+    )
+    return (element.tag, attributes, _content_fingerprint(element))
+
+
+def _content_fingerprint(element: _Element) -> tuple:
+    """Return a hashable form of the children and text of an element,
+    ignoring the whitespace of indentation."""
+    return (
+        (element.text or "").strip() and element.text,
+        tuple(
+            (
+                child.tag,
+                tuple(sorted(child.attrib.items())),
+                _content_fingerprint(child),
+                (child.tail or "").strip() and child.tail,
+            )
+            for child in element
+            if isinstance(child.tag, str)
+        ),
+    )
+
+
+def _is_reference(attribute: str) -> bool:
+    """Return True if the lxml attribute name is a reference to a style,
+    like "text:style-name" or "style:parent-style-name"."""
+    return attribute.endswith(("style-name", "}page-layout-name"))
+
+
+def _rename_references(root: _Element, renamed: dict[str, str]) -> None:
+    """Rewrite the references to renamed styles in the tree of the root.
+
+    Args:
+        root: The lxml root of the part.
+        renamed: The new names of the styles by old name.
+    """
+    references: dict[str, bool] = {}
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+        attrib = element.attrib
+        for attribute, value in attrib.items():
+            if value not in renamed:
+                if attribute.endswith("}class-names") and any(
+                    token in renamed for token in value.split()
+                ):
+                    attrib[attribute] = " ".join(
+                        renamed.get(token, token) for token in value.split()
+                    )
+                continue
+            is_reference = references.get(attribute)
+            if is_reference is None:
+                is_reference = references[attribute] = _is_reference(attribute)
+            if is_reference:
+                attrib[attribute] = renamed[value]
+
+
+class _ContainerIndex:
+    """Styles of one style container, like "office:automatic-styles",
+    by name, display name and family of default style, and by fingerprint
+    when needed."""
+
+    __slots__ = (
+        "default_styles",
+        "display_names",
+        "duplicates",
+        "element",
+        "fingerprints",
+        "first_default",
+        "names",
+    )
+
+    def __init__(self, element: _Element) -> None:
+        self.element = element
+        self._build()
+
+    def _build(self, skip: _Element | None = None) -> None:
+        self.names: dict[tuple[str, str | None, str], _Element] = {}
+        self.display_names: dict[tuple[str, str | None, str], _Element] = {}
+        self.default_styles: dict[str | None, _Element] = {}
+        self.first_default: _Element | None = None
+        # named styles by fingerprint, built on first use
+        self.fingerprints: dict[tuple, _Element] | None = None
+        self.duplicates = False
+        for child in self.element:
+            if child is not skip:
+                self.add(child)
+
+    @staticmethod
+    def _keys(child: _Element) -> Iterator[tuple[str, Any]]:
+        """Yield the names of the maps and the keys where a style is
+        indexed."""
+        tag = child.tag
+        if tag == _DEFAULT_STYLE:
+            yield "default_styles", child.get(_FAMILY)
+            # a query on a standard family matches both tags
+            tag = _STYLE
+        family = child.get(_FAMILY) if tag == _STYLE else None
+        name = child.get(_STYLE_NAME)
+        if name:
+            yield "names", (tag, family, name)
+        display_name = child.get(_DISPLAY_NAME)
+        if display_name:
+            yield "display_names", (tag, family, display_name)
+
+    def add(self, child: _Element) -> None:
+        """Index a style appended to the container. The first style of the
+        container with a given key is kept, like a search in document order.
+        """
+        if not isinstance(child.tag, str):
+            # comment or processing instruction
+            return
+        if child.tag == _DEFAULT_STYLE and self.first_default is None:
+            self.first_default = child
+        for map_name, key in self._keys(child):
+            mapping = getattr(self, map_name)
+            if key in mapping:
+                self.duplicates = True
+            else:
+                mapping[key] = child
+        if self.fingerprints is not None and child.get(_STYLE_NAME):
+            self.fingerprints.setdefault(style_fingerprint(child), child)
+
+    def build_fingerprints(self) -> dict[tuple, _Element]:
+        """Return the named styles of the container by fingerprint, the
+        first style being kept for equivalent styles."""
+        if self.fingerprints is None:
+            fingerprints: dict[tuple, _Element] = {}
+            for child in self.element:
+                if isinstance(child.tag, str) and child.get(_STYLE_NAME):
+                    fingerprints.setdefault(style_fingerprint(child), child)
+            self.fingerprints = fingerprints
+        return self.fingerprints
+
+    def remove(self, child: _Element) -> None:
+        """Forget a style about to be removed from the container."""
+        if not isinstance(child.tag, str):
+            return
+        if self.duplicates or child is self.first_default:
+            # another style may take its place
+            self._build(skip=child)
+            return
+        # an equivalent style may take its place
+        self.fingerprints = None
+        for map_name, key in self._keys(child):
+            mapping = getattr(self, map_name)
+            if mapping.get(key) is child:
+                del mapping[key]
+
+
+class StyleIndex:
+    """Index of the styles of the "content.xml" and "styles.xml" parts of
+    a document (internal).
+
+    The styles are found by family and name, by display name, and the
+    default style of a family, with dict lookups instead of XPath queries
+    on the style containers. Each container is indexed on its first use.
+
+    The index follows the modifications done by the Document methods
+    (insert_style(), delete_styles(), merge_styles_from()). Other
+    modifications are detected from the mutation counters of the style
+    containers of the XML trees: the index is read again when they add,
+    remove or replace style containers or change the number or the last of
+    their children. For other modifications, like a style renamed in place,
+    the index is marked as dirty: a found style is checked against the
+    searched keys and against the styles placed before it in the search
+    order, and a style not found is searched in the containers before the
+    index is read again.
+    """
+
+    __slots__ = (
+        "_automatic_names",
+        "_containers",
+        "_counts",
+        "_dirty",
+        "_names",
+        "_next_unique",
+        "_resolved",
+        "_roots",
+        "_signature",
+        "_style_counts",
+        "content",
+        "styles",
+    )
+
+    def __init__(self, content: Content, styles: Styles) -> None:
+        self.content = content
+        self.styles = styles
+        self._roots: dict[str, _Element] = {
+            CONTENT: content.root._xml_element,
+            STYLES: styles.root._xml_element,
+        }
+        self._containers: dict[tuple[str, str], _ContainerIndex | None] = {}
+        # Inherited properties of the styles, by family, name and area
+        self._resolved: dict[tuple[str, str, str | None], PropDict | None] = {}
+        # Highest index of the generated names, by prefix and family
+        self._automatic_names: dict[tuple[str, str], int] = {}
+        # Names of all the styles, and next index to try by base name
+        self._names: set[str] | None = None
+        self._next_unique: dict[str, int] = {}
+        self._counts: tuple[int, ...] = ()
+        self._style_counts: tuple[int, ...] = ()
+        # The XML trees were modified since the containers were indexed
+        self._dirty = False
+        self._signature: tuple[tuple[_Element, int, _Element | None], ...] = ()
+        self.invalidate()
+
+    def _mutation_counts(self) -> tuple[int, ...]:
+        return tuple(_tree_mutation_count(root) for root in self._roots.values())
+
+    def _style_mutation_counts(self) -> tuple[int, ...]:
+        return tuple(_tree_style_mutation_count(root) for root in self._roots.values())
+
+    def _get_signature(self) -> tuple[tuple[_Element, int, _Element | None], ...]:
+        """Return the style containers of the parts, with their number of
+        children and their last child."""
+        return tuple(
+            (child, len(child), child[-1] if len(child) else None)
+            for root in self._roots.values()
+            for child in root
+            if child.tag in _STYLE_CONTAINER_TAGS
+        )
+
+    def _reset(self) -> None:
+        self._dirty = False
+        self._containers = {}
+        self._resolved = {}
+        self._automatic_names = {}
+        self._names = None
+        self._next_unique = {}
+
+    def invalidate(self) -> None:
+        """Forget the indexed containers, they are read again on next use."""
+        self._reset()
+        self._counts = self._mutation_counts()
+        self._style_counts = self._style_mutation_counts()
+        self._signature = self._get_signature()
+
+    def sync(self) -> None:
+        """Accept the current state of the XML trees as indexed, after the
+        index was updated along with a modification."""
+        self._resolved = {}
+        self._counts = self._mutation_counts()
+        self._style_counts = self._style_mutation_counts()
+        self._signature = self._get_signature()
+
+    def check(self) -> None:
+        """Invalidate the index if the style containers were modified.
+
+        The inherited properties are forgotten on any modification of the
+        XML trees, since the properties of a style may have changed."""
+        counts = self._mutation_counts()
+        if counts == self._counts:
+            return
+        self._counts = counts
+        self._resolved = {}
+        style_counts = self._style_mutation_counts()
+        if style_counts == self._style_counts:
+            # the style containers and their styles are unchanged
+            return
+        self._style_counts = style_counts
+        signature = self._get_signature()
+        if signature != self._signature:
+            self._reset()
+            self._signature = signature
+        else:
+            # the styles may have been modified in place
+            self._dirty = True
+
+    def _container(self, key: tuple[str, str]) -> _ContainerIndex | None:
+        try:
+            return self._containers[key]
+        except KeyError:
+            pass
+        element = self._roots[key[0]].find(key[1])
+        index = None if element is None else _ContainerIndex(element)
+        self._containers[key] = index
+        return index
+
+    def _lookup(
+        self,
+        family: str,
+        name: str | None,
+        display_name: str | None,
+        part: str | None,
+    ) -> tuple[_ContainerIndex, _Element] | None:
+        tag, family_attr = _style_key(family)
+        for key in _get_family_containers(family):
+            if part is not None and key[0] != part:
+                continue
+            index = self._container(key)
+            if index is None:
+                continue
+            if name:
+                found = index.names.get((tag, family_attr, name))
+            elif display_name:
+                found = index.display_names.get((tag, family_attr, display_name))
+            elif family_attr is None:
+                found = index.first_default
+            else:
+                found = index.default_styles.get(family_attr)
+            if found is not None:
+                return index, found
+        return None
+
+    @staticmethod
+    def _matches(
+        element: _Element,
+        family: str,
+        name: str | None,
+        display_name: str | None,
+    ) -> bool:
+        """Check that a style has the searched keys."""
+        if not isinstance(element.tag, str):
+            return False
+        tag, family_attr = _style_key(family)
+        keys = set(_ContainerIndex._keys(element))
+        if name:
+            return ("names", (tag, family_attr, name)) in keys
+        if display_name:
+            return ("display_names", (tag, family_attr, display_name)) in keys
+        if family_attr is None:
+            return element.tag == _DEFAULT_STYLE
+        return ("default_styles", family_attr) in keys
+
+    def _is_valid(
+        self,
+        index: _ContainerIndex,
+        found: _Element,
+        family: str,
+        name: str | None,
+        display_name: str | None,
+        part: str | None,
+    ) -> bool:
+        """Check that a found style is still in the container with the
+        searched keys. If the index is dirty, check also that no style placed
+        before it in the search order now has the same keys."""
+        if found.getparent() is not index.element:
+            return False
+        if not self._matches(found, family, name, display_name):
+            return False
+        if not self._dirty:
+            return True
+        if name:
+            xpath, value = _XP_NAMED, name
+        elif display_name:
+            xpath, value = _XP_DISPLAY_NAMED, display_name
+        else:
+            xpath = None
+        for key in _get_family_containers(family):
+            if part is not None and key[0] != part:
+                continue
+            container = self._container(key)
+            if container is None:
+                continue
+            if xpath is None:
+                candidates = container.element.iterchildren(_DEFAULT_STYLE)
+            else:
+                candidates = iter(
+                    xpath_return_elements(xpath, container.element, {"value": value})
+                )
+            for candidate in candidates:
+                if self._matches(candidate, family, name, display_name):
+                    return candidate is found
+            if container is index:
+                break
+        return True
+
+    def _is_missing(
+        self,
+        family: str,
+        name: str | None,
+        display_name: str | None,
+        part: str | None,
+    ) -> bool:
+        """Check in the containers that a style not found in the dirty index
+        does not exist, without reading the containers again."""
+        if name:
+            xpath, value = _XP_NAMED, name
+        elif display_name:
+            xpath, value = _XP_DISPLAY_NAMED, display_name
+        else:
+            return False
+        for key in _get_family_containers(family):
+            if part is not None and key[0] != part:
+                continue
+            index = self._container(key)
+            if index is not None and xpath_return_elements(
+                xpath, index.element, {"value": value}
+            ):
+                return False
+        return True
+
+    def _is_used(self, name: str) -> bool:
+        """Check in all the style containers if a name is used."""
+        return any(
+            xpath_return_elements(_XP_NAMED, container, {"value": name})
+            for root in self._roots.values()
+            for container in root
+            if container.tag in _STYLE_CONTAINER_TAGS
+        )
+
+    def get_style_element(
+        self,
+        family: str,
+        name: str | None = None,
+        display_name: str | None = None,
+        part: str | None = None,
+    ) -> _Element | None:
+        """Return the lxml element of a style, or None if not found.
+
+        Args:
+            family: The style family, a key of FAMILY_MAPPING.
+            name: The internal name of the style.
+            display_name: The display name of the style, used if no name
+                is given.
+            part: CONTENT or STYLES to search only in one part.
+
+        Returns:
+            _Element | None: The lxml element of the style.
+        """
+        self.check()
+        result = self._lookup(family, name, display_name, part)
+        if result is None:
+            if not self._dirty or self._is_missing(family, name, display_name, part):
+                return None
+        elif self._is_valid(*result, family, name, display_name, part):
+            return result[1]
+        self._reset()
+        result = self._lookup(family, name, display_name, part)
+        if result is None:
+            return None
+        return result[1]
+
+    def get_style(
+        self,
+        family: str,
+        name: str | None = None,
+        display_name: str | None = None,
+        part: str | None = None,
+    ) -> Element | None:
+        """Return a style by family and name, by display name, or the default
+        style of the family if no name is given.
+
+        The search follows Document.get_style(): the styles of "content.xml"
+        are searched before the styles of "styles.xml".
+
+        Args:
+            family: The style family, a key of FAMILY_MAPPING.
+            name: The internal name of the style.
+            display_name: The display name of the style, used if no name
+                is given.
+            part: CONTENT or STYLES to search only in one part.
+
+        Returns:
+            Element | None: The style, or None if not found.
+        """
+        found = self.get_style_element(family, name, display_name, part)
+        if found is None:
+            return None
+        return Element.from_tag(found)
+
+    def iter_parent_styles(self, family: str, name: str) -> Iterator[Element]:
+        """Iterate on the parent styles of a style, nearest first.
+
+        The chain stops at the first missing parent, or at a loop.
+
+        Args:
+            family: The style family, a key of FAMILY_MAPPING.
+            name: The internal name of the style.
+
+        Yields:
+            Element: The successive parent styles.
+        """
+        seen = {name}
+        found = self.get_style_element(family, name)
+        while found is not None:
+            parent_name = found.get(_PARENT_STYLE_NAME)
+            if not parent_name or parent_name in seen:
+                return
+            seen.add(parent_name)
+            found = self.get_style_element(family, parent_name)
+            if found is not None:
+                yield Element.from_tag(found)
+
+    def resolve_properties(
+        self,
+        family: str,
+        name: str,
+        area: str | None = None,
+    ) -> PropDict | None:
+        """Return the properties of a style merged with the properties of
+        its parent styles and of the default style of its family.
+
+        The result is kept until the next modification of the XML trees.
+
+        Args:
+            family: The style family, a key of FAMILY_MAPPING.
+            name: The internal name of the style.
+            area: The area of the properties, by default the family.
+
+        Returns:
+            PropDict | None: A copy of the inherited properties, or None if
+                the style is not found.
+        """
+        self.check()
+        key = (family, name, area)
+        try:
+            resolved = self._resolved[key]
+        except KeyError:
+            resolved = self._resolved[key] = self._resolve(family, name, area)
+        if resolved is None:
+            return None
+        return dict(resolved)
+
+    def _resolve(
+        self,
+        family: str,
+        name: str,
+        area: str | None,
+    ) -> PropDict | None:
+        style = self.get_style(family, name)
+        if style is None:
+            return None
+        chain = [style, *self.iter_parent_styles(family, name)]
+        if family in FAMILY_ODF_STD:
+            default = self.get_style(family)
+            if default is not None:
+                chain.append(default)
+        properties: PropDict = {}
+        for element in reversed(chain):
+            get_properties = getattr(element, "get_properties", None)
+            if get_properties is None:
+                continue
+            properties.update(get_properties(area=area or family) or {})
+        return properties
+
+    def next_automatic_name(
+        self,
+        prefix: str,
+        family: str,
+        existing: Callable[[], Iterable[str]],
+    ) -> str:
+        """Return a new name made of the prefix and the next index, for a
+        style of the family.
+
+        The highest index used by the names of the family is computed once
+        from the existing names, then incremented by each call and by the
+        styles added to the index.
+
+        Args:
+            prefix: The prefix of the generated names.
+            family: The style family.
+            existing: Function returning the names of the existing styles of
+                the family, called the first time only.
+
+        Returns:
+            str: The new name.
+        """
+        self.check()
+        key = (prefix, family)
+        last = self._automatic_names.get(key)
+        if (
+            last is not None
+            and self._dirty
+            and self.get_style_element(family, f"{prefix}{last + 1}") is not None
+        ):
+            # a style was renamed in place
+            last = None
+        if last is None:
+            last = 0
+            for name in existing():
+                if not name or not name.startswith(prefix):
+                    continue
+                with contextlib.suppress(ValueError):
+                    last = max(last, int(name[len(prefix) :]))
+        self._automatic_names[key] = last + 1
+        return f"{prefix}{last + 1}"
+
+    def _note_automatic_name(self, element: _Element, name: str) -> None:
+        """Update the highest indexes of generated names with the name of an
+        added style."""
+        tag = element.tag
+        if tag in (_STYLE, _DEFAULT_STYLE):
+            family = element.get(_FAMILY)
+        else:
+            family = _TAG_FAMILY.get(tag)
+        for key, last in self._automatic_names.items():
+            prefix, key_family = key
+            if key_family != family or not name.startswith(prefix):
+                continue
+            with contextlib.suppress(ValueError):
+                self._automatic_names[key] = max(last, int(name[len(prefix) :]))
+
+    def unique_name(self, base: str, existing: Callable[[], Iterable[str]]) -> str:
+        """Return the first name "base_X" not used by a style, X being an
+        integer starting at 0.
+
+        The names of the styles are read once from the existing names, then
+        kept up to date with the styles added to the index.
+
+        Args:
+            base: The base of the name.
+            existing: Function returning the names of all the existing
+                styles, called the first time only.
+
+        Returns:
+            str: The new name.
+        """
+        self.check()
+        for _ in range(2):
+            if self._names is None:
+                self._names = set(existing())
+                self._next_unique = {}
+            idx = self._next_unique.get(base, 0)
+            while f"{base}_{idx}" in self._names:
+                idx += 1
+            self._next_unique[base] = idx
+            if not self._dirty or not self._is_used(f"{base}_{idx}"):
+                break
+            # a style was renamed in place
+            self._names = None
+        return f"{base}_{idx}"
+
+    def find_equivalent(self, element: _Element, part: str = CONTENT) -> str | None:
+        """Return the name of an automatic style equivalent to the given
+        style, i.e. with the same tag, attributes and content.
+
+        Args:
+            element: The lxml element of a style.
+            part: The part of the automatic styles, CONTENT or STYLES.
+
+        Returns:
+            str | None: The name of the equivalent style, or None.
+        """
+        self.check()
+        fingerprint = style_fingerprint(element)
+        for _ in range(2):
+            index = self._container((part, _AUTOMATIC_STYLES))
+            if index is None:
+                return None
+            found = index.build_fingerprints().get(fingerprint)
+            if found is None:
+                return None
+            if (
+                found is not element
+                and found.getparent() is index.element
+                and style_fingerprint(found) == fingerprint
+            ):
+                return found.get(_STYLE_NAME)
+            # the style was modified in place
+            index.fingerprints = None
+        return None
+
+    def dedupe_automatic_styles(self) -> int:
+        """Merge the equivalent automatic styles of the indexed parts, and
+        rewrite the references to the removed styles.
+
+        Styles whose name is used by several styles of the document are
+        kept, so references can be rewritten without knowing the family of
+        the referenced style.
+
+        Returns:
+            int: The number of removed styles.
+        """
+        names: Counter[str] = Counter(
+            name
+            for root in self._roots.values()
+            for container in root
+            if container.tag in _STYLE_CONTAINER_TAGS
+            for child in container
+            if isinstance(child.tag, str) and (name := child.get(_STYLE_NAME))
+        )
+        removed = 0
+        for part in (self.content, self.styles):
+            root = self._roots[CONTENT if part is self.content else STYLES]
+            container = root.find(_AUTOMATIC_STYLES)
+            if container is None:
+                continue
+            kept: dict[tuple, str] = {}
+            renamed: dict[str, str] = {}
+            for child in list(container):
+                if not isinstance(child.tag, str):
+                    continue
+                name = child.get(_STYLE_NAME)
+                if not name or names[name] != 1:
+                    continue
+                kept_name = kept.setdefault(style_fingerprint(child), name)
+                if kept_name != name:
+                    renamed[name] = kept_name
+                    container.remove(child)
+            if not renamed:
+                continue
+            removed += len(renamed)
+            _rename_references(root, renamed)
+            part.mark_modified()
+        if removed:
+            self.invalidate()
+        return removed
+
+    def is_indexed_tree(self, element: _Element) -> bool:
+        """Return True if the element belongs to the XML tree of one of the
+        indexed parts.
+
+        Args:
+            element: A lxml element.
+        """
+        root = element.getroottree().getroot()
+        return any(root is indexed for indexed in self._roots.values())
+
+    def add(self, element: _Element) -> None:
+        """Update the index with a style appended to a style container.
+
+        Args:
+            element: The lxml element of the appended style.
+        """
+        container = element.getparent()
+        for index in self._containers.values():
+            if index is not None and index.element is container:
+                index.add(element)
+                break
+        name = element.get(_STYLE_NAME) or element.get(_DRAW_NAME)
+        if name:
+            if self._names is not None:
+                self._names.add(name)
+            if self._automatic_names:
+                self._note_automatic_name(element, name)
+        self.sync()
+
+    def remove(self, element: _Element) -> None:
+        """Update the index before a style is removed from its container.
+
+        Args:
+            element: The lxml element of the style.
+        """
+        container = element.getparent()
+        for index in self._containers.values():
+            if index is not None and index.element is container:
+                index.remove(element)
+                break
+        # the lowest free names may have changed
+        self._names = None
+        self._next_unique = {}
@@ -37,28 +37,28 @@ if TYPE_CHECKING:
 
 
 CONTEXT_MAPPING = {
-    "paragraph": ("//office:styles", "//office:automatic-styles"),
-    "text": ("//office:styles", "//office:automatic-styles"),
-    "graphic": ("//office:styles", "//office:automatic-styles"),
-    "page-layout": ("//office:automatic-styles",),
-    "master-page": ("//office:master-styles",),
-    "font-face": ("//office:font-face-decls",),
-    "outline": ("//office:styles", "//office:automatic-styles"),
-    "date": ("//office:styles", "//office:automatic-styles"),
-    "list": ("//office:styles", "//office:automatic-styles"),
-    "presentation": ("//office:styles", "//office:automatic-styles"),
-    "drawing-page": ("//office:automatic-styles",),
-    "presentation-page-layout": ("//office:styles",),
-    "marker": ("//office:styles",),
-    "fill-image": ("//office:styles",),
+    "paragraph": ("office:styles", "office:automatic-styles"),
+    "text": ("office:styles", "office:automatic-styles"),
+    "graphic": ("office:styles", "office:automatic-styles"),
+    "page-layout": ("office:automatic-styles",),
+    "master-page": ("office:master-styles",),
+    "font-face": ("office:font-face-decls",),
+    "outline": ("office:styles", "office:automatic-styles"),
+    "date": ("office:styles", "office:automatic-styles"),
+    "list": ("office:styles", "office:automatic-styles"),
+    "presentation": ("office:styles", "office:automatic-styles"),
+    "drawing-page": ("office:automatic-styles",),
+    "presentation-page-layout": ("office:styles",),
+    "marker": ("office:styles",),
+    "fill-image": ("office:styles",),
     # FIXME Do they?
-    "table": ("//office:styles", "//office:automatic-styles"),
-    "table-cell": ("//office:styles", "//office:automatic-styles"),
-    "table-row": ("//office:styles", "//office:automatic-styles"),
-    "table-column": ("//office:styles", "//office:automatic-styles"),
+    "table": ("office:styles", "office:automatic-styles"),
+    "table-cell": ("office:styles", "office:automatic-styles"),
+    "table-row": ("office:styles", "office:automatic-styles"),
+    "table-column": ("office:styles", "office:automatic-styles"),
     # FIXME: to test:
-    "section": ("//office:styles", "//office:automatic-styles"),
-    "chart": ("//office:styles", "//office:automatic-styles"),
+    "section": ("office:styles", "office:automatic-styles"),
+    "chart": ("office:styles", "office:automatic-styles"),
 }
 
 
@@ -83,20 +83,20 @@ class Styles(XmlPart):
             list[Element]: A list of XML elements that are contexts for styles.
         """
         if automatic:
-            elems = [self.get_element("//office:automatic-styles")]
+            elems = [self._get_root_child("office:automatic-styles")]
         elif family:
-            queries = CONTEXT_MAPPING.get(family) or (
-                "//office:styles",
-                "//office:automatic-styles",
+            tags = CONTEXT_MAPPING.get(family) or (
+                "office:styles",
+                "office:automatic-styles",
             )
-            elems = [self.get_element(query) for query in queries]
+            elems = [self._get_root_child(tag) for tag in tags]
         else:
             # All possibilities
             elems = [
-                self.get_element("//office:automatic-styles"),
-                self.get_element("//office:styles"),
-                self.get_element("//office:master-styles"),
-                self.get_element("//office:font-face-decls"),
+                self._get_root_child("office:automatic-styles"),
+                self._get_root_child("office:styles"),
+                self._get_root_child("office:master-styles"),
+                self._get_root_child("office:font-face-decls"),
             ]
         return [e for e in elems if isinstance(e, Element)]
 
@@ -225,7 +225,7 @@ class Styles(XmlPart):
             OfficeMasterStyles | None: The "office:master-styles" element, or None if not found.
         """
         return cast(
-            OfficeMasterStyles | None, self.get_element("//office:master-styles")
+            OfficeMasterStyles | None, self._get_root_child("office:master-styles")
         )
 
     @office_master_styles.setter
@@ -282,7 +282,7 @@ class Styles(XmlPart):
         """
         return cast(
             OfficeAutomaticStyles | None,
-            self.get_element("//office:automatic-styles"),
+            self._get_root_child("office:automatic-styles"),
         )
 
     @office_automatic_styles.setter
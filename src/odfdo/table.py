@@ -30,24 +30,25 @@ import csv
 import os
 from collections.abc import Iterable, Iterator
 from io import StringIO
-from itertools import zip_longest
+from itertools import chain, groupby, islice, zip_longest
 from pathlib import Path
 from textwrap import wrap
 from typing import TYPE_CHECKING, Any, cast
 from warnings import warn
 
-from lxml.etree import XPath  # ty: ignore[unresolved-import]
+from lxml.etree import SubElement  # ty: ignore[unresolved-import]
 
-from .cell import Cell
+from .cell import Cell, _append_cell_xml
 from .column import Column
 from .const import BODY_ALLOW_NAMED_RANGE_TAGS, CellValue
 from .datatype import Boolean, Date, DateTime, Duration
 from .element import (
+    FIRST_CHILD,
     Element,
     EText,
+    _get_lxml_tag,
     register_element_class,
     xpath_compile,
-    xpath_return_elements,
 )
 from .form import FormMixin
 from .frame import Frame
@@ -57,7 +58,14 @@ from .named_range import NamedRange, table_name_check
 from .office_forms import OfficeFormsMixin
 from .row import Row
 from .row_group import RowGroup
-from .table_cache import _XP_COLUMN_IDX, _XP_ROW_IDX, TableCache
+from .table_cache import (
+    _XP_COLUMN,
+    _XP_COLUMN_IDX,
+    _XP_ROW,
+    _XP_ROW_IDX,
+    AreaIndex,
+    TableCache,
+)
 from .utils import (
     convert_coordinates,
     digit_to_alpha,
@@ -72,15 +80,9 @@ if TYPE_CHECKING:
 # for compatibility with version <= 3.18.1
 BODY_NR_TAGS = BODY_ALLOW_NAMED_RANGE_TAGS
 
-_XP_ROW = xpath_compile(
-    "table:table-row|table:table-rows/table:table-row|"
-    "table:table-header-rows/table:table-row|"
-    "table:table-row-group/child::table:table-row"
-)
-_XP_COLUMN = xpath_compile(
-    "table:table-column|table:table-columns/table:table-column|"
-    "table:table-header-columns/table:table-column"
-)
+_ROW_TAG = _get_lxml_tag("table:table-row")
+_ROWS_REPEATED = _get_lxml_tag("table:number-rows-repeated")
+_COLUMNS_REPEATED = _get_lxml_tag("table:number-columns-repeated")
 _XP_ROW_GROUP = xpath_compile(
     "table:table-row-group|table:table-row-group/child::table:table-row-group"
 )
@@ -132,6 +134,166 @@ def _get_python_value(
     return data
 
 
+def _csv_number(data: str) -> int | float:
+    try:
+        return int(data)
+    except ValueError:
+        return float(data)
+
+
+def _csv_datetime(data: str) -> CellValue:
+    if "T" in data or " " in data:
+        return DateTime.decode(data.replace(" ", "T"))
+    raise ValueError(data)
+
+
+def _csv_date(data: str) -> CellValue:
+    try:
+        _csv_datetime(data)
+    except ValueError:
+        return Date.decode(data)
+    # a value with a time part is not truncated to its date
+    raise ValueError(data)
+
+
+def _csv_boolean(data: str) -> bool:
+    return Boolean.decode(data.lower())
+
+
+# Conversions of the CSV values for each column type, in the order of
+# _get_python_value()
+CSV_TYPES: dict[str, Any] = {
+    "number": _csv_number,
+    "int": int,
+    "float": float,
+    "datetime": _csv_datetime,
+    "date": _csv_date,
+    "duration": Duration.decode,
+    "boolean": _csv_boolean,
+    "string": str,
+    "auto": None,
+}
+_CSV_GUESSED_TYPES = ("number", "datetime", "date", "duration", "boolean")
+# Number of lines used to sniff the CSV dialect
+_CSV_SNIFF_LINES = 2048
+# Number of rows used to guess the type of the columns
+_CSV_SAMPLE_ROWS = 1000
+
+
+def _guess_csv_column_type(values: list[str], encoding: str) -> str:
+    """Guess the type of a column of CSV values.
+
+    The first value, often a header, is not used to guess the type, it is
+    converted like the other values not matching the type of the column.
+    Returns "auto" if the values have different types, so they are
+    converted one by one.
+    """
+    body = [value for value in values[1:] if value]
+    if not body:
+        return "auto"
+    for type_name in _CSV_GUESSED_TYPES:
+        convert = CSV_TYPES[type_name]
+        try:
+            for value in body:
+                convert(value)
+        except ValueError:
+            continue
+        return type_name
+    if all(isinstance(_get_python_value(v, encoding), str) for v in values):
+        return "string"
+    return "auto"
+
+
+def _make_csv_converter(type_name: str, encoding: str) -> Any:
+    """Return the function converting the CSV values of a column.
+
+    A value not matching the type of the column is converted like with
+    _get_python_value().
+    """
+    if type_name not in CSV_TYPES:
+        msg = f"Unknown CSV type {type_name!r}, expected one of {list(CSV_TYPES)}"
+        raise ValueError(msg)
+    convert = CSV_TYPES[type_name]
+    if convert is None:
+        return lambda value: _get_python_value(value, encoding)
+    if convert is str:
+        return str
+
+    def converter(value: str) -> CellValue:
+        if not value:
+            return value
+        try:
+            return convert(value)
+        except ValueError:
+            return _get_python_value(value, encoding)
+
+    return converter
+
+
+def iter_csv_values(
+    lines: Iterable[str],
+    types: Iterable[str | None] | None = None,
+    encoding: str = "utf-8",
+    **fmtparams: Any,
+) -> Iterator[list[CellValue]]:
+    """Yield the values of the rows of a CSV content, converted to Python
+    types.
+
+    The CSV dialect is sniffed from the first lines, and the type of each
+    column is guessed from the first rows, then all the values of the
+    column are converted with that type, the values not matching it being
+    converted one by one. The lines are read while the rows are yielded.
+
+    Args:
+        lines: The lines of the CSV content, e.g. an opened text file.
+        types: The types of the columns, overriding the guessed ones: one
+            of "auto", "string", "number", "int", "float", "date",
+            "datetime", "duration" or "boolean". None or "auto" let the
+            values of the column be converted one by one.
+        encoding: The encoding used if some values are bytes.
+        **fmtparams: Additional keyword arguments for the `csv.reader`
+            method.
+
+    Returns:
+        Iterator[list[CellValue]]: The values of each row, without the
+            empty values at the end of the row.
+    """
+    line_iter = iter(lines)
+    head = list(islice(line_iter, _CSV_SNIFF_LINES))
+    dialect = csv.Sniffer().sniff("".join(head))
+    reader = csv.reader(chain(head, line_iter), dialect=dialect, **fmtparams)
+    sample = []
+    for line in islice(reader, _CSV_SAMPLE_ROWS):
+        # rstrip line
+        while line and not line[-1].strip():
+            line.pop()
+        sample.append(line)
+    forced = list(types or [])
+    width = max((len(line) for line in sample), default=0)
+    converters = []
+    for idx in range(max(width, len(forced))):
+        type_name = forced[idx] if idx < len(forced) else None
+        if not type_name:
+            column = [line[idx] if idx < len(line) else "" for line in sample]
+            type_name = _guess_csv_column_type(column, encoding)
+        converters.append(_make_csv_converter(type_name, encoding))
+    auto = _make_csv_converter("auto", encoding)
+
+    def convert(line: list[str]) -> list[CellValue]:
+        if len(line) > len(converters):
+            converters.extend([auto] * (len(line) - len(converters)))
+        return [
+            converter(value) for converter, value in zip(converters, line, strict=False)
+        ]
+
+    for line in sample:
+        yield convert(line)
+    for line in reader:
+        while line and not line[-1].strip():
+            line.pop()
+        yield convert(line)
+
+
 class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
     """A table, typically used in a spreadsheet or other ODF document,
     represented by "table:table".
@@ -252,36 +414,20 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         write_content(csv_writer)
         return out.getvalue()
 
-    def get_elements(self, xpath_query: XPath | str) -> list[Element]:
-        """Get a list of elements matching the XPath query.
-
-        The query is applied to the current table element.
-
-        Args:
-            xpath_query: The XPath query string or a compiled XPath object.
+    def _get_cache(self) -> tuple:
+        """Returns the table cache, to be copied to the elements found
+        under the table.
 
         Returns:
-            list[Element]: A list of matching elements, cloned from the
-                original XML tree.
+            tuple: The table cache, and no row cache.
         """
-        if isinstance(xpath_query, str):
-            elements = xpath_return_elements(
-                xpath_compile(xpath_query),
-                self._xml_element,
-            )
-        else:
-            elements = xpath_return_elements(
-                xpath_query,
-                self._xml_element,
-            )
-        cache = (self._table_cache, None)
-        return [Element.from_tag_for_clone(e, cache) for e in elements]
+        return (self._table_cache, None)
 
     def clear(self) -> None:
         """Remove all children, text content, and attributes from the table
         element."""
-        self._xml_element.clear()
-        self._table_cache = TableCache()
+        super().clear()
+        self._table_cache = TableCache(self._xml_element)
 
     def _translate_y_from_any(self, y: str | int) -> int:
         """Translate a 'y' coordinate from any format to a 0-based integer
@@ -426,14 +572,8 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         return (x, y)
 
     def _compute_table_cache(self) -> None:
-        idx_repeated_seq = self.elements_repeated_sequence(
-            _XP_ROW, "table:number-rows-repeated"
-        )
-        self._table_cache.make_row_map(idx_repeated_seq)
-        idx_repeated_seq = self.elements_repeated_sequence(
-            _XP_COLUMN, "table:number-columns-repeated"
-        )
-        self._table_cache.make_col_map(idx_repeated_seq)
+        # The maps are read again from the XML on next positional access
+        self._table_cache.invalidate(self._xml_element)
 
     def _update_width(self, row: Row) -> None:
         """Synchronize the number of columns if the row is bigger.
@@ -446,8 +586,8 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
 
     def _get_formatted_text_normal(self, context: dict | None) -> str:
         result = []
-        for row in self.iter_rows():
-            for cell in row.iter_cells():
+        for row in self.iter_rows(view=True):
+            for cell in row.iter_cells(view=True):
                 value = cell.get_value(try_get_text=False)
                 # None ?
                 if value is None:
@@ -668,6 +808,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         if self.name:
             for named_range in self.get_named_ranges(table_name=self.name):
                 named_range.set_table_name(valid_name)
+            self._table_cache.named_ranges.clear()
         self.set_attribute("table:name", valid_name)
 
     @property
@@ -794,7 +935,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         else:
             x = y = z = t = None
         data = []
-        for row in self.iter_rows(start=y, end=t):
+        for _y, repeat, row in self.iter_row_runs(start=y, end=t):
             if z is None:
                 width = self.width
             else:
@@ -814,9 +955,10 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
                 else:
                     values.extend([None] * (width - len(values)))
             if flat:
-                data.extend(values)
+                data.extend(values * repeat)
             else:
                 data.append(values)
+                data.extend(values.copy() for _ in range(repeat - 1))
         return data
 
     @property
@@ -871,7 +1013,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             x, y, z, t = self._translate_table_coordinates(coord)
         else:
             x = y = z = t = None
-        for row in self.iter_rows(start=y, end=t):
+        for _y, repeat, row in self.iter_row_runs(start=y, end=t):
             if z is None:
                 width = self.width
             else:
@@ -891,6 +1033,60 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
                 else:
                     values.extend([None] * (width - len(values)))
             yield values
+            for _ in range(repeat - 1):
+                yield values.copy()
+
+    def get_columns_values(
+        self,
+        coord: tuple | list | str | None = None,
+        get_type: bool = False,
+    ) -> (
+        list[list[CellValue | None]]
+        | tuple[list[list[CellValue | None]], list[list[str | None]]]
+    ):
+        """Get the values of the table, column by column.
+
+        The table is read in one pass, each run of repeated rows or cells
+        being decoded once. The result is the transposition of
+        `get_values(coord)`: a list of columns, each column being the list
+        of the values of its cells, with None for empty cells.
+
+        Args:
+            coord: The coordinates of the area to parse (e.g., "A1:C3" or
+                (0, 0, 2, 2)). If None, the entire table is parsed.
+            get_type: If True, also returns the ODF types of the cells, as a
+                list of columns of types.
+
+        Returns:
+            list[list[CellValue | None]]: The list of columns of values, or
+                a tuple (columns of values, columns of types) if `get_type`
+                is True.
+        """
+        if coord:
+            x, y, z, t = self._translate_table_coordinates(coord)
+        else:
+            x = y = z = t = None
+        start = 0 if x is None else x
+        end = self.width - 1 if z is None else min(z, self.width - 1)
+        width = max(end - start + 1, 0)
+        columns: list[list[CellValue | None]] = [[] for _ in range(width)]
+        types: list[list[str | None]] = [[] for _ in range(width)]
+        for _y, repeat_y, row in self.iter_row_runs(start=y, end=t):
+            idx = 0
+            for row_x, repeat_x, value, value_type in row._iter_value_runs(start, end):
+                idx = row_x - start
+                for _ in range(repeat_x):
+                    columns[idx].extend([value] * repeat_y)
+                    if get_type:
+                        types[idx].extend([value_type] * repeat_y)
+                    idx += 1
+            for column_idx in range(idx, width):
+                columns[column_idx].extend([None] * repeat_y)
+                if get_type:
+                    types[column_idx].extend([None] * repeat_y)
+        if get_type:
+            return columns, types
+        return columns
 
     def set_values(
         self,
@@ -1148,23 +1344,27 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
     def _get_rows(self) -> list[Row]:
         return cast(list[Row], self.get_elements(_XP_ROW))
 
-    def iter_rows(
+    def iter_row_runs(
         self,
         start: int | None = None,
         end: int | None = None,
-    ) -> Iterator[Row]:
-        """Yield row elements, expanding repetitions.
+    ) -> Iterator[tuple[int, int, Row]]:
+        """Yield the runs of repeated rows, without expanding repetitions.
 
-        This method produces individual row objects. The same row object is
-        yielded as many times as it is repeated. The yielded columns are
-        copies; use `set_row()` to apply changes.
+        Each run is a tuple (y, repeat, row): the position of the first row
+        of the run, the number of rows of the run within the requested
+        range, and the Row element itself, not a copy. A row repeated a
+        million times is thus handled once. The Row should not be modified
+        through this method, since the modification would apply to the whole
+        run; use `set_row()` to apply changes.
 
         Args:
             start: The starting row index (0-based). Defaults to 0.
             end: The ending row index (inclusive). Defaults to 2**32.
 
         Yields:
-            Row: The next row element in the specified range.
+            tuple[int, int, Row]: The position, the repetition and the Row
+                of the next run in the specified range.
         """
         if start is None:
             start = 0
@@ -1173,15 +1373,57 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             end = 2**32
         if end < start:
             return
-        y = -1
-        for row in self._yield_odf_rows():
-            y += 1
-            if y < start:
-                continue
-            if y > end:
+        y = 0
+        for row in self._get_rows():
+            repeated = row.repeated
+            if repeated is None:
+                repeated = 1
+            last = y + repeated - 1
+            if last >= start and repeated > 0:
+                first = max(y, start)
+                row.y = first
+                yield first, min(last, end) - first + 1, row
+            if last >= end:
                 return
-            row.y = y
-            yield row
+            y += max(repeated, 0)
+
+    def iter_rows(
+        self,
+        start: int | None = None,
+        end: int | None = None,
+        view: bool = False,
+    ) -> Iterator[Row]:
+        """Yield row elements, expanding repetitions.
+
+        This method produces individual row objects. The same row object is
+        yielded as many times as it is repeated. The yielded columns are
+        copies; use `set_row()` to apply changes.
+
+        With `view` set to True, the repeated rows are not copied: the same
+        Row element is yielded for each repetition, with its `y` attribute
+        updated. This read-only mode avoids cloning the XML of long runs of
+        repeated rows.
+
+        Args:
+            start: The starting row index (0-based). Defaults to 0.
+            end: The ending row index (inclusive). Defaults to 2**32.
+            view: If True, do not copy the repeated rows.
+
+        Yields:
+            Row: The next row element in the specified range.
+        """
+        for y, repeat, row in self.iter_row_runs(start, end):
+            if row.repeated is None:
+                yield row
+                continue
+            for idx in range(repeat):
+                if view:
+                    current = row
+                else:
+                    current = row.clone
+                    current.repeated = None
+                current.y = y + idx
+                yield current
 
     traverse = iter_rows
 
@@ -1229,16 +1471,6 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         # fixme : not clones ?
         return list(self.iter_rows())
 
-    def _yield_odf_rows(self) -> Iterator[Row]:
-        for row in self._get_rows():
-            if row.repeated is None:
-                yield row
-            else:
-                for _ in range(row.repeated):
-                    row_copy = row.clone
-                    row_copy.repeated = None
-                    yield row_copy
-
     def _get_row2(self, y: int, clone: bool = True, create: bool = True) -> Row:
         if y >= self.height:
             if create:
@@ -1356,18 +1588,29 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
     def extend_rows(self, rows: Iterable[Row] | None = None) -> None:
         """Append a list of rows to the end of the table.
 
+        The rows are not copied. The table cache is updated with the new
+        rows, and columns are appended if a new row is wider than the table.
+
         Args:
             rows: An iterable of Row elements to append.
         """
         if rows is None:
             rows = []
+        rows = list(rows)
+        if not rows:
+            return
+        # The height is read before the rows are in the XML table
+        y = self.height
         self.extend(rows)
-        self._compute_table_cache()
+        cache = self._table_cache
+        width = 0
+        for row in rows:
+            repeated = row.repeated or 1
+            cache.insert_row_map_once(repeated)
+            row.y = y
+            y += repeated
+            width = max(width, row.width)
         # Update width if necessary
-        width = self.width
-        for row in self.iter_rows():
-            if row.width > width:
-                width = row.width
         diff = width - self.width
         if diff > 0:
             self.append_column(Column(repeated=diff))
@@ -1405,10 +1648,10 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         self._table_cache.insert_row_map_once(_repeated)
         row.y = self.height - 1
         # Initialize columns
-        if not self._get_columns():
-            repeated = row.width
-            self.insert(Column(repeated=repeated), position=0)
-            self._compute_table_cache()
+        if not self._table_cache.col_map_length():
+            column = Column(repeated=row.width)
+            self.insert(column, position=0)
+            self._table_cache.insert_col_map_once(column.repeated or 1)
         # Update width if necessary
         self._update_width(row)
         return row
@@ -1710,6 +1953,10 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             raise ValueError
         cell.x = x
         cell.y = y
+        # the index of spans, if built, is kept unless a span is changed
+        spans = self._table_cache.spans_outside(x, y)
+        if spans is not None and cell.is_spanned():
+            spans = None
         if y >= self.height:
             row = Row()
             cell_back = row.set_cell(x, cell, clone=clone)
@@ -1730,6 +1977,8 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
                 cell_back = row.set_cell(x, cell, clone=clone)
                 # Update width if necessary, since we don't use set_row
                 self._update_width(row)
+        if spans is not None:
+            self._table_cache.spans = spans
         return cell_back
 
     def set_cells(
@@ -1959,6 +2208,8 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         if row is None:
             raise ValueError
         row.delete_cell(x)
+        # the next spanned cells of the row are moved
+        self._table_cache.spans = None
         # self.set_row(y, row)
 
     # Columns
@@ -2253,10 +2504,10 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             cell_type = cell_type.lower().strip()
         cells: list[Cell | None] = []
         if not style and not content and not cell_type:
-            for row in self.iter_rows():
+            for row in self.iter_rows(view=True):
                 cells.append(row.get_cell(x, clone=True))
             return cells
-        for row in self.iter_rows():
+        for row in self.iter_rows(view=True):
             cell = row.get_cell(x, clone=True)
             if cell is None:
                 raise ValueError
@@ -2537,6 +2788,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             global_scope: If True (default), appends to the document body.
                 If False, appends to the current table.
         """
+        self._table_cache.named_ranges.clear()
         if global_scope:
             body = self.document_body
             if not body:
@@ -2575,6 +2827,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             global_scope: If True (default), inserts into the document body.
                 If False, inserts into the current table.
         """
+        self._table_cache.named_ranges.clear()
         name = name.strip()
         if not name:
             raise ValueError("Name required")
@@ -2611,6 +2864,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             global_scope: If True (default), searches the entire document.
                 If False, searches only the current table.
         """
+        self._table_cache.named_ranges.clear()
         name = name.strip()
         if not name:
             raise ValueError("Name required")
@@ -2628,6 +2882,53 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         else:
             self._local_delete_named_range(name)
 
+    def named_ranges_at(
+        self,
+        coord: tuple | list | str,
+        global_scope: bool = True,
+    ) -> list[NamedRange]:
+        """Return the named ranges of the table containing the cell at the
+        given coordinates.
+
+        The rectangles of the named ranges of the table are indexed on the
+        first call, the index is updated by the named range methods of the
+        table.
+
+        Args:
+            coord: The coordinates of the cell (e.g., "B12" or (1, 11)).
+            global_scope: If True (default), searches the entire document.
+                If False, searches only the current table.
+
+        Returns:
+            list[NamedRange]: The matching NamedRange elements, in document
+                order.
+        """
+        x, y = self._translate_cell_coordinates(coord)
+        if x is None or y is None:
+            raise ValueError(f"Wrong cell coordinates: {coord!r}")
+        cache = self._table_cache
+        for _retry in range(2):
+            index = cache.named_ranges.get(global_scope)
+            if index is None:
+                index = AreaIndex()
+                named_ranges = self.get_named_ranges(
+                    table_name=self.name, global_scope=global_scope
+                )
+                for order, named_range in enumerate(named_ranges):
+                    address = named_range.get_attribute("table:cell-range-address")
+                    index.add(named_range.crange, (order, address, named_range))
+                cache.named_ranges[global_scope] = index
+            found = sorted(index.at(x, y), key=lambda item: item[0])
+            # a named range modified outside of the table API: index again
+            if all(
+                named_range._xml_element.getparent() is not None
+                and named_range.get_attribute("table:cell-range-address") == address
+                for _order, address, named_range in found
+            ):
+                break
+            cache.named_ranges.pop(global_scope, None)
+        return [named_range for _order, _address, named_range in found]
+
     #
     # Cell span
     #
@@ -2673,8 +2974,11 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
             raise ValueError
         if t is None:
             raise ValueError
-        # check for previous span
-        good = True
+        # check for previous span, the index is read before any cell is
+        # modified
+        spans = self._table_cache.spans
+        if spans.intersects((x, y, z, t)):
+            return False
         # Check boundaries and empty cells : need to crate non existent cells
         # so don't use get_cells directly, but get_cell
         cells = []
@@ -2685,15 +2989,6 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
                     self.get_cell((xx, yy), clone=True, keep_repeated=False)
                 )
             cells.append(row_cells)
-        for row in cells:
-            for cell in row:
-                if cell.is_spanned():
-                    good = False
-                    break
-            if not good:
-                break
-        if not good:
-            return False
         # Check boundaries
         # if z >= self.width or t >= self.height:
         #    self.set_cell(coord = end)
@@ -2729,8 +3024,10 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         for row in cells[1:]:
             for cell in row:
                 cell.tag = "table:covered-table-cell"
-        # replace cells in table
+        # replace cells in table, keeping the index of spans up to date
         self.set_cells(cells, coord=start, clone=False)
+        spans.add((x, y, z, t), (x, y, z, t))
+        self._table_cache.spans = spans
         return True
 
     def del_span(self, area: str | tuple | list) -> bool:
@@ -2755,6 +3052,8 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         if y is None:
             raise ValueError
         start = x, y
+        # the index is read before any cell is modified
+        spans = self._table_cache.spans
         # check for previous span
         cell0 = self.get_cell(start)
         nb_cols = cell0.get_attribute_integer("table:number-columns-spanned")
@@ -2773,10 +3072,39 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         for row in cells[1:]:
             for cell in row:
                 cell.tag = "table:table-cell"
-        # replace cells in table
+        # replace cells in table, keeping the index of spans up to date
         self.set_cells(cells, coord=start, clone=False)
+        spans.remove((x, y, z, t), (x, y, z, t))
+        self._table_cache.spans = spans
         return True
 
+    def get_span_at(
+        self,
+        coord: tuple | list | str,
+    ) -> tuple[int, int, int, int] | None:
+        """Return the spanned area covering the cell at the given coordinates.
+
+        The spanned areas of the table are indexed on the first call. The
+        index is updated by set_span() and del_span(), and read again after
+        other modifications of the table, including the rows or cells
+        edited in place.
+
+        Args:
+            coord: The coordinates of the cell (e.g., "B12" or (1, 11)).
+
+        Returns:
+            tuple[int, int, int, int] | None: The coordinates (x, y, z, t) of
+                the spanned area, or None if the cell is not in a spanned
+                area.
+        """
+        x, y = self._translate_cell_coordinates(coord)
+        if x is None or y is None:
+            raise ValueError(f"Wrong cell coordinates: {coord!r}")
+        found = self._table_cache.spans.at(x, y)
+        if not found:
+            return None
+        return found[0]
+
     # Utilities
 
     def to_csv(
@@ -2787,6 +3115,9 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
     ) -> str | None:
         """Export the table as a CSV string or file.
 
+        When a path is given, the rows are written to the file while they
+        are read.
+
         Args:
             path_or_file: The path to save the CSV file to.
                 If None, the CSV content is returned as a string.
@@ -2799,22 +3130,19 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
                 otherwise None.
         """
 
-        def write_content(csv_writer: object) -> None:
-            for values in self.iter_values():
-                line = []
-                for value in values:
-                    if value is None:
-                        value = ""
-                    line.append(value)
-                csv_writer.writerow(line)
+        def write_content(csv_writer: Any) -> None:
+            csv_writer.writerows(
+                ["" if value is None else value for value in values]
+                for values in self.iter_values()
+            )
 
-        content = StringIO(newline="")
-        csv_writer = csv.writer(content, dialect=dialect, **fmtparams)
-        write_content(csv_writer)
         if path_or_file:
-            # windows fix: write file as binary
-            Path(path_or_file).write_bytes(content.getvalue().encode())
+            # windows fix: no newline translation, utf-8 whatever the locale
+            with Path(path_or_file).open("w", newline="", encoding="utf-8") as file:
+                write_content(csv.writer(file, dialect=dialect, **fmtparams))
             return None
+        content = StringIO(newline="")
+        write_content(csv.writer(content, dialect=dialect, **fmtparams))
         return content.getvalue()
 
     @classmethod
@@ -2823,6 +3151,7 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         content: str,
         name: str,
         style: str | None = None,
+        types: Iterable[str | None] | None = None,
         **fmtparams: Any,
     ) -> Table:
         """Import a CSV string into a new Table object.
@@ -2830,33 +3159,97 @@ class Table(MDTable, FormMixin, OfficeFormsMixin, Element):
         The CSV format can be auto-detected to a certain extent. Use
         `**fmtparams` to define `csv.reader` parameters for more control.
 
+        The type of each column is guessed from its first values, see
+        iter_csv_values().
+
         Args:
             content: The CSV content as a string.
             name: The name of the table to create.
             style: The style to apply to the table.
+            types: The types of the columns, overriding the guessed ones.
             **fmtparams: Additional keyword arguments for the `csv.reader`
                 method.
 
         Returns:
             Table: A new Table object populated with the CSV data.
         """
-        data = content.splitlines(True)
-        # Sniff the dialect
-        sample = "".join(data[:2048])
-        dialect = csv.Sniffer().sniff(sample)
-        # Make the rows
-        reader = csv.reader(data, dialect=dialect, **fmtparams)
+        encoding = fmtparams.pop("encoding", "utf-8")
+        values = iter_csv_values(
+            content.splitlines(True),
+            types=types,
+            encoding=encoding,
+            **fmtparams,
+        )
+        return cls.from_values(name, values, style=style)
+
+    @classmethod
+    def from_values(
+        cls,
+        name: str,
+        values: Iterable[Iterable[CellValue | None]],
+        style: str | None = None,
+        cell_style: str | None = None,
+        cell_type: str | None = None,
+        currency: str | None = None,
+    ) -> Table:
+        """Create a new Table from a matrix of values.
+
+        The rows and cells are built directly as XML, without Cell or Row
+        wrappers: identical adjacent cells are merged into a repeated cell,
+        and identical adjacent rows into a repeated row. The table cache is
+        computed once at the end. This is much faster than `set_values()` to
+        build a big table.
+
+        Args:
+            name: The name of the table to create.
+            values: An iterable of iterables of Python values, one per row.
+            style: The style to apply to the table.
+            cell_style: The name of a cell style to apply to the cells.
+            cell_type: The value type for the cells (e.g., 'float').
+            currency: A three-letter currency code (e.g., 'USD').
+
+        Returns:
+            Table: A new Table object populated with the values.
+        """
         table = cls(name, style=style)
-        encoding = fmtparams.get("encoding", "utf-8")
-        for line in reader:
-            row = Row()
-            # rstrip line
-            while line and not line[-1].strip():
-                line.pop()
-            for value in line:
-                cell = Cell(_get_python_value(value, encoding))
-                row.append_cell(cell, clone=False)
-            table.append_row(row, clone=False)
+        table_element = table._xml_element
+        width = 0
+
+        def make_row(cell_keys: tuple) -> Any:
+            row = SubElement(table_element, _ROW_TAG)
+            for key, run in groupby(cell_keys):
+                _append_cell_xml(
+                    row,
+                    key[1],
+                    sum(1 for _cell in run),
+                    cell_style,
+                    cell_type,
+                    currency,
+                )
+            return row
+
+        previous_keys: tuple | None = None
+        previous_row = None
+        row_repeat = 0
+        for row_values in values:
+            if not isiterable(row_values):
+                # guard against str iterable
+                row_values = [row_values]  # ty: ignore[invalid-assignment]
+            cell_keys = tuple((type(value), value) for value in row_values)
+            if previous_row is not None and cell_keys == previous_keys:
+                row_repeat += 1
+                continue
+            if row_repeat > 1:
+                previous_row.set(_ROWS_REPEATED, str(row_repeat))
+            previous_row = make_row(cell_keys)
+            previous_keys = cell_keys
+            row_repeat = 1
+            width = max(width, len(cell_keys))
+        if previous_row is not None and row_repeat > 1:
+            previous_row.set(_ROWS_REPEATED, str(row_repeat))
+        if width:
+            table.insert(Column(repeated=width), xmlposition=FIRST_CHILD)
+        table._compute_table_cache()
         return table
 
 
@@ -21,19 +21,37 @@
 
 from __future__ import annotations
 
-from bisect import bisect_left, insort
-from typing import TYPE_CHECKING
-
-from .element import xpath_compile
+import contextlib
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any
+
+from .element import (
+    _get_lxml_tag,
+    _tree_mutation_stamp,
+    xpath_compile,
+    xpath_return_elements,
+)
 
 if TYPE_CHECKING:
-    from lxml.etree import XPath  # ty: ignore[unresolved-import]
+    from lxml.etree import XPath, _Element  # ty: ignore[unresolved-import]
 
     from .cell import Cell
     from .column import Column
     from .row import Row
     from .table import Table
 
+_XP_ROW = xpath_compile(
+    "table:table-row|table:table-rows/table:table-row|"
+    "table:table-header-rows/table:table-row|"
+    "table:table-row-group/child::table:table-row"
+)
+_XP_COLUMN = xpath_compile(
+    "table:table-column|table:table-columns/table:table-column|"
+    "table:table-header-columns/table:table-column"
+)
+_XP_CELL = xpath_compile("(table:table-cell|table:covered-table-cell)")
 _XP_ROW_IDX = xpath_compile(
     "(table:table-row|table:table-rows/table:table-row|"
     "table:table-header-rows/table:table-row|"
@@ -44,21 +62,316 @@ _XP_COLUMN_IDX = xpath_compile(
     "table:table-header-columns/table:table-column)[$idx]"
 )
 _XP_CELL_IDX = xpath_compile("(table:table-cell|table:covered-table-cell)[$idx]")
+_ROWS_REPEATED = _get_lxml_tag("table:number-rows-repeated")
+_COLUMNS_REPEATED = _get_lxml_tag("table:number-columns-repeated")
+_ROWS_SPANNED = _get_lxml_tag("table:number-rows-spanned")
+_COLUMNS_SPANNED = _get_lxml_tag("table:number-columns-spanned")
+_XP_SPANNED_CELL = xpath_compile(
+    "descendant::table:table-cell"
+    "[@table:number-columns-spanned or @table:number-rows-spanned]"
+)
 
 
-def _make_cache_map(idx_repeated_seq: list[tuple[int, int]]) -> list[int]:
-    """Build the initial cache map of the table."""
-    cache_map: list[int] = []
-    for odf_idx, repeated in idx_repeated_seq:
-        cache_map = _insert_map_once(cache_map, odf_idx, repeated)
-    return cache_map
+# Maximum number of items in a block of PositionMap
+_BLOCK_SIZE = 512
+
+
+class PositionMap:
+    """Map of the positions of the repeated items of a vault (internal).
+
+    Item at index idx (the ODF index of a cell, row or column) covers the
+    positions up to map[idx], its repetition being map[idx] - map[idx - 1].
+    The items are stored in blocks of cumulated repetitions, relative to the
+    start of the block, along with the cumulated numbers of items and of
+    positions at the end of each block. Finding an item by index or by
+    position is a bisection of the blocks then of one block, and inserting
+    or erasing an item only shifts one block and the block ends.
+    """
+
+    __slots__ = ("_blocks", "_idx_ends", "_pos_ends")
+
+    def __init__(self, repeats: Iterable[int] = ()) -> None:
+        cumulated = list(accumulate(repeats))
+        self._blocks: list[list[int]] = []
+        start = 0
+        for i in range(0, len(cumulated), _BLOCK_SIZE):
+            block = cumulated[i : i + _BLOCK_SIZE]
+            self._blocks.append([value - start for value in block])
+            start = block[-1]
+        self._idx_ends: list[int] = []
+        self._pos_ends: list[int] = []
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Compute the cumulated numbers of items and positions at the end
+        of each block."""
+        self._idx_ends = list(accumulate(len(block) for block in self._blocks))
+        self._pos_ends = list(accumulate(block[-1] for block in self._blocks))
+
+    def __len__(self) -> int:
+        return self._idx_ends[-1] if self._idx_ends else 0
+
+    def __iter__(self) -> Iterator[int]:
+        before = -1
+        for block in self._blocks:
+            for value in block:
+                yield before + value
+            before += block[-1]
+
+    def __getitem__(self, idx: int) -> int:
+        if idx < 0:
+            idx += len(self)
+        block_idx, offset = self._locate(idx)
+        return self._pos_before(block_idx) + self._blocks[block_idx][offset] - 1
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> PositionMap:
+        new_map = PositionMap()
+        new_map._blocks = [block[:] for block in self._blocks]
+        new_map._idx_ends = self._idx_ends[:]
+        new_map._pos_ends = self._pos_ends[:]
+        return new_map
+
+    def total(self) -> int:
+        """Return the number of positions, i.e. the sum of repetitions."""
+        return self._pos_ends[-1] if self._pos_ends else 0
+
+    def _pos_before(self, block_idx: int) -> int:
+        """Return the number of positions before the block."""
+        return self._pos_ends[block_idx - 1] if block_idx else 0
+
+    def _locate(self, idx: int) -> tuple[int, int]:
+        """Return the block and the offset in the block of the item at
+        index idx."""
+        if not 0 <= idx < len(self):
+            raise IndexError
+        block_idx = bisect_right(self._idx_ends, idx)
+        if block_idx:
+            idx -= self._idx_ends[block_idx - 1]
+        return block_idx, idx
+
+    def repeated(self, idx: int) -> int:
+        """Return the repetition of the item at index idx."""
+        block_idx, offset = self._locate(idx)
+        block = self._blocks[block_idx]
+        if offset:
+            return block[offset] - block[offset - 1]
+        return block[0]
+
+    def bisect(self, position: int) -> int:
+        """Return the index of the item covering the position, or the length
+        of the map if the position is beyond the last item."""
+        block_idx = bisect_right(self._pos_ends, position)
+        if block_idx == len(self._blocks):
+            return len(self)
+        offset = bisect_right(
+            self._blocks[block_idx], position - self._pos_before(block_idx)
+        )
+        if block_idx:
+            return self._idx_ends[block_idx - 1] + offset
+        return offset
+
+    def _shift(self, block_idx: int, offset: int, delta: int) -> None:
+        """Add delta to the cumulated repetitions from the offset of the
+        block, and to the positions at the end of the following blocks."""
+        block = self._blocks[block_idx]
+        block[offset:] = [value + delta for value in block[offset:]]
+        pos_ends = self._pos_ends
+        pos_ends[block_idx:] = [value + delta for value in pos_ends[block_idx:]]
+
+    def insert(self, idx: int, repeated: int) -> None:
+        """Insert an item of given repetition at index idx."""
+        length = len(self)
+        if not 0 <= idx <= length:
+            raise IndexError
+        if idx == length:
+            if not self._blocks or len(self._blocks[-1]) >= _BLOCK_SIZE:
+                # appending a new block keeps the map of a growing vault
+                # in blocks of optimal size
+                self._blocks.append([repeated])
+                self._idx_ends.append(length + 1)
+                self._pos_ends.append(self.total() + repeated)
+                return
+            block_idx = len(self._blocks) - 1
+            offset = len(self._blocks[block_idx])
+        else:
+            block_idx, offset = self._locate(idx)
+        block = self._blocks[block_idx]
+        block.insert(offset, block[offset - 1] if offset else 0)
+        self._shift(block_idx, offset, repeated)
+        if len(block) > 2 * _BLOCK_SIZE:
+            start = block[_BLOCK_SIZE - 1]
+            tail = [value - start for value in block[_BLOCK_SIZE:]]
+            del block[_BLOCK_SIZE:]
+            self._blocks.insert(block_idx + 1, tail)
+            self._reindex()
+            return
+        idx_ends = self._idx_ends
+        idx_ends[block_idx:] = [value + 1 for value in idx_ends[block_idx:]]
+
+    def erase(self, idx: int) -> None:
+        """Remove the item at index idx."""
+        repeated = self.repeated(idx)
+        block_idx, offset = self._locate(idx)
+        block = self._blocks[block_idx]
+        del block[offset]
+        if not block:
+            del self._blocks[block_idx]
+            self._reindex()
+            return
+        self._shift(block_idx, offset, -repeated)
+        idx_ends = self._idx_ends
+        idx_ends[block_idx:] = [value - 1 for value in idx_ends[block_idx:]]
+
+    def add(self, idx: int, delta: int) -> None:
+        """Change the repetition of the item at index idx."""
+        block_idx, offset = self._locate(idx)
+        self._shift(block_idx, offset, delta)
+
+
+# Number of rows of a block of AreaIndex
+_AREA_BLOCK_ROWS = 64
+# Areas covering more blocks are not stored in blocks
+_AREA_MAX_BLOCKS = 16
+
+
+class AreaIndex:
+    """Spatial index of rectangular areas of a table (internal).
+
+    An area (x, y, z, t) covers the cells from (x, y) to (z, t) included.
+    The areas are stored in the blocks of rows they cover, so finding the
+    areas containing a cell only tests the few areas of its block instead
+    of all the areas. The areas covering a lot of rows are stored apart
+    and always tested.
+    """
+
+    __slots__ = ("_blocks", "_large")
+
+    def __init__(self) -> None:
+        self._blocks: dict[int, list[tuple[tuple[int, int, int, int], Any]]] = {}
+        self._large: list[tuple[tuple[int, int, int, int], Any]] = []
+
+    def _buckets(
+        self, area: tuple[int, int, int, int]
+    ) -> Iterator[list[tuple[tuple[int, int, int, int], Any]]]:
+        first = area[1] // _AREA_BLOCK_ROWS
+        last = area[3] // _AREA_BLOCK_ROWS
+        if last - first >= _AREA_MAX_BLOCKS:
+            yield self._large
+            return
+        for block in range(first, last + 1):
+            yield self._blocks.setdefault(block, [])
+
+    def add(self, area: tuple[int, int, int, int], item: Any) -> None:
+        """Add an item covering the area."""
+        for bucket in self._buckets(area):
+            bucket.append((area, item))
+
+    def remove(self, area: tuple[int, int, int, int], item: Any) -> None:
+        """Remove the item covering the area, if present."""
+        for bucket in self._buckets(area):
+            with contextlib.suppress(ValueError):
+                bucket.remove((area, item))
+
+    def at(self, x: int, y: int) -> list[Any]:
+        """Return the items whose area contains the cell (x, y)."""
+        found = []
+        for bucket in (self._blocks.get(y // _AREA_BLOCK_ROWS, ()), self._large):
+            for (left, top, right, bottom), item in bucket:
+                if left <= x <= right and top <= y <= bottom:
+                    found.append(item)
+        return found
+
+    def intersects(self, area: tuple[int, int, int, int]) -> bool:
+        """Return True if the area of an item has a cell in the area."""
+        x, y, z, t = area
+        first = y // _AREA_BLOCK_ROWS
+        last = t // _AREA_BLOCK_ROWS
+        if last - first + 1 > len(self._blocks):
+            buckets = [
+                bucket
+                for block, bucket in self._blocks.items()
+                if first <= block <= last
+            ]
+        else:
+            buckets = [self._blocks.get(block, []) for block in range(first, last + 1)]
+        buckets.append(self._large)
+        for bucket in buckets:
+            for (left, top, right, bottom), _item in bucket:
+                if left <= z and x <= right and top <= t and y <= bottom:
+                    return True
+        return False
+
+
+def _read_spans(source: _Element | None) -> AreaIndex:
+    """Build the index of the spanned areas of the source XML table."""
+    spans = AreaIndex()
+    if source is None:
+        return spans
+    # rows containing spanned cells, cells of sub tables are ignored
+    rows = {cell.getparent() for cell in _XP_SPANNED_CELL(source)}
+    if not rows:
+        return spans
+    y = 0
+    for row in xpath_return_elements(_XP_ROW, source):
+        rows_repeated = _span_value(row, _ROWS_REPEATED)
+        if row in rows:
+            x = 0
+            for cell in xpath_return_elements(_XP_CELL, row):
+                columns = _span_value(cell, _COLUMNS_SPANNED)
+                lines = _span_value(cell, _ROWS_SPANNED)
+                cells_repeated = _span_value(cell, _COLUMNS_REPEATED)
+                if columns > 1 or lines > 1:
+                    # each repetition of the cell is a spanned cell
+                    for yy in range(y, y + rows_repeated):
+                        for xx in range(x, x + cells_repeated):
+                            area = (xx, yy, xx + columns - 1, yy + lines - 1)
+                            spans.add(area, area)
+                x += cells_repeated
+        y += rows_repeated
+    return spans
+
+
+def _span_value(element: _Element, lxml_tag: str) -> int:
+    """Return the positive integer value of the attribute, default 1."""
+    value = element.get(lxml_tag)
+    if value is None:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:  # pragma: nocover
+        return 1
+
+
+def _read_cache_map(
+    source: _Element | None,
+    xpath: XPath,
+    lxml_tag: str,
+) -> PositionMap:
+    """Build the cache map from the repetitions of the sub elements of the
+    source XML element."""
+    if source is None:
+        return PositionMap()
+    repeats: list[int] = []
+    for sub_element in xpath_return_elements(xpath, source):
+        value = sub_element.get(lxml_tag)
+        if value is None:
+            repeats.append(1)
+            continue
+        try:
+            repeats.append(max(int(value), 1))
+        except ValueError:  # pragma: nocover
+            repeats.append(1)
+    return PositionMap(repeats)
 
 
 def _insert_map_once(
-    cache_map: list[int],
+    cache_map: PositionMap,
     odf_idx: int,
     repeated: int,
-) -> list[int]:
+) -> PositionMap:
     """Add an item (cell or row) to the map.
 
     Args:
@@ -68,39 +381,18 @@ def _insert_map_once(
 
     odf_idx is NOT position (col or row), neither raw XML position, but ODF index
     """
-    repeated = repeated or 1
-    if odf_idx > len(cache_map):
-        raise IndexError
-    if odf_idx > 0:
-        before = cache_map[odf_idx - 1]
-    else:
-        before = -1
-    juska = before + repeated  # aka max position value for item
-    if odf_idx == len(cache_map):
-        insort(cache_map, juska)
-        return cache_map
-    new_map = cache_map[:odf_idx]
-    new_map.append(juska)
-    new_map.extend([(x + repeated) for x in cache_map[odf_idx:]])
-    return new_map
+    cache_map.insert(odf_idx, repeated or 1)
+    return cache_map
 
 
-def _erase_map_once(cache_map: list[int], odf_idx: int) -> list[int]:
+def _erase_map_once(cache_map: PositionMap, odf_idx: int) -> PositionMap:
     """Remove an item (cell or row) from the map.
 
     Args:
         cache_map: Cache map.
         odf_idx: Index in ODF XML.
     """
-    if odf_idx >= len(cache_map):
-        raise IndexError
-    if odf_idx > 0:
-        before = cache_map[odf_idx - 1]
-    else:
-        before = -1
-    current = cache_map[odf_idx]
-    repeated = current - before
-    cache_map = cache_map[:odf_idx] + [(x - repeated) for x in cache_map[odf_idx + 1 :]]
+    cache_map.erase(odf_idx)
     return cache_map
 
 
@@ -110,8 +402,8 @@ def _insert_item_in_vault(
     idx: int,
     current_item: Cell | Row | Column,
     vault: Row | Table,
-    vault_map: list[int],
-) -> tuple[list[int], Cell | Row | Column]:
+    vault_map: PositionMap,
+) -> tuple[PositionMap, Cell | Row | Column]:
     repeated = item.repeated or 1
     target_idx = vault.index(current_item)
     current_cache = vault_map[idx]
@@ -150,10 +442,10 @@ def _set_item_in_vault(
     idx: int,
     current_item: Cell | Row | Column,
     vault: Row | Table,
-    vault_map: list[int],
+    vault_map: PositionMap,
     vault_scheme: XPath,
     clone: bool = True,
-) -> tuple[list[int], Cell | Row | Column]:
+) -> tuple[PositionMap, Cell | Row | Column]:
     """Set the item (cell, row) in its vault (row, table), updating the cache
     map.
 
@@ -237,42 +529,53 @@ def _delete_item_in_vault(
     idx: int,
     current_item: Cell | Row | Column,
     vault: Row | Table,
-    vault_map: list[int],
-) -> list[int]:
-    current_cache = vault_map[idx]
-    if idx > 0:
-        before_cache = vault_map[idx - 1]
-    else:
-        before_cache = -1
-    # current_pos = before_cache + 1
-    current_repeated = current_cache - before_cache
-    new_repeated = current_repeated - 1
+    vault_map: PositionMap,
+) -> PositionMap:
+    new_repeated = vault_map.repeated(idx) - 1
     if new_repeated >= 1:
         current_item._set_repeated(new_repeated)
-        emap = vault_map[:idx] + [(x - 1) for x in vault_map[idx:]]
+        vault_map.add(idx, -1)
     else:
         # actual erase
         vault.delete(current_item)
-        emap = vault_map[:idx] + [(x - 1) for x in vault_map[idx + 1 :]]
-    return emap
+        vault_map.erase(idx)
+    return vault_map
 
 
 class RowCache:
     """Cache for Row (internal)."""
 
-    __slots__ = ("cell_elements", "cell_map")
+    __slots__ = ("_cell_map", "_source", "cell_elements")
 
-    def __init__(self) -> None:
-        self.cell_map: list[int] = []
+    def __init__(self, source: _Element | None = None) -> None:
+        # The map is read from the source XML row on first access
+        self._source: _Element | None = source
+        self._cell_map: PositionMap | None = None
         self.cell_elements: dict[int, Cell] = {}
 
+    @property
+    def cell_map(self) -> PositionMap:
+        if self._cell_map is None:
+            self._cell_map = _read_cache_map(self._source, _XP_CELL, _COLUMNS_REPEATED)
+        return self._cell_map
+
+    @cell_map.setter
+    def cell_map(self, cell_map: PositionMap) -> None:
+        self._cell_map = cell_map
+
+    def invalidate(self, source: _Element) -> None:
+        """Mark the cell map as outdated, it will be read again from the
+        source XML row on next access."""
+        self._source = source
+        self._cell_map = None
+
     def __str__(self) -> str:
         return f"RC cell:{self.cell_map!r}"
 
     @classmethod
     def copy(cls, source: RowCache) -> RowCache:
         rc = cls()
-        rc.cell_map = source.cell_map[:]
+        rc.cell_map = source.cell_map.copy()
         return rc
 
     def width(self) -> int:
@@ -282,17 +585,14 @@ class RowCache:
         Returns:
             int: The number of expected cells in the row.
         """
-        try:
-            return self.cell_map[-1] + 1
-        except IndexError:
-            return 0
+        return self.cell_map.total()
 
     def clear_cell_indexes(self) -> None:
         self.cell_elements = {}
 
     def cell_idx(self, position: int) -> int | None:
         """Find cell index in the map from the position."""
-        idx = bisect_left(self.cell_map, position)
+        idx = self.cell_map.bisect(position)
         if idx < len(self.cell_map):
             return idx
         return None
@@ -309,14 +609,14 @@ class RowCache:
         self.cell_elements[idx] = cell
 
     def insert_cell_map_once(self, repeated: int) -> None:
+        if self._cell_map is None:
+            # the map will be read with the new cell
+            return
         self.cell_map = _insert_map_once(self.cell_map, len(self.cell_map), repeated)
 
     # def erase_cell_map_once(self, odf_idx: int) -> None:
     #     self.cell_map = _erase_map_once(self.cell_map, odf_idx)
 
-    def make_cell_map(self, idx_repeated_sequence: list[tuple[int, int]]) -> None:
-        self.cell_map = _make_cache_map(idx_repeated_sequence)
-
     def set_cell_in_cache(
         self,
         x: int,
@@ -398,13 +698,91 @@ class RowCache:
 class TableCache:
     """Cache for Table (internal)."""
 
-    __slots__ = ("col_elements", "col_map", "row_elements", "row_map")
-
-    def __init__(self) -> None:
-        self.row_map: list[int] = []
-        self.col_map: list[int] = []
+    __slots__ = (
+        "_col_map",
+        "_row_map",
+        "_source",
+        "_spans",
+        "_spans_stamp",
+        "col_elements",
+        "named_ranges",
+        "row_elements",
+    )
+
+    def __init__(self, source: _Element | None = None) -> None:
+        # The maps are read from the source XML table on first access
+        self._source: _Element | None = source
+        self._row_map: PositionMap | None = None
+        self._col_map: PositionMap | None = None
+        self._spans: AreaIndex | None = None
+        self._spans_stamp: tuple[_Element | None, int] | None = None
         self.row_elements: dict[int, Row] = {}
         self.col_elements: dict[int, Column] = {}
+        # Indexes of the named ranges of the table, by scope
+        self.named_ranges: dict[bool, AreaIndex] = {}
+
+    @property
+    def row_map(self) -> PositionMap:
+        if self._row_map is None:
+            self._row_map = _read_cache_map(self._source, _XP_ROW, _ROWS_REPEATED)
+        return self._row_map
+
+    @row_map.setter
+    def row_map(self, row_map: PositionMap) -> None:
+        self._row_map = row_map
+
+    @property
+    def col_map(self) -> PositionMap:
+        if self._col_map is None:
+            self._col_map = _read_cache_map(self._source, _XP_COLUMN, _COLUMNS_REPEATED)
+        return self._col_map
+
+    @col_map.setter
+    def col_map(self, col_map: PositionMap) -> None:
+        self._col_map = col_map
+
+    def _stamp(self) -> tuple[_Element | None, int] | None:
+        if self._source is None:
+            return None
+        return _tree_mutation_stamp(self._source)
+
+    @property
+    def spans(self) -> AreaIndex:
+        """Index of the spanned areas of the table, as (x, y, z, t).
+
+        The index is read again from the source XML table if the XML tree was
+        modified since the index was built, for example when a row of the
+        table is edited in place.
+        """
+        stamp = self._stamp()
+        if self._spans is None or stamp != self._spans_stamp:
+            self._spans = _read_spans(self._source)
+            self._spans_stamp = stamp
+        return self._spans
+
+    @spans.setter
+    def spans(self, spans: AreaIndex | None) -> None:
+        """Set the index of spans, up to date with the current XML tree."""
+        self._spans = spans
+        self._spans_stamp = self._stamp()
+
+    def spans_outside(self, x: int, y: int) -> AreaIndex | None:
+        """Return the index of spans if it is built, up to date, and no
+        spanned area contains the cell (x, y), so it can be kept after the
+        cell is replaced by a cell not spanned."""
+        if self._spans is None or self._stamp() != self._spans_stamp:
+            return None
+        if self._spans.at(x, y):
+            return None
+        return self._spans
+
+    def invalidate(self, source: _Element) -> None:
+        """Mark the row and column maps as outdated, they will be read again
+        from the source XML table on next access."""
+        self._source = source
+        self._row_map = None
+        self._col_map = None
+        self._spans = None
 
     def __str__(self) -> str:
         return f"TC row:{self.row_map!r} col:{self.col_map!r}"
@@ -412,8 +790,8 @@ class TableCache:
     @classmethod
     def copy(cls, source: TableCache) -> TableCache:
         tc = cls()
-        tc.row_map = source.row_map[:]
-        tc.col_map = source.col_map[:]
+        tc.row_map = source.row_map.copy()
+        tc.col_map = source.col_map.copy()
         return tc
 
     def height(self) -> int:
@@ -422,10 +800,7 @@ class TableCache:
         Returns:
             int: The current height of the table.
         """
-        try:
-            return self.row_map[-1] + 1
-        except IndexError:
-            return 0
+        return self.row_map.total()
 
     def width(self) -> int:
         """Get the current width of the table, measured on columns.
@@ -436,10 +811,7 @@ class TableCache:
         Returns:
             int: The current width of the table.
         """
-        try:
-            return self.col_map[-1] + 1
-        except IndexError:
-            return 0
+        return self.col_map.total()
 
     def clear_row_indexes(self) -> None:
         self.row_elements = {}
@@ -449,14 +821,14 @@ class TableCache:
 
     def row_idx(self, position: int) -> int | None:
         """Find row index in the map from the position."""
-        idx = bisect_left(self.row_map, position)
+        idx = self.row_map.bisect(position)
         if idx < len(self.row_map):
             return idx
         return None
 
     def col_idx(self, position: int) -> int | None:
         """Find column index in the map from the position."""
-        idx = bisect_left(self.col_map, position)
+        idx = self.col_map.bisect(position)
         if idx < len(self.col_map):
             return idx
         return None
@@ -481,23 +853,24 @@ class TableCache:
         self.col_elements[idx] = col
 
     def insert_row_map_once(self, repeated: int) -> None:
+        self._spans = None
+        if self._row_map is None:
+            # the map will be read with the new row
+            return
         self.row_map = _insert_map_once(self.row_map, len(self.row_map), repeated)
 
     # def erase_row_map_once(self, odf_idx: int) -> None:
     #     self.row_map = _erase_map_once(self.row_map, odf_idx)
 
     def insert_col_map_once(self, repeated: int) -> None:
+        if self._col_map is None:
+            # the map will be read with the new column
+            return
         self.col_map = _insert_map_once(self.col_map, len(self.col_map), repeated)
 
     # def erase_col_map_once(self, odf_idx: int) -> None:
     #     self.col_map = _erase_map_once(self.col_map, odf_idx)
 
-    def make_row_map(self, idx_repeated_sequence: list[tuple[int, int]]) -> None:
-        self.row_map = _make_cache_map(idx_repeated_sequence)
-
-    def make_col_map(self, idx_repeated_sequence: list[tuple[int, int]]) -> None:
-        self.col_map = _make_cache_map(idx_repeated_sequence)
-
     def set_row_in_cache(
         self,
         y: int,
@@ -514,6 +887,7 @@ class TableCache:
         if not current_cached_row:
             raise ValueError  # pragma: nocover
         self.clear_row_indexes()
+        self._spans = None
         emap, new_row = _set_item_in_vault(
             y,
             row,
@@ -542,6 +916,7 @@ class TableCache:
         if not current_cached_row:
             raise ValueError  # pragma: nocover
         self.clear_row_indexes()
+        self._spans = None
         emap, new_row = _insert_item_in_vault(
             y,
             row,
@@ -567,6 +942,7 @@ class TableCache:
         if not current_cached_row:
             raise ValueError  # pragma: nocover
         self.clear_row_indexes()
+        self._spans = None
         emap = _delete_item_in_vault(
             idx,
             current_cached_row,
@@ -617,6 +993,7 @@ class TableCache:
         if not current_cached_col:
             raise ValueError  # pragma: nocover
         self.clear_col_indexes()
+        self._spans = None
         emap, new_col = _insert_item_in_vault(
             x,
             column,
@@ -642,6 +1019,7 @@ class TableCache:
         if not current_cached_col:
             raise ValueError  # pragma: nocover
         self.clear_col_indexes()
+        self._spans = None
         emap = _delete_item_in_vault(
             idx,
             current_cached_col,
@@ -485,7 +485,7 @@ class TOC(MDToc, Element):
 
         # Insert default TOC style
         if use_default_styles:
-            automatic_styles = body.get_element("//office:automatic-styles")
+            automatic_styles = body.get_element("/*/office:automatic-styles")
             if isinstance(automatic_styles, Element):  # pragma: nocover
                 for level in range(1, 11):
                     if (
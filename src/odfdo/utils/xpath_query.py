@@ -57,6 +57,7 @@ def make_xpath_query(
     parent_style: str | None = None,
     presentation_class: str | None = None,
     position: int | None = None,
+    variables: dict[str, str] | None = None,
     **kwargs: str,
 ) -> str:
     """Constructs an XPath query string with attribute-based predicates.
@@ -92,6 +93,11 @@ def make_xpath_query(
         presentation_class: The presentation class.
         position: The 1-based index of the element to select
             from the results. Negative values count from the end.
+        variables: If a dict is provided, the attribute values are not
+            embedded in the query but stored in this dict, the query
+            referencing them as XPath variables ($v0, $v1, ...) to be bound
+            at evaluation time. The query string then only depends on the
+            names of the attributes, and its compiled form can be reused.
         **kwargs: Additional attribute-value pairs to add as predicates.
 
     Returns:
@@ -150,6 +156,10 @@ def make_xpath_query(
         value = attributes[qname]
         if value is True:
             query.append(f"[@{qname}]")
+        elif variables is not None:
+            variable = f"v{len(variables)}"
+            variables[variable] = value
+            query.append(f"[@{qname}=${variable}]")
         else:
             query.append(f'[@{qname}="{value}"]')
     query_str = "".join(query)
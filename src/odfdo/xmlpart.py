@@ -27,9 +27,10 @@ access, manipulation, and serialization of specific XML parts of an ODF file.
 
 from __future__ import annotations
 
+import weakref
 from copy import deepcopy
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from lxml.etree import (  # ty: ignore[unresolved-import]
     _Element,
@@ -39,12 +40,22 @@ from lxml.etree import (  # ty: ignore[unresolved-import]
 )
 
 from .container import Container, pretty_indent
-from .element import Element, EText
+from .element import (
+    Element,
+    EText,
+    _get_lxml_tag,
+    _register_tree,
+    _tree_mutation_count,
+    _unregister_tree,
+    _xml_parser,
+)
 
 if TYPE_CHECKING:
     from .body import Body
     from .settings import OfficeSettings
 
+XML_HEADER = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
 
 class XmlPart:
     """Represents an XML part within an ODF document.
@@ -72,19 +83,28 @@ class XmlPart:
         # Internal state
         self.__tree: _ElementTree | None = None
         self.__root: Element | None = None
+        # Mutation count of the tree when its container bytes were last
+        # known to match it, None if they may differ.
+        self.__clean_count: int | None = 0
+        # Direct children of the root already found, by lxml tag
+        self.__root_children: dict[str, _Element] = {}
 
     def _get_tree(self) -> _ElementTree:
         """Loads and returns the XML tree for the part.
 
-        If the tree has not been loaded yet, it reads the part from the
-        container and parses it.
+        If the tree has not been loaded yet, it parses the part while
+        reading it from the container, without loading its bytes first.
 
         Returns:
             _ElementTree: The parsed XML ElementTree object.
         """
         if self.__tree is None:
-            part = self.container.get_part(self.part_name)
-            self.__tree = parse(BytesIO(part))  # ty: ignore[invalid-argument-type]
+            with self.container.open_part(self.part_name) as stream:
+                self.__tree = parse(stream, _xml_parser())
+            root = self.__tree.getroot()
+            _register_tree(root)
+            weakref.finalize(self, _unregister_tree, root)
+            self.__clean_count = _tree_mutation_count(root)
         return self.__tree
 
     def __repr__(self) -> str:
@@ -168,6 +188,31 @@ class XmlPart:
         """
         return self.root.get_element(xpath_query)
 
+    def _get_root_child(self, tag: str) -> Element | None:
+        """Returns the direct child of the root with the given tag, like
+        "office:automatic-styles".
+
+        The child is searched among the children of the root, not in the
+        whole tree, and kept for the next calls while it stays a child of
+        the root.
+
+        Args:
+            tag: The prefixed tag of the child element.
+
+        Returns:
+            Element | None: The child element, or None if not found.
+        """
+        lxml_tag = _get_lxml_tag(tag)
+        root = self._get_tree().getroot()
+        child = self.__root_children.get(lxml_tag)
+        if child is None or child.getparent() is not root:
+            child = root.find(lxml_tag)
+            if child is None:
+                self.__root_children.pop(lxml_tag, None)
+                return None
+            self.__root_children[lxml_tag] = child
+        return Element.from_tag(child)
+
     def delete_element(self, child: Element) -> None:
         """Deletes a specified child element from the XML tree.
 
@@ -188,6 +233,36 @@ class XmlPart:
         """
         return self.root.xpath(xpath_query)
 
+    @property
+    def is_modified(self) -> bool:
+        """True if the XML tree may differ from the bytes of the part in the
+        container.
+
+        Modifications done through the Element API are tracked. A part whose
+        tree was never loaded is not modified.
+        """
+        if self.__tree is None:
+            return False
+        if self.__clean_count is None:
+            return True
+        return _tree_mutation_count(self.__tree.getroot()) != self.__clean_count
+
+    def mark_modified(self) -> None:
+        """Mark the XML part as modified.
+
+        Use it after changing the underlying lxml tree directly, without the
+        Element API, so the part is serialized again when saving.
+        """
+        self._get_tree()
+        self.__clean_count = None
+
+    def mark_saved(self) -> None:
+        """Mark the current XML tree as matching the bytes of the part in the
+        container."""
+        if self.__tree is None:
+            return
+        self.__clean_count = _tree_mutation_count(self.__tree.getroot())
+
     @property
     def clone(self) -> XmlPart:
         """Creates a deep copy of the XmlPart instance.
@@ -203,6 +278,10 @@ class XmlPart:
                 setattr(clone, name, self.container.clone)
             elif name in ("_XmlPart__tree",):
                 setattr(clone, name, None)
+            elif name == "_XmlPart__clean_count":
+                setattr(clone, name, 0)
+            elif name == "_XmlPart__root_children":
+                setattr(clone, name, {})
             else:
                 value = getattr(self, name)
                 value = deepcopy(value)
@@ -221,10 +300,21 @@ class XmlPart:
         """
         if pretty:
             return self.pretty_serialize()
-        xml_header = b'<?xml version="1.0" encoding="UTF-8"?>\n'
-        tree = self._get_tree()
-        bytes_tree = tostring(tree, encoding="unicode").encode("utf8")
-        return xml_header + bytes_tree
+        stream = BytesIO()
+        self.write(stream)
+        return stream.getvalue()
+
+    def write(self, stream: BinaryIO) -> None:
+        """Write the serialized XML part into a binary stream.
+
+        The tree is encoded in UTF-8 while written, without building the
+        whole serialized part in memory.
+
+        Args:
+            stream: The binary stream, like an opened file or Zip member.
+        """
+        stream.write(XML_HEADER)
+        self._get_tree().write(stream, encoding="UTF-8", xml_declaration=False)
 
     def pretty_serialize(self) -> bytes:
         """Serializes the XML part to bytes with pretty-printing.
@@ -233,12 +323,7 @@ class XmlPart:
             bytes: The pretty-printed XML content as bytes, including the
                 XML declaration.
         """
-        xml_header = b'<?xml version="1.0" encoding="UTF-8"?>\n'
-        bytes_tree = tostring(
-            self.custom_pretty_tree(),
-            encoding="unicode",
-        ).encode("utf8")
-        return xml_header + bytes_tree
+        return XML_HEADER + tostring(self.custom_pretty_tree(), encoding="UTF-8")
 
     def custom_pretty_tree(self) -> _ElementTree | _Element:
         """Returns a pretty-printed version of the XML tree.
@@ -250,4 +335,6 @@ class XmlPart:
         """
         tree = self._get_tree()
         root = tree.getroot()
+        # indentation changes the tree in place
+        self.__clean_count = None
         return pretty_indent(root)
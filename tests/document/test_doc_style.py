@@ -25,6 +25,8 @@
 from importlib import resources as rso
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from odfdo.const import (
     ODF_CONTENT,
     ODF_EXTENSIONS,
@@ -407,3 +409,114 @@ def test_insert_style_element_without_family_automatic():
     )
     assert inserted is not None
 
+
+def test_resolve_style_inherited():
+    doc = Document("text")
+    default = doc.get_style("paragraph")
+    default.set_properties(area="text", color="#111111", size="10pt")
+    doc.insert_style(
+        Style("paragraph", name="base", parent_style="Standard", area="text", bold=True)
+    )
+    doc.insert_style(
+        Style("paragraph", name="child", parent_style="base", area="text", italic=True)
+    )
+    props = doc.resolve_style("paragraph", "child", "text")
+    assert props["fo:font-style"] == "italic"
+    assert props["fo:font-weight"] == "bold"
+    assert props["fo:color"] == "#111111"
+    assert props["fo:font-size"] == "10pt"
+
+
+def test_resolve_style_override():
+    doc = Document("text")
+    doc.insert_style(Style("text", name="base", area="text", color="#FF0000"))
+    doc.insert_style(
+        Style("text", name="child", parent_style="base", area="text", color="#00FF00")
+    )
+    assert doc.resolve_style("text", "child")["fo:color"] == "#00FF00"
+    assert doc.resolve_style("text", "base")["fo:color"] == "#FF0000"
+
+
+def test_resolve_style_missing():
+    doc = Document("text")
+    assert doc.resolve_style("paragraph", "missing") is None
+
+
+def test_resolve_style_unknown_family():
+    doc = Document("text")
+    with pytest.raises(ValueError):
+        doc.resolve_style("unknown_family", "Standard")
+
+
+def test_resolve_style_cache_invalidation():
+    doc = Document("text")
+    doc.insert_style(Style("text", name="t1", area="text", color="#FF0000"))
+    props = doc.resolve_style("text", "t1")
+    props["fo:color"] = "changed"
+    assert doc.resolve_style("text", "t1")["fo:color"] == "#FF0000"
+    doc.get_style("text", "t1").set_properties(area="text", color="#0000FF")
+    assert doc.resolve_style("text", "t1")["fo:color"] == "#0000FF"
+    doc.insert_style(Style("text", name="t1", area="text", color="#00FF00"))
+    assert doc.resolve_style("text", "t1")["fo:color"] == "#00FF00"
+
+
+def test_dedupe_automatic_styles():
+    doc = Document("text")
+    doc.body.clear()
+    names = [
+        doc.insert_style(Style("text", area="text", color="#FF0000"), automatic=True)
+        for _ in range(3)
+    ]
+    other = doc.insert_style(
+        Style("text", area="text", color="#0000FF"), automatic=True
+    )
+    paragraph = Element.from_tag("text:p")
+    for name in [*names, other]:
+        span = Element.from_tag("text:span")
+        span.set_attribute("text:style-name", name)
+        paragraph.append(span)
+    doc.body.append(paragraph)
+    assert doc.dedupe_automatic_styles() == 2
+    assert doc.get_style("text", names[0]) is not None
+    assert doc.get_style("text", names[1]) is None
+    assert doc.get_style("text", names[2]) is None
+    used = [span.get_attribute("text:style-name") for span in paragraph.children]
+    assert used == [names[0], names[0], names[0], other]
+    assert doc.content.is_modified
+    assert doc.dedupe_automatic_styles() == 0
+
+
+def test_dedupe_automatic_styles_parent_reference():
+    doc = Document("text")
+    name1 = doc.insert_style(Style("paragraph", italic=True), automatic=True)
+    name2 = doc.insert_style(Style("paragraph", italic=True), automatic=True)
+    child = Style("paragraph", parent_style=name2, bold=True)
+    child_name = doc.insert_style(child, automatic=True)
+    assert doc.dedupe_automatic_styles() == 1
+    assert doc.get_style("paragraph", child_name).parent_style == name1
+
+
+def test_dedupe_automatic_styles_shared_name():
+    doc = Document("text")
+    doc.insert_style(Style("text", name="T1", bold=True), automatic=True)
+    doc.insert_style(Style("text", name="T2", bold=True), automatic=True)
+    # another style, of another family, uses the name "T2"
+    doc.insert_style(Style("paragraph", name="T2"))
+    assert doc.dedupe_automatic_styles() == 0
+    assert doc.get_style("text", "T2") is not None
+
+
+def test_dedupe_automatic_styles_save(tmp_path):
+    doc = Document("text")
+    names = [
+        doc.insert_style(Style("text", italic=True), automatic=True) for _ in range(2)
+    ]
+    paragraph = Element.from_tag("text:p")
+    paragraph.set_attribute("text:style-name", names[1])
+    doc.body.append(paragraph)
+    doc.dedupe_automatic_styles()
+    path = tmp_path / "dedupe.odt"
+    doc.save(path)
+    reloaded = Document(path)
+    assert reloaded.get_style("text", names[1]) is None
+    assert reloaded.body.get_elements("text:p")[-1].style == names[0]
@@ -1026,7 +1026,8 @@ def test_get_cell_style_properties_column_style_none():
     col = sheet.get_column(0)
     col.default_cell_style = None
     props = doc.get_cell_style_properties(0, (0, 0))
-    assert props == {}
+    # the column is a copy, the cell keeps the "Default" style of the column
+    assert props == doc.resolve_style("table-cell", "Default", "table-cell")
 
 
 def test_mimetype_empty_container_old():
@@ -1728,3 +1729,91 @@ def test_save_not_pretty_with_none_xmlpart(samples, tmp_path):
     actual_folder = folder_path.with_suffix(".folder")
     assert actual_folder.exists()
     assert (actual_folder / "content.xml").exists()
+
+
+def test_document_context_manager(samples):
+    with Document(samples("example.odt")) as document:
+        assert document.body is not None
+        zf = document.container._zip_file()
+    assert zf.fp is None
+
+
+def test_document_close_then_read(samples):
+    document = Document(samples("example.odt"))
+    document.close()
+    assert document.get_part(ODF_STYLES) is not None
+
+
+def test_document_close_empty_container():
+    document = Document(None)
+    document.container = None
+    document.close()
+
+
+def test_iter_part_chunks_binary(samples):
+    document = Document(samples("frame_image.odp"))
+    image_path = next(p for p in document.parts if p.startswith("Pictures/"))
+    chunks = list(document.iter_part_chunks(image_path, chunk_size=1024))
+    assert all(len(chunk) <= 1024 for chunk in chunks)
+    assert b"".join(chunks) == document.get_part(image_path)
+
+
+def test_iter_part_chunks_xml_not_loaded(samples):
+    document = Document(samples("example.odt"))
+    data = b"".join(document.iter_part_chunks("content"))
+    assert data == document.container.get_part(ODF_CONTENT)
+
+
+def test_iter_part_chunks_xml_loaded(samples):
+    document = Document(samples("example.odt"))
+    document.body.clear()
+    data = b"".join(document.iter_part_chunks(ODF_CONTENT, chunk_size=100))
+    assert data == document.content.serialize()
+
+
+def test_iter_part_chunks_empty_container():
+    document = Document(None)
+    document.container = None
+    with pytest.raises(ValueError):
+        list(document.iter_part_chunks(ODF_CONTENT))
+
+
+def test_save_compression_options(samples, tmp_path):
+    document = Document(samples("frame_image.odp"))
+    document.body.clear()
+    target = tmp_path / "compression_options.odp"
+    document.save(target, compression_level=1, store_media=True, workers=2)
+    reloaded = Document(target)
+    assert len(reloaded.body.children) == 0
+    assert sorted(reloaded.parts) == sorted(document.parts)
+
+
+def test_save_keeps_unmodified_part_bytes(samples, tmp_path):
+    source = tmp_path / "source.odt"
+    Document(samples("example.odt")).save(source)
+    document = Document(source)
+    original = document.container.get_part(ODF_CONTENT)
+    document.body.get_paragraphs()
+    target = tmp_path / "unmodified.odt"
+    document.save(target)
+    assert Container(target).get_part(ODF_CONTENT) == original
+
+
+def test_save_serializes_modified_part(samples, tmp_path):
+    document = Document(samples("example.odt"))
+    original = document.container.get_part(ODF_CONTENT)
+    document.body.append(Paragraph("new paragraph"))
+    target = tmp_path / "modified.odt"
+    document.save(target)
+    saved = Container(target).get_part(ODF_CONTENT)
+    assert saved != original
+    assert b"new paragraph" in saved
+    # streamed in the Zip archive, the part bytes are not kept in memory
+    assert document.content.is_modified
+
+
+def test_iter_part_chunks_unmodified_part(samples):
+    document = Document(samples("example.odt"))
+    original = document.container.get_part(ODF_CONTENT)
+    document.body.get_paragraphs()
+    assert b"".join(document.iter_part_chunks(ODF_CONTENT)) == original
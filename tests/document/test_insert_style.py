@@ -429,6 +429,9 @@ def test_save_backup_str():
     doc.container = MagicMock()
     # Mocking basic behavior for save() to reach backup check
     doc.container.get_part.return_value = b'<office:document-meta xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0" office:version="1.2"><office:meta><meta:generator>ODFDO</meta:generator></office:meta></office:document-meta>'
+    doc.container.open_part.side_effect = lambda path: BytesIO(
+        doc.container.get_part.return_value
+    )
     doc.save(target="some_path.odt", backup=True)
     doc.container.save.assert_called()
 
@@ -569,7 +572,7 @@ def test_show_styles_attribute_error():
 def test_insert_style_family_less_container_none():
     doc = Document("text")
     style_elem = Element.from_tag('<draw:marker draw:name="Arrow"/>')
-    with patch.object(doc.styles, "get_element", return_value=None):
+    with patch.object(doc.styles, "_get_root_child", return_value=None):
         with pytest.raises(ValueError, match="Target style container not found"):
             doc._insert_style_get_family_less(style_elem, name="", automatic=False)
 
@@ -587,7 +590,9 @@ def test_insert_style_family_less_unnamed_element():
 
 def test_insert_style_unknown_family_tag():
     doc = Document("text")
-    style = Element.from_tag('<style:style style:name="bad" style:family="unknown_family"/>')
+    style = Element.from_tag(
+        '<style:style style:name="bad" style:family="unknown_family"/>'
+    )
     with pytest.raises(ValueError, match="Invalid style"):
         doc.insert_style(style)
 
@@ -601,3 +606,151 @@ def test_set_automatic_name_coverage():
         new_style = Style("paragraph")
         doc._set_automatic_name(new_style, "paragraph")
         assert new_style.name == "odfdo_auto_11"
+
+
+def test_set_automatic_name_seeded_once():
+    doc = Document("text")
+    s1 = Style("paragraph", name="odfdo_auto_4")
+    with patch.object(Document, "get_styles", return_value=[s1]) as mock:
+        doc._set_automatic_name(Style("paragraph"), "paragraph")
+        doc._set_automatic_name(Style("paragraph"), "paragraph")
+        assert mock.call_count == 1
+
+
+def test_set_automatic_name_per_family():
+    doc = Document("text")
+    name_p = doc.insert_style(Style("paragraph"), automatic=True)
+    name_t = doc.insert_style(Style("text"), automatic=True)
+    name_p2 = doc.insert_style(Style("paragraph"), automatic=True)
+    assert name_p == f"{AUTOMATIC_PREFIX}1"
+    assert name_t == f"{AUTOMATIC_PREFIX}1"
+    assert name_p2 == f"{AUTOMATIC_PREFIX}2"
+
+
+def test_set_automatic_name_after_named_insert():
+    doc = Document("text")
+    doc.insert_style(Style("paragraph"), automatic=True)
+    doc.insert_style(Style("paragraph"), name=f"{AUTOMATIC_PREFIX}7", automatic=True)
+    name = doc.insert_style(Style("paragraph"), automatic=True)
+    assert name == f"{AUTOMATIC_PREFIX}8"
+
+
+def test_set_automatic_name_after_xml_append():
+    doc = Document("text")
+    doc.insert_style(Style("paragraph"), automatic=True)
+    container = doc.content._get_root_child("office:automatic-styles")
+    container.append(Style("paragraph", name=f"{AUTOMATIC_PREFIX}20"))
+    name = doc.insert_style(Style("paragraph"), automatic=True)
+    assert name == f"{AUTOMATIC_PREFIX}21"
+
+
+def test_set_automatic_name_after_delete_styles():
+    doc = Document("text")
+    doc.insert_style(Style("paragraph"), automatic=True)
+    doc.insert_style(Style("paragraph"), automatic=True)
+    doc.delete_styles()
+    name = doc.insert_style(Style("paragraph"), automatic=True)
+    assert name == f"{AUTOMATIC_PREFIX}1"
+
+
+def test_unique_style_name_not_inserted():
+    doc = Document("text")
+    assert doc._unique_style_name("ta") == "ta_0"
+    assert doc._unique_style_name("ta") == "ta_0"
+    doc.insert_style(Style("table", name="ta_0"), automatic=True)
+    doc.insert_style(Style("table", name="ta_1"), automatic=True)
+    assert doc._unique_style_name("ta") == "ta_2"
+
+
+def test_unique_style_name_after_delete():
+    doc = Document("text")
+    doc.insert_style(Style("table", name="ta_0"), automatic=True)
+    assert doc._unique_style_name("ta") == "ta_1"
+    doc.get_style("table", "ta_0").delete()
+    assert doc._unique_style_name("ta") == "ta_0"
+
+
+def test_insert_styles():
+    doc = Document("text")
+    names = doc.insert_styles(
+        [Style("text", bold=True), Style("text", italic=True)], automatic=True
+    )
+    assert names == [f"{AUTOMATIC_PREFIX}1", f"{AUTOMATIC_PREFIX}2"]
+    style = doc.get_style("text", names[1])
+    assert style.get_properties()["fo:font-style"] == "italic"
+
+
+def test_insert_styles_common():
+    doc = Document("text")
+    names = doc.insert_styles(
+        [
+            Style("paragraph", name="first"),
+            '<style:style style:name="second" style:family="paragraph"/>',
+        ]
+    )
+    assert names == ["first", "second"]
+    assert doc.get_style("paragraph", "second").parent.tag == "office:styles"
+
+
+def test_insert_styles_empty():
+    doc = Document("text")
+    assert doc.insert_styles([]) == []
+
+
+def test_insert_style_dedupe():
+    doc = Document("spreadsheet")
+    name1 = doc.insert_style(
+        Style("table-cell", area="text", color="#FF0000"), automatic=True, dedupe=True
+    )
+    name2 = doc.insert_style(
+        Style("table-cell", area="text", color="#FF0000"), automatic=True, dedupe=True
+    )
+    name3 = doc.insert_style(
+        Style("table-cell", area="text", color="#0000FF"), automatic=True, dedupe=True
+    )
+    assert name1 == name2
+    assert name3 != name1
+    assert len(doc.content.get_styles("table-cell")) == 2
+
+
+def test_insert_style_dedupe_other_family():
+    doc = Document("text")
+    name1 = doc.insert_style(Style("text", bold=True), automatic=True, dedupe=True)
+    name2 = doc.insert_style(Style("paragraph", bold=True), automatic=True, dedupe=True)
+    assert doc.get_style("text", name1) is not None
+    assert doc.get_style("paragraph", name2) is not None
+
+
+def test_insert_style_dedupe_ignores_name():
+    doc = Document("text")
+    name1 = doc.insert_style(Style("text", name="T1", bold=True), automatic=True)
+    name2 = doc.insert_style(
+        Style("text", name="T2", bold=True), automatic=True, dedupe=True
+    )
+    assert name1 == name2 == "T1"
+    assert doc.get_style("text", "T2") is None
+
+
+def test_insert_style_dedupe_not_automatic():
+    doc = Document("text")
+    doc.insert_style(Style("text", name="T1", bold=True), automatic=True)
+    name = doc.insert_style(Style("text", name="T2", bold=True), dedupe=True)
+    assert name == "T2"
+
+
+def test_insert_style_dedupe_modified_in_place():
+    doc = Document("text")
+    name1 = doc.insert_style(Style("text", bold=True), automatic=True, dedupe=True)
+    doc.get_style("text", name1).set_properties(area="text", color="#00FF00")
+    name2 = doc.insert_style(Style("text", bold=True), automatic=True, dedupe=True)
+    assert name2 != name1
+
+
+def test_insert_styles_dedupe():
+    doc = Document("text")
+    names = doc.insert_styles(
+        [Style("text", bold=True), Style("text", bold=True)],
+        automatic=True,
+        dedupe=True,
+    )
+    assert names[0] == names[1]
@@ -0,0 +1,51 @@
+# Copyright 2018-2026 Jérôme Dumonteil
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Authors (odfdo project): jerome.dumonteil@gmail.com
+# The odfdo project is a derivative work of the lpod-python project:
+# https://github.com/lpod/lpod-python
+
+import time
+
+from odfdo import Document, Paragraph, Style
+
+
+def make_document(paragraphs):
+    document = Document("text")
+    body = document.body
+    body.extend([Paragraph(f"paragraph {idx}") for idx in range(paragraphs)])
+    document.insert_style(Style("paragraph", name="P_perf"), automatic=True)
+    return document
+
+
+def run_style_lookups(document, lookups):
+    t0 = time.perf_counter()
+    for _idx in range(lookups):
+        document.get_style("paragraph", "P_perf")
+        document.get_styles("paragraph")
+    return time.perf_counter() - t0
+
+
+def run_perf_test(paragraphs, lookups=500):
+    """Print the time of style lookups for a small and a big body, which
+    should be similar: the style containers are not searched in the body."""
+    small = run_style_lookups(make_document(10), lookups)
+    big = run_style_lookups(make_document(paragraphs), lookups)
+    print("-" * 50)
+    print(f"Test {lookups} style lookups")
+    print(f"10 paragraphs: {small:.3f} sec")
+    print(f"{paragraphs} paragraphs: {big:.3f} sec")
+    print("-" * 50)
+    return small, big
@@ -193,6 +193,22 @@ def run_repeated(D):
     return table
 
 
+def run_random_insert_delete(D, table_ini):
+    print("Test random insert/delete rows and cells", D.lines, "rows", D.cols, "cols")
+    table = table_ini.clone
+    row = Row(width=D.cols)
+    C = chrono()
+    for line in D.rnd_line:
+        table.insert_row(line)
+        table.delete_row(D.rnd_line[-1 - line])
+    for col in D.rnd_col:
+        row.insert_cell(col)
+        row.delete_cell(D.rnd_col[-1 - col])
+    C.delta()
+    print("Size of table :", table.size)
+    print("-" * 50)
+
+
 def run_perf_test(rows: int, cols: int) -> None:
     print(f"rows: {rows} cols:{cols}")
     duration = chrono()
@@ -203,5 +219,6 @@ def run_perf_test(rows: int, cols: int) -> None:
     run_swap_transpose(D, t)
     t = run_random_set_value(D)
     run_random_get_value(D, t)
+    run_random_insert_delete(D, t)
     run_repeated(D)
     duration.delta()
@@ -105,3 +105,36 @@ def test_from_csv_2_text2(capsysbinary, samples):
     assert table.get_row_values(0) in (case1, case2)
     assert table.get_row_values(1) == [1, 2, "some text with, comma", Decimal("-3.14")]
     assert table.get_row_values(2) == [3, 4, "text with space", Decimal("0.01")]
+
+
+def test_from_csv_2_types(capsysbinary, samples):
+    source = samples("text2.csv")
+    params = parse_cli_args(["-i", str(source), "--types", "string,,,string"])
+
+    main_from_csv(params)
+    captured = capsysbinary.readouterr()
+
+    content = io.BytesIO(captured.out)
+    document = Document(content)
+    content.close()
+    table = document.body.tables[0]
+    assert table.get_row_values(1) == ["1", 2, "some text with, comma", "-3.14"]
+
+
+def test_from_csv_2_types_unknown(samples):
+    source = samples("text2.csv")
+    params = parse_cli_args(["-i", str(source), "--types", "money"])
+
+    with pytest.raises(ValueError):
+        main_from_csv(params)
+
+
+def test_from_csv_2_output(tmp_path, samples):
+    source = samples("text1.csv")
+    output = tmp_path / "out.ods"
+    params = parse_cli_args(["-i", str(source), "-o", str(output)])
+
+    main_from_csv(params)
+
+    table = Document(output).body.tables[0]
+    assert table.get_values() == [["foo1", "foo2"], [1, 2]]
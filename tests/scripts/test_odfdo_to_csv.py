@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from odfdo import Cell, Document, Row, Table
 from odfdo.scripts import to_csv
 from odfdo.scripts.to_csv import main as main_script
 from odfdo.scripts.to_csv import main_to_csv, parse_cli_args
@@ -148,3 +149,37 @@ def test_to_csv_2_raise_type(samples):
     with pytest.raises(TypeError) as result:
         main_to_csv(params)
         assert result.value.code >= 1
+
+
+def test_to_csv_2_output(tmp_path, samples):
+    source = samples("simple_table.ods")
+    output = tmp_path / "out.csv"
+    params = parse_cli_args(
+        ["-u", "-i", str(source), "-t", "Example3", "-o", str(output)]
+    )
+
+    main_to_csv(params)
+
+    assert output.read_bytes() == b'"A float","3.14"\n"A date","1975-05-07"\n'
+
+
+def test_to_csv_2_padded_rows(tmp_path, capsys):
+    document = Document("spreadsheet")
+    table = Table("T", width=3)
+    row = Row()
+    row.append_cell(Cell("x"))
+    table.append_row(row)
+    row = Row()
+    row.append_cell(Cell())
+    row.append_cell(Cell(2))
+    table.append_row(row)
+    document.body.append(table)
+    source = tmp_path / "padded.ods"
+    document.save(source)
+    params = parse_cli_args(["-i", str(source), "-t", "T"])
+
+    main_to_csv(params)
+    captured = capsys.readouterr()
+
+    assert captured.out == ",,\r\nx,,\r\n,2,\r\n"
+    assert captured.out == Document(source).body.get_table(name="T").to_csv()
@@ -0,0 +1,309 @@
+# Copyright 2018-2026 Jérôme Dumonteil
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Authors (odfdo project): jerome.dumonteil@gmail.com
+# The odfdo project is a derivative work of the lpod-python project:
+# https://github.com/lpod/lpod-python
+
+from collections.abc import Iterable
+
+import pytest
+
+from odfdo.document import Document
+from odfdo.style import Style
+from odfdo.style_index import CONTENT, STYLES, StyleIndex
+from odfdo.utils.style_constants import FAMILY_MAPPING
+
+
+@pytest.fixture
+def document(samples) -> Iterable[Document]:
+    yield Document(samples("example.odt"))
+
+
+def _legacy_get_style(document, family, name=None, display_name=None):
+    style = document.content.get_style(
+        family, name_or_element=name, display_name=display_name
+    )
+    if style is not None:
+        return style
+    return document.styles.get_style(
+        family, name_or_element=name, display_name=display_name
+    )
+
+
+def test_style_index_same_as_xpath(document):
+    keys = set()
+    for style in document.get_styles():
+        for attribute in ("style:name", "style:display-name"):
+            if value := style.get_attribute(attribute):
+                keys.add((attribute, value))
+    keys.add(("", ""))
+    for family in FAMILY_MAPPING:
+        for attribute, value in keys:
+            if attribute == "style:name":
+                args = (family, value, None)
+            else:
+                args = (family, None, value or None)
+            expected = _legacy_get_style(document, *args)
+            result = document.get_style(*args)
+            if expected is None:
+                assert result is None
+            else:
+                assert result._xml_element is expected._xml_element
+
+
+def test_style_index_is_reused(document):
+    index = document._get_style_index()
+    document.get_style("paragraph", "Standard")
+    assert document._get_style_index() is index
+
+
+def test_style_index_part(document):
+    index = StyleIndex(document.content, document.styles)
+    assert index.get_style("paragraph", "Standard", part=CONTENT) is None
+    style = index.get_style("paragraph", "Standard", part=STYLES)
+    assert style.name == "Standard"
+
+
+def test_style_index_default_style(document):
+    style = document.get_style("paragraph")
+    assert style.tag == "style:default-style"
+    assert style.family == "paragraph"
+
+
+def test_style_index_display_name():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="p_x", display_name="Nice Name"))
+    style = document.get_style("paragraph", display_name="Nice Name")
+    assert style.name == "p_x"
+
+
+def test_style_index_insert_style():
+    document = Document("text")
+    assert document.get_style("paragraph", "new") is None
+    document.insert_style(Style("paragraph", name="new", area="text", color="red"))
+    style = document.get_style("paragraph", "new")
+    assert style.get_properties(area="text")["fo:color"] == "#FF0000"
+    document.insert_style(Style("paragraph", name="new", area="text", color="blue"))
+    assert len(document.get_styles("paragraph")) == len(
+        {s.name for s in document.get_styles("paragraph")}
+    )
+    style = document.get_style("paragraph", "new")
+    assert style.get_properties(area="text")["fo:color"] == "#0000FF"
+
+
+def test_style_index_insert_automatic_style():
+    document = Document("text")
+    name = document.insert_style(Style("text", bold=True), automatic=True)
+    style = document.get_style("text", name)
+    assert style.parent.tag == "office:automatic-styles"
+
+
+def test_style_index_insert_moved_style():
+    document = Document("text")
+    style = document.get_style("paragraph", "Standard")
+    document.insert_style(style, automatic=True)
+    found = document.get_style("paragraph", "Standard")
+    assert found.parent.tag == "office:automatic-styles"
+
+
+def test_style_index_delete_styles():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="gone"))
+    assert document.get_style("paragraph", "gone") is not None
+    document.delete_styles()
+    assert document.get_style("paragraph", "gone") is None
+
+
+def test_style_index_merge_styles_from(document):
+    target = Document("text")
+    assert target.get_style("paragraph", "Hanging_20_indent") is None
+    target.merge_styles_from(document)
+    style = target.get_style("paragraph", "Hanging_20_indent")
+    assert style is not None
+    assert style.parent.tag == "office:styles"
+    names = [s.name for s in target.get_styles("paragraph") if s.name]
+    assert len(names) == len(set(names))
+
+
+def test_style_index_xml_append():
+    document = Document("text")
+    document.get_style("paragraph", "Standard")
+    container = document.content._get_root_child("office:automatic-styles")
+    container.append(Style("paragraph", name="direct"))
+    assert document.get_style("paragraph", "direct").name == "direct"
+
+
+def test_style_index_xml_delete():
+    document = Document("text")
+    style = document.get_style("paragraph", "Standard")
+    style.delete()
+    assert document.get_style("paragraph", "Standard") is None
+
+
+def test_style_index_xml_replace_container():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="old"), automatic=True)
+    assert document.get_style("paragraph", "old") is not None
+    container = document.content._get_root_child("office:automatic-styles")
+    container.clear()
+    assert document.get_style("paragraph", "old") is None
+
+
+def test_style_index_duplicate_names():
+    document = Document("text")
+    container = document.content._get_root_child("office:automatic-styles")
+    first = Style("paragraph", name="twice", area="text", color="red")
+    container.append(first)
+    container.append(Style("paragraph", name="twice", area="text", color="blue"))
+    found = document.get_style("paragraph", "twice")
+    assert found._xml_element is first._xml_element
+    document.insert_style(Style("paragraph", name="twice"), automatic=True)
+    found = document.get_style("paragraph", "twice")
+    assert found.get_properties(area="text")["fo:color"] == "#0000FF"
+
+
+def test_style_index_parent_styles():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="a", parent_style="Standard"))
+    document.insert_style(Style("paragraph", name="b", parent_style="a"))
+    index = document._get_style_index()
+    parents = [s.name for s in index.iter_parent_styles("paragraph", "b")]
+    assert parents == ["a", "Standard"]
+    assert document.get_parent_style(document.get_style("paragraph", "b")).name == "a"
+
+
+def test_style_index_parent_styles_loop():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="a", parent_style="b"))
+    document.insert_style(Style("paragraph", name="b", parent_style="a"))
+    index = document._get_style_index()
+    parents = [s.name for s in index.iter_parent_styles("paragraph", "a")]
+    assert parents == ["b"]
+
+
+def test_style_index_clone():
+    document = Document("text")
+    document.get_style("paragraph", "Standard")
+    clone = document.clone
+    assert clone._Document__style_index is None
+    assert clone.get_style("paragraph", "Standard") is not None
+
+
+def test_style_index_unknown_family():
+    document = Document("text")
+    with pytest.raises(ValueError):
+        document.get_style("unknown_family", "Standard")
+
+
+def test_style_index_element_argument():
+    document = Document("text")
+    style = Style("paragraph", name="given")
+    assert document.get_style("paragraph", style) is style
+
+
+def test_style_index_renamed_in_place():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="A"))
+    document.get_style("paragraph", "A").name = "A2"
+    assert document.get_style("paragraph", "A2").name == "A2"
+    assert document.get_style("paragraph", "A") is None
+
+
+def test_style_index_family_changed_in_place():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="A"))
+    style = document.get_style("paragraph", "A")
+    style.set_attribute("style:family", "text")
+    assert document.get_style("text", "A").family == "text"
+    assert document.get_style("paragraph", "A") is None
+
+
+def test_style_index_display_name_changed_in_place():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="A", display_name="Old"))
+    document.insert_style(Style("paragraph", name="B"))
+    style = document.get_style("paragraph", "A")
+    style.set_attribute("style:display-name", "New")
+    assert document.get_style("paragraph", display_name="New").name == "A"
+    assert document.get_style("paragraph", display_name="Old") is None
+
+
+def test_style_index_renamed_in_place_shadows_common_style():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="Shared"))
+    document.insert_style(Style("paragraph", name="Mine"), automatic=True)
+    assert document.get_style("paragraph", "Shared").parent.tag == "office:styles"
+    document.get_style("paragraph", "Mine").set_attribute("style:name", "Shared")
+    style = document.get_style("paragraph", "Shared")
+    assert style.parent.tag == "office:automatic-styles"
+    assert (
+        style.parent.tag == document.content.get_style("paragraph", "Shared").parent.tag
+    )
+
+
+def test_style_index_family_changed_in_place_shadows_common_style():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="Shared"))
+    document.insert_style(Style("text", name="Shared"), automatic=True)
+    assert document.get_style("paragraph", "Shared").parent.tag == "office:styles"
+    document.get_style("text", "Shared").set_attribute("style:family", "paragraph")
+    style = document.get_style("paragraph", "Shared")
+    assert style.parent.tag == "office:automatic-styles"
+    assert document.get_style("text", "Shared") is None
+
+
+def test_style_index_renamed_in_place_shadows_sibling():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="A"), automatic=True)
+    document.insert_style(Style("paragraph", name="B"), automatic=True)
+    document.insert_style(Style("paragraph", name="C"), automatic=True)
+    assert document.get_style("paragraph", "B").name == "B"
+    document.get_style("paragraph", "A").set_attribute("style:display-name", "X")
+    document.get_style("paragraph", "A").name = "B"
+    assert document.get_style("paragraph", "B").display_name == "X"
+
+
+def test_style_index_replace_child():
+    document = Document("text")
+    document.insert_style(Style("paragraph", name="first"), automatic=True)
+    document.insert_style(Style("paragraph", name="last"), automatic=True)
+    first = document.get_style("paragraph", "first")
+    container = document.content._get_root_child("office:automatic-styles")
+    container.replace_element(first, Style("paragraph", name="new"))
+    assert document.get_style("paragraph", "new").name == "new"
+    assert document.get_style("paragraph", "first") is None
+
+
+def test_style_index_unique_name_renamed_in_place():
+    document = Document("spreadsheet")
+    name = document._unique_style_name("ta")
+    document.insert_style(Style("table", name="other"), automatic=True)
+    document.get_style("table", "other").name = name
+    assert document._unique_style_name("ta") != name
+
+
+def test_style_index_automatic_name_renamed_in_place():
+    document = Document("text")
+    name = document.insert_style(Style("text", bold=True), automatic=True)
+    document.insert_style(Style("text", name="other", italic=True), automatic=True)
+    prefix = name.rstrip("0123456789")
+    following = f"{prefix}{int(name[len(prefix) :]) + 1}"
+    document.get_style("text", "other").name = following
+    new_name = document.insert_style(Style("text", color="red"), automatic=True)
+    assert new_name not in (name, following)
+    assert len({s.name for s in document.get_styles("text")}) == len(
+        document.get_styles("text")
+    )
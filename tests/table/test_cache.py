@@ -22,6 +22,8 @@
 #          David Versmisse <david.versmisse@itaapy.com>
 #          Jerome Dumonteil <jerome.dumonteil@itaapy.com>
 
+import random
+from bisect import bisect_left
 from collections.abc import Iterable
 
 import pytest
@@ -31,7 +33,13 @@ from odfdo.column import Column
 from odfdo.document import Document
 from odfdo.row import Row
 from odfdo.table import Table
-from odfdo.table_cache import RowCache, _erase_map_once, _insert_map_once
+from odfdo.table_cache import (
+    AreaIndex,
+    PositionMap,
+    RowCache,
+    _erase_map_once,
+    _insert_map_once,
+)
 
 
 @pytest.fixture
@@ -192,6 +200,78 @@ def test_internal_bad_erase(table):
         _erase_map_once(row_map, bad_val)
 
 
+def _cumulative(repeats: list[int]) -> list[int]:
+    result = []
+    position = -1
+    for repeated in repeats:
+        position += repeated
+        result.append(position)
+    return result
+
+
+def test_position_map_basic():
+    pmap = PositionMap([3, 1, 2])
+    assert list(pmap) == [2, 3, 5]
+    assert len(pmap) == 3
+    assert pmap[0] == 2
+    assert pmap[-1] == 5
+    assert pmap.total() == 6
+    assert pmap.repeated(2) == 2
+    assert [pmap.bisect(pos) for pos in range(-1, 8)] == [0, 0, 0, 0, 1, 2, 2, 3, 3]
+
+
+def test_position_map_empty():
+    pmap = PositionMap()
+    assert list(pmap) == []
+    assert pmap.total() == 0
+    assert pmap.bisect(0) == 0
+    with pytest.raises(IndexError):
+        pmap[-1]
+
+
+def test_position_map_copy():
+    pmap = PositionMap([1, 2])
+    copy = pmap.copy()
+    copy.insert(0, 5)
+    assert list(pmap) == [0, 2]
+    assert list(copy) == [4, 5, 7]
+
+
+@pytest.mark.parametrize("block_size", [4, 512])
+def test_position_map_random(monkeypatch, block_size):
+    monkeypatch.setattr("odfdo.table_cache._BLOCK_SIZE", block_size)
+    rnd = random.Random(42)  # noqa: S311
+    repeats: list[int] = []
+    pmap = PositionMap()
+    for _ in range(5000):
+        action = rnd.random()
+        if action < 0.6 or not repeats:
+            idx = rnd.randint(0, len(repeats))
+            repeated = rnd.randint(1, 5)
+            repeats.insert(idx, repeated)
+            pmap.insert(idx, repeated)
+        elif action < 0.8:
+            idx = rnd.randrange(len(repeats))
+            del repeats[idx]
+            pmap.erase(idx)
+        else:
+            idx = rnd.randrange(len(repeats))
+            repeats[idx] += 1
+            pmap.add(idx, 1)
+    expected = _cumulative(repeats)
+    assert list(pmap) == expected
+    assert pmap.total() == sum(repeats)
+    for position in rnd.sample(range(sum(repeats) + 10), 200):
+        assert pmap.bisect(position) == bisect_left(expected, position)
+    for idx in rnd.sample(range(len(repeats)), 200):
+        assert pmap[idx] == expected[idx]
+        assert pmap.repeated(idx) == repeats[idx]
+    pmap = PositionMap(repeats)
+    assert list(pmap) == expected
+    assert pmap.bisect(expected[-1]) == len(repeats) - 1
+    assert pmap.bisect(expected[-1] + 1) == len(repeats)
+
+
 def test_internal_del_row_0(table):
     table.delete_row(0)
     assert table.height == 3
@@ -291,7 +371,7 @@ def test_internal_delete_cell_in_cache2():
 def test_internal_cell_in_cache(table):
     row = table.get_row(0)
     cache = row._row_cache
-    assert cache.cell_map == [2, 3, 6]
+    assert list(cache.cell_map) == [2, 3, 6]
     assert len(cache.cell_elements) == 0
     row.get_cell(0)
     assert len(cache.cell_elements) == 1
@@ -300,7 +380,7 @@ def test_internal_cell_in_cache(table):
 def test_internal_cell_in_cache_then_delete(table):
     row = table.get_row(0)
     cache = row._row_cache
-    assert cache.cell_map == [2, 3, 6]
+    assert list(cache.cell_map) == [2, 3, 6]
     assert len(cache.cell_elements) == 0
     row.get_cell(0)
     row.delete_cell(0)
@@ -441,3 +521,92 @@ def test_internal_table_delete_col_in_cache_ok(table):
     cache = table._table_cache
     table.get_column(0)
     cache.delete_col_in_cache(0, table)
+
+
+def test_table_cache_lazy_on_wrap(table):
+    wrapped = Table.from_tag(table._xml_element)
+    cache = wrapped._table_cache
+    assert cache._row_map is None
+    assert cache._col_map is None
+    assert wrapped.height == table.height
+    assert cache._row_map is not None
+    assert cache._col_map is None
+
+
+def test_table_cache_lazy_invalidate(table):
+    cache = table._table_cache
+    height = table.height
+    table._compute_table_cache()
+    assert cache._row_map is None
+    table.append_row(Row(width=2))
+    assert table.height == height + 1
+    assert cache.row_map.total() == height + 1
+
+
+def test_row_cache_lazy_on_wrap():
+    row = Row(width=3)
+    wrapped = Row.from_tag(row._xml_element)
+    assert wrapped._row_cache._cell_map is None
+    assert wrapped.width == 3
+    assert list(wrapped._row_cache._cell_map) == [0, 1, 2]
+
+
+def test_row_cache_lazy_append_cell():
+    row = Row(width=3)
+    row._compute_row_cache()
+    row.append_cell(Cell(repeated=2))
+    assert row.width == 5
+    assert list(row._row_cache.cell_map) == [0, 1, 2, 4]
+
+
+def test_area_index():
+    index = AreaIndex()
+    index.add((0, 0, 1, 1), "a")
+    index.add((1, 60, 3, 70), "b")
+    index.add((2, 0, 2, 100_000), "column")
+    assert index.at(1, 1) == ["a"]
+    assert index.at(2, 65) == ["b", "column"]
+    assert index.at(2, 99_999) == ["column"]
+    assert index.at(4, 65) == []
+    index.remove((1, 60, 3, 70), "b")
+    assert index.at(2, 65) == ["column"]
+    index.remove((1, 60, 3, 70), "b")
+
+
+def test_area_index_random():
+    rnd = random.Random(3)  # noqa: S311
+    areas = []
+    index = AreaIndex()
+    for _ in range(300):
+        x, y = rnd.randrange(50), rnd.randrange(5000)
+        area = (x, y, x + rnd.randrange(5), y + rnd.randrange(2000))
+        areas.append(area)
+        index.add(area, area)
+    for _ in range(300):
+        x, y = rnd.randrange(55), rnd.randrange(7000)
+        expected = [
+            area
+            for area in areas
+            if area[0] <= x <= area[2] and area[1] <= y <= area[3]
+        ]
+        assert sorted(index.at(x, y)) == sorted(expected)
+
+
+def test_area_index_intersects():
+    rnd = random.Random(4)  # noqa: S311
+    areas = []
+    index = AreaIndex()
+    assert not index.intersects((0, 0, 10, 10))
+    for _ in range(100):
+        x, y = rnd.randrange(50), rnd.randrange(5000)
+        area = (x, y, x + rnd.randrange(5), y + rnd.randrange(2000))
+        areas.append(area)
+        index.add(area, area)
+    for _ in range(300):
+        x, y = rnd.randrange(55), rnd.randrange(7000)
+        z, t = x + rnd.randrange(3), y + rnd.randrange(100_000)
+        expected = any(
+            area[0] <= z and x <= area[2] and area[1] <= t and y <= area[3]
+            for area in areas
+        )
+        assert index.intersects((x, y, z, t)) is expected
@@ -23,7 +23,9 @@ from collections.abc import Iterable
 import pytest
 
 from odfdo import Element
+from odfdo.cell import Cell
 from odfdo.document import Document
+from odfdo.table import Table
 
 
 @pytest.fixture
@@ -340,3 +342,84 @@ def test_is_spanned_when_some_attribute_missing_2(table):
     cell = table.get_cell(coord)
     cell.del_attribute("table:number-rows-spanned")
     assert cell.is_spanned() is True
+
+
+def test_get_span_at(table):
+    assert table.get_span_at("b3") == (1, 2, 2, 4)
+    assert table.get_span_at("c5") == (1, 2, 2, 4)
+    assert table.get_span_at((8, 2)) == (6, 2, 9, 2)
+    assert table.get_span_at("e6") == (4, 3, 4, 5)
+
+
+def test_get_span_at_none(table):
+    for coord in ("a1", "d3", "b6", "e3", "k20"):
+        assert table.get_span_at(coord) is None
+
+
+def test_get_span_at_del_span(table):
+    assert table.get_span_at("c4") == (1, 2, 2, 4)
+    table.del_span("b3")
+    assert table.get_span_at("c4") is None
+    assert table.get_span_at("e4") == (4, 3, 4, 5)
+
+
+def test_get_span_at_set_span(table):
+    assert table.get_span_at("a8") is None
+    table.set_span("a7:b8")
+    assert table.get_span_at("a8") == (0, 6, 1, 7)
+    assert table.get_span_at("b3") == (1, 2, 2, 4)
+
+
+def test_get_span_at_insert_row(table):
+    assert table.get_span_at("b3") == (1, 2, 2, 4)
+    table.insert_row(0)
+    assert table.get_span_at("b3") is None
+    assert table.get_span_at("b4") == (1, 3, 2, 5)
+
+
+def test_get_span_at_set_cell(table):
+    assert table.get_span_at("g3") == (6, 2, 9, 2)
+    table.set_cell("g3")
+    assert table.get_span_at("h3") is None
+
+
+def test_get_span_at_bad_coordinates(table):
+    with pytest.raises(ValueError):
+        table.get_span_at((None, 2))
+
+
+def test_get_span_at_delete_cell(table):
+    assert table.get_span_at("b3") == (1, 2, 2, 4)
+    table.delete_cell("a3")
+    assert table.get_span_at("a3") == (0, 2, 1, 4)
+
+
+def _spanned_cell() -> Cell:
+    cell = Cell("x")
+    cell.set_attribute("table:number-columns-spanned", "2")
+    cell.set_attribute("table:number-rows-spanned", "1")
+    return cell
+
+
+def test_get_span_at_row_edited_in_place(table):
+    assert table.get_span_at("a2") is None
+    table.get_row(1, clone=False).set_cell(0, _spanned_cell())
+    assert table.get_cell("a2").is_spanned()
+    assert table.get_span_at("a2") == (0, 1, 1, 1)
+
+
+def test_get_span_at_row_edited_in_place_detached():
+    table = Table("T")
+    table.set_values([[idx, idx] for idx in range(10)])
+    assert table.get_span_at("a8") is None
+    table.get_row(7, clone=False).set_cell(0, _spanned_cell())
+    assert table.get_span_at("a8") == (0, 7, 1, 7)
+    table.get_cell("a8", clone=False).del_attribute("table:number-columns-spanned")
+    table.get_cell("a8", clone=False).del_attribute("table:number-rows-spanned")
+    assert table.get_span_at("a8") is None
+
+
+def test_set_span_overlap_row_edited_in_place(table):
+    table.get_row(1, clone=False).set_cell(0, _spanned_cell())
+    assert table.set_span("b1:c2") is False
+    assert table.set_span("c1:d2") is True
@@ -27,7 +27,8 @@ from decimal import Decimal as dec
 
 import pytest
 
-from odfdo.cell import Cell
+from odfdo.cell import Cell, _decode_value_and_type
+from odfdo.element import Element
 
 
 def test_string_value_property():
@@ -668,3 +669,32 @@ def test_bad_value():
     cell = Cell(1.54, cell_type="currency", currency="EUR")
     with pytest.raises(TypeError):
         cell.value = []
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "text",
+        True,
+        False,
+        3,
+        dec("3.14"),
+        date(2026, 1, 2),
+        datetime(2026, 1, 2, 3, 4, 5),
+        timedelta(hours=1, minutes=2),
+    ],
+)
+def test_decode_value_and_type(value):
+    cell = Cell(value)
+    expected = cell.get_value(get_type=True)
+    assert _decode_value_and_type(cell._xml_element) == expected
+
+
+def test_decode_value_and_type_markup():
+    cell = Cell("text")
+    cell.del_attribute("office:string-value")
+    assert _decode_value_and_type(cell._xml_element) == ("text", "string")
+    para = cell.get_element("text:p")
+    para.append(Element.from_tag("text:line-break"))
+    assert _decode_value_and_type(cell._xml_element) is None
@@ -158,3 +158,45 @@ def test_style():
     table = Table("A Table", style="A Style")
     expected = '<table:table table:name="A Table" table:style-name="A Style"/>'
     assert table.serialize() == expected
+
+
+def test_from_values():
+    values = [
+        [1, 1, 1, "a", None],
+        [1, 1, 1, "a", None],
+        [True, 1, 2.5],
+    ]
+    table = Table.from_values("Values", values)
+    assert table.name == "Values"
+    assert table.height == 3
+    assert table.width == 5
+    assert table.get_values() == [
+        [1, 1, 1, "a", None],
+        [1, 1, 1, "a", None],
+        [True, 1, 2.5, None, None],
+    ]
+
+
+def test_from_values_repeated():
+    table = Table.from_values("Values", [[1, 1, 1, "a"], [1, 1, 1, "a"], [True, 1]])
+    rows = table.get_elements("table:table-row")
+    assert len(rows) == 2
+    assert rows[0].repeated == 2
+    assert rows[0].get_elements("table:table-cell")[0].repeated == 3
+    # True and 1 are equal but distinct values
+    assert rows[1].get_elements("table:table-cell")[0].repeated is None
+
+
+def test_from_values_same_as_set_values():
+    values = [[1, "b", None, 3], [], [2.5, "x"]]
+    table1 = Table.from_values("Values", values, cell_style="ce1")
+    table2 = Table("Values")
+    table2.set_values(values, style="ce1")
+    assert table1.get_values(get_type=True) == table2.get_values(get_type=True)
+    assert table1.get_cell("B1").style == "ce1"
+
+
+def test_from_values_empty():
+    table = Table.from_values("Values", [])
+    assert table.height == 0
+    assert table.width == 0
@@ -25,11 +25,12 @@ from __future__ import annotations
 
 import csv
 from collections.abc import Iterable
+from datetime import date, datetime
 from io import BytesIO, StringIO
 
 import pytest
 
-from odfdo.table import Table, import_from_csv
+from odfdo.table import Table, import_from_csv, iter_csv_values
 
 CSV_DATA = '"A float","3.14"\n"A date","1975-05-07"\n'
 XML_DATA = (
@@ -142,3 +143,75 @@ def test_import_from_csv_various():
     b = BytesIO(b"v1,v2")
     table = import_from_csv(b, "Test")
     assert table.get_value("A1") == "v1"
+
+
+def test_export_to_csv_file_utf8(tmp_path):
+    table = Table.from_values("Test", [["décimal", None, 1]])
+    path = tmp_path / "test.csv"
+    table.to_csv(path)
+    assert path.read_bytes() == "décimal,,1\r\n".encode()
+
+
+def test_iter_csv_values_column_types():
+    content = "id,name,day\n007,a,2024-01-02\n2.5,8,2024-01-03\nx,b,\n"
+    result = list(iter_csv_values(content.splitlines(True)))
+    assert result == [
+        ["id", "name", "day"],
+        [7, "a", date(2024, 1, 2)],
+        [2.5, 8, date(2024, 1, 3)],
+        ["x", "b"],
+    ]
+
+
+def test_iter_csv_values_dates_and_datetimes():
+    content = "id,day\n1,2024-01-02\n2,2024-01-03T10:30:00\n3,2024-01-04 08:00:00\n"
+    result = list(iter_csv_values(content.splitlines(True)))
+    assert result == [
+        ["id", "day"],
+        [1, date(2024, 1, 2)],
+        [2, datetime(2024, 1, 3, 10, 30)],
+        [3, datetime(2024, 1, 4, 8, 0)],
+    ]
+    assert result == list(
+        iter_csv_values(content.splitlines(True), types=["auto", "auto"])
+    )
+
+
+def test_iter_csv_values_date_type_keeps_time():
+    content = "id,day\n1,2024-01-02\n2,2024-01-03T10:30:00\n"
+    result = list(iter_csv_values(content.splitlines(True), types=[None, "date"]))
+    assert result == [
+        ["id", "day"],
+        [1, date(2024, 1, 2)],
+        [2, datetime(2024, 1, 3, 10, 30)],
+    ]
+
+
+def test_iter_csv_values_file(tmp_path):
+    path = tmp_path / "test.csv"
+    path.write_text("a;b\n1;2\n3;4\n", encoding="utf-8")
+    with path.open(newline="", encoding="utf-8") as file:
+        result = list(iter_csv_values(file))
+    assert result == [["a", "b"], [1, 2], [3, 4]]
+
+
+def test_iter_csv_values_types():
+    content = "id,name\n007,a\n8,b\n"
+    result = list(iter_csv_values(content.splitlines(True), types=["string"]))
+    assert result == [["id", "name"], ["007", "a"], ["8", "b"]]
+
+
+def test_iter_csv_values_types_auto():
+    content = "id,day\n1,2024-01-02\n2,x\n"
+    result = list(iter_csv_values(content.splitlines(True), types=["int", "auto"]))
+    assert result == [["id", "day"], [1, date(2024, 1, 2)], [2, "x"]]
+
+
+def test_iter_csv_values_types_unknown():
+    with pytest.raises(ValueError):
+        list(iter_csv_values(["a,b\n"], types=["money"]))
+
+
+def test_from_csv_types():
+    table = Table.from_csv("id,name\n007,a\n", "Test", types=["string", None])
+    assert table.get_values() == [["id", "name"], ["007", "a"]]
@@ -801,3 +801,39 @@ def test_get_named_ranges_no_body_or_not_allowed():
     ):
         assert body.allow_named_range is False
         assert table_in_doc.get_named_ranges(global_scope=True) == []
+
+
+def test_named_ranges_at(table2):
+    result = table2.named_ranges_at("C1")
+    assert [nr.name for nr in result] == ["nr_1"]
+    result = table2.named_ranges_at((4, 3))
+    assert [nr.name for nr in result] == ["nr_6"]
+    assert table2.named_ranges_at("A1") == []
+
+
+def test_named_ranges_at_set(table2):
+    assert [nr.name for nr in table2.named_ranges_at("E3")] == ["nr_6"]
+    table2.set_named_range("big", "A1:G4")
+    result = table2.named_ranges_at("E3")
+    assert [nr.name for nr in result] == ["nr_6", "big"]
+
+
+def test_named_ranges_at_delete(table2):
+    assert len(table2.named_ranges_at("C1")) == 1
+    table2.delete_named_range("nr_1")
+    assert table2.named_ranges_at("C1") == []
+
+
+def test_named_ranges_at_set_range(table2):
+    assert len(table2.named_ranges_at("C1")) == 1
+    # modified outside of the table API
+    table2.get_named_range("nr_1").set_range("A1")
+    assert table2.named_ranges_at("C1") == []
+    assert [nr.name for nr in table2.named_ranges_at("A1")] == ["nr_1"]
+
+
+def test_named_ranges_at_local(table):
+    table.set_named_range("local", "B2:C3", global_scope=False)
+    result = table.named_ranges_at("C3", global_scope=False)
+    assert [nr.name for nr in result] == ["local"]
+    assert table.named_ranges_at("D3", global_scope=False) == []
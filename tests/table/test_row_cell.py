@@ -99,6 +99,29 @@ def test_iter_cells_coord_m5_m1(row):
     assert len(list(row.iter_cells(-5, -1))) == 0
 
 
+def test_iter_cells_view(row_repeats):
+    cells = list(row_repeats.iter_cells(view=True))
+    assert len(cells) == 7
+    assert cells[0] is cells[1]
+    assert cells[0] is cells[2]
+    assert cells[0].repeated == 3
+    assert cells[6].x == 6
+
+
+def test_iter_cell_runs(row_repeats):
+    runs = [(x, repeat, cell.value) for x, repeat, cell in row_repeats.iter_cell_runs()]
+    assert runs == [(0, 3, 1), (3, 1, 2), (4, 3, 3)]
+
+
+def test_iter_cell_runs_coord(row_repeats):
+    runs = [(x, repeat) for x, repeat, _cell in row_repeats.iter_cell_runs(1, 4)]
+    assert runs == [(1, 2), (3, 1), (4, 1)]
+
+
+def test_iter_cell_runs_coord_empty(row_repeats):
+    assert list(row_repeats.iter_cell_runs(4, 2)) == []
+
+
 def test_traverse_func(row):
     # compatibility traverse = iter_cells
     assert row.traverse == row.iter_cells
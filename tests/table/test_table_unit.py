@@ -593,6 +593,40 @@ def test_table_append_somthing(table):
     ]
 
 
+def test_table_get_columns_values(table):
+    result = table.get_columns_values()
+    assert result == [list(col) for col in zip(*table.get_values(), strict=True)]
+
+
+def test_table_get_columns_values_coord(table):
+    result = table.get_columns_values((2, 2, 3, 3))
+    assert result == [[1, 3], [2, 4]]
+
+
+def test_table_get_columns_values_type(table):
+    values, types = table.get_columns_values("A3:B4", get_type=True)
+    assert values == [[1, 1], [1, 2]]
+    assert types == [["float", "float"], ["float", "float"]]
+
+
+def test_table_get_columns_values_mixed():
+    table = Table("Table", width=3, height=3)
+    table.set_values(
+        [
+            ["a", True, datetime.date(2026, 1, 2)],
+            [None, 1.5, datetime.timedelta(hours=1)],
+        ]
+    )
+    table.set_value("C3", "multi\nline")
+    values, types = table.get_columns_values(get_type=True)
+    assert values == [list(col) for col in zip(*table.get_values(), strict=True)]
+    assert types == [
+        ["string", None, None],
+        ["boolean", "float", None],
+        ["date", "time", "string"],
+    ]
+
+
 def test_table_iter_values_1(table):
     result = table.iter_values()
     assert isinstance(result, Iterator)
@@ -791,6 +825,46 @@ def test_table_extend_rows_4(table):
     ]
 
 
+def test_table_extend_rows_repeated(table):
+    row1 = Row(repeated=3)
+    row2 = Row()
+    row2.set_values([10, 20])
+    table.extend_rows(row for row in (row1, row2))
+    assert table.height == 8
+    assert table.width == 7
+    assert (row1.y, row2.y) == (4, 7)
+    assert table.get_row_values(7) == [10, 20, None, None, None, None, None]
+
+
+def test_table_extend_rows_not_read(samples):
+    document = Document(samples("simple_table.ods"))
+    table = document.body.get_table(name="Example1")
+    # the cache of the table is not yet read from the XML
+    table.extend_rows([Row(), Row()])
+    assert table.height == 6
+    assert table.width == 7
+
+
+def test_table_extend_rows_empty_table():
+    table = Table("Table")
+    row = Row()
+    row.set_values([1, 2, 3])
+    table.extend_rows([row, Row()])
+    assert table.size == (3, 2)
+    assert table.get_values() == [[1, 2, 3], [None, None, None]]
+
+
+def test_table_append_row_no_column_scan(monkeypatch):
+    table = Table("Table")
+    row = Row()
+    row.set_values([1, 2, 3])
+    table.append_row(row)
+    monkeypatch.setattr(Table, "_get_columns", None)
+    for _ in range(3):
+        table.append_row(row)
+    assert table.size == (3, 4)
+
+
 def test_table_delete_row(table):
     table.delete_row(99)
     result = list(table.iter_values())
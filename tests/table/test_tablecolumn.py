@@ -33,7 +33,7 @@ from odfdo.column import Column
 from odfdo.document import Document
 from odfdo.row import Row
 from odfdo.table import Table
-from odfdo.table_cache import TableCache
+from odfdo.table_cache import PositionMap, TableCache
 
 
 @pytest.fixture
@@ -443,7 +443,7 @@ def test_get_column_none_internal():
     with patch.object(Table, "_get_element_idx2", return_value=None):
         table._table_cache.col_elements = {}
         # Restore width
-        table._table_cache.col_map = [0]
+        table._table_cache.col_map = PositionMap([1])
         with pytest.raises(ValueError):
             table.get_column(0)
 
@@ -475,7 +475,7 @@ def test_get_column2_none_internal():
     with patch.object(Table, "_get_element_idx2", return_value=None):
         table._table_cache.col_elements = {}
         # Restore width
-        table._table_cache.col_map = [0]
+        table._table_cache.col_map = PositionMap([1])
         assert table._get_column2(0) is None
 
 
@@ -495,7 +495,7 @@ def test_append_column_none_internal_2():
     with patch.object(Table, "_get_element_idx2", return_value=None):
         table._table_cache.col_elements = {}
         # Restore width
-        table._table_cache.col_map = [0]
+        table._table_cache.col_map = PositionMap([1])
         with pytest.raises(ValueError):
             table.append_column(Column())
 
@@ -32,6 +32,7 @@ from odfdo.document import Document
 from odfdo.element import Element
 from odfdo.row import Row
 from odfdo.table import Table
+from odfdo.table_cache import PositionMap
 
 
 @pytest.fixture
@@ -148,9 +149,9 @@ def test_get_row(table):
 def test_get_row_repeat_1(table):
     # Set a repetition manually
     row_1 = table.get_elements("table:table-row")[1]
-    assert row_1._table_cache.row_map == [0, 1, 2, 3]
+    assert list(row_1._table_cache.row_map) == [0, 1, 2, 3]
     row_1.repeated = 2
-    assert row_1._table_cache.row_map == [0, 2, 3, 4]
+    assert list(row_1._table_cache.row_map) == [0, 2, 3, 4]
 
 
 def test_get_row_repeat_1_cache_id(table):
@@ -340,7 +341,7 @@ def test_get_row_none_internal():
     with patch.object(Table, "_get_element_idx2", return_value=None):
         table._table_cache.row_elements = {}
         # Restore height
-        table._table_cache.row_map = [0]
+        table._table_cache.row_map = PositionMap([1])
         with pytest.raises(ValueError, match="Row not found"):
             table.get_row(0)
 
@@ -140,3 +140,23 @@ def test_iter_rows_5(table):
     for _row in table.iter_rows(10, 9):
         counter += 1
     assert counter == 0
+
+
+def test_iter_row_runs(table):
+    runs = [(y, repeat) for y, repeat, _row in table.iter_row_runs(5099, 5205)]
+    assert runs[0] == (5099, 1)
+    assert runs[1] == (5100, 100)
+
+
+def test_iter_rows_view(table):
+    rows = list(table.iter_rows(5100, 5199, view=True))
+    assert len(rows) == 100
+    assert all(row is rows[0] for row in rows)
+    assert rows[0].y == 5199
+
+
+def test_get_values_repeated(table):
+    values = table.get_values((0, 5100, 0, 5199))
+    assert values == [["same"]] * 100
+    values[0].append(1)
+    assert values[1] == ["same"]
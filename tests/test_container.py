@@ -25,6 +25,7 @@ import base64
 import io
 import os
 import shutil
+import struct
 import zipfile
 from os.path import isfile, join
 from pathlib import Path
@@ -3290,3 +3291,366 @@ def test_preserve_encrypted_parts_on_save(tmp_path):
         saved_manifest = zf.read("META-INF/manifest.xml")
         assert b"manifest:encryption-data" in saved_manifest
         assert b"Blowfish CFB" in saved_manifest
+
+
+def test_zip_archive_validated_once(samples):
+    with patch("odfdo.container.validate_zip_safety") as validate:
+        container = Container(samples("example.odt"))
+        for part in (ODF_CONTENT, ODF_STYLES, ODF_META, ODF_SETTINGS, ODF_MANIFEST):
+            container.get_part(part)
+        container.get_parts()
+    assert validate.call_count == 1
+
+
+def test_zip_archive_kept_open(samples):
+    container = Container(samples("example.odt"))
+    zf = container._zip_file()
+    container.get_part(ODF_CONTENT)
+    assert container._zip_file() is zf
+    assert "content.xml" in container._zip_infos()
+
+
+def test_zip_archive_close(samples):
+    container = Container(samples("example.odt"))
+    zf = container._zip_file()
+    container.close()
+    assert zf.fp is None
+    # archive is opened again if needed
+    assert b"<office:document-content" in container.get_part(ODF_CONTENT)
+    container.close()
+    container.close()
+
+
+def test_container_context_manager(samples):
+    with Container(samples("example.odt")) as container:
+        zf = container._zip_file()
+        content = container.get_part(ODF_CONTENT)
+    assert zf.fp is None
+    assert b"<office:document-content" in content
+
+
+def test_clone_does_not_share_zip_archive(samples):
+    container = Container(samples("example.odt"))
+    zf = container._zip_file()
+    clone = container.clone
+    assert clone._Container__zipfile is None
+    assert container._zip_file() is zf
+
+
+def test_save_same_path_with_opened_archive(samples, tmp_path):
+    dst = tmp_path / "same_path_opened.odt"
+    shutil.copy(samples("example.odt"), dst)
+    container = Container(dst)
+    container.get_part(ODF_CONTENT)
+    container.set_part("test.txt", b"test")
+    container.save(dst)
+    # parts not yet loaded are read from the new file
+    assert container.get_part("test.txt") == b"test"
+    assert "test.txt" in container.get_parts()
+
+
+def _raw_member(path, name):
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+    with open(path, "rb") as f:
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack("<2H", f.read(4))
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        return f.read(info.compress_size)
+
+
+def test_save_zip_raw_copy_unmodified_parts(samples, tmp_path):
+    src = samples("example.odt")
+    container = Container(src)
+    container.set_part("test.txt", b"test")
+    target = tmp_path / "raw_copy.odt"
+    with patch.object(
+        Container, "_read_zip_entry", wraps=Container._read_zip_entry
+    ) as read_entry:
+        container.save(target)
+    # no part was decompressed to be saved
+    assert read_entry.call_count == 0
+    with zipfile.ZipFile(target) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist()[0] == "mimetype"
+        assert zf.read("test.txt") == b"test"
+        assert zf.read(ODF_CONTENT) == container.get_part(ODF_CONTENT)
+    assert _raw_member(target, ODF_STYLES) == _raw_member(src, ODF_STYLES)
+
+
+def test_save_zip_raw_copy_loaded_part(samples, tmp_path):
+    src = samples("example.odt")
+    container = Container(src)
+    content = container.get_part(ODF_CONTENT)
+    target = tmp_path / "raw_copy_loaded.odt"
+    container.save(target)
+    assert _raw_member(target, ODF_CONTENT) == _raw_member(src, ODF_CONTENT)
+    with zipfile.ZipFile(target) as zf:
+        assert zf.read(ODF_CONTENT) == content
+
+
+def test_save_zip_raw_copy_modified_and_deleted_parts(samples, tmp_path):
+    container = Container(samples("example.odt"))
+    container.set_part(ODF_META, b"<meta/>")
+    container.del_part(ODF_SETTINGS)
+    target = tmp_path / "raw_copy_modified.odt"
+    container.save(target)
+    with zipfile.ZipFile(target) as zf:
+        assert zf.testzip() is None
+        assert zf.read(ODF_META) == b"<meta/>"
+        assert ODF_SETTINGS not in zf.namelist()
+        assert ODF_MANIFEST in zf.namelist()
+
+
+def test_save_zip_raw_copy_data_descriptor(tmp_path):
+    class Unseekable:
+        def __init__(self):
+            self.buffer = io.BytesIO()
+
+        def write(self, data):
+            return self.buffer.write(data)
+
+        def flush(self):
+            pass
+
+    stream = Unseekable()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", ODF_EXTENSIONS["odt"], zipfile.ZIP_STORED)
+        zf.writestr(ODF_CONTENT, b"<office:document-content/>" * 100)
+        zf.writestr(ODF_MANIFEST, b"<manifest:manifest/>")
+    src = tmp_path / "descriptor.odt"
+    src.write_bytes(stream.buffer.getvalue())
+    container = Container(src)
+    target = tmp_path / "descriptor_copy.odt"
+    container.save(target)
+    with zipfile.ZipFile(target) as zf:
+        assert zf.testzip() is None
+        assert not zf.getinfo(ODF_CONTENT).flag_bits & 0x08
+        assert zf.read(ODF_CONTENT) == b"<office:document-content/>" * 100
+
+
+def test_save_zip_raw_copy_to_bytesio(samples):
+    container = Container(samples("example.odt"))
+    buffer = io.BytesIO()
+    container.save(buffer)
+    reloaded = Container(buffer)
+    assert reloaded.get_part(ODF_CONTENT) == container.get_part(ODF_CONTENT)
+
+
+def test_open_part_zip_stream(samples):
+    container = Container(samples("example.odt"))
+    with container.open_part(ODF_CONTENT) as stream:
+        data = stream.read()
+    assert data.startswith(b"<?xml")
+    # the part is not kept in memory
+    assert ODF_CONTENT not in container._Container__parts
+    assert data == container.get_part(ODF_CONTENT)
+
+
+def test_open_part_loaded_part(samples):
+    container = Container(samples("example.odt"))
+    container.set_part("test.txt", b"test")
+    with container.open_part("test.txt") as stream:
+        assert stream.read() == b"test"
+
+
+def test_open_part_deleted(samples):
+    container = Container(samples("example.odt"))
+    container.del_part(ODF_CONTENT)
+    with pytest.raises(ValueError):
+        container.open_part(ODF_CONTENT)
+
+
+def test_open_part_zip_missing(samples):
+    container = Container(samples("example.odt"))
+    with pytest.raises(KeyError):
+        container.open_part("missing.xml")
+
+
+def test_open_part_folder(tmp_path, samples):
+    container = Container(samples("example.odt"))
+    container.save(tmp_path / "folder_stream", packaging=FOLDER)
+    folder = Container(tmp_path / "folder_stream.folder")
+    with folder.open_part(ODF_CONTENT) as stream:
+        assert stream.read() == container.get_part(ODF_CONTENT)
+    with pytest.raises(FileNotFoundError):
+        folder.open_part("missing.xml")
+
+
+def test_open_part_flat_xml_missing(samples):
+    container = Container(samples("example.xml"))
+    with pytest.raises(KeyError):
+        container.open_part("missing.xml")
+
+
+def test_open_part_security_limit(tmp_path):
+    path = tmp_path / "big.odt"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", ODF_EXTENSIONS["odt"], zipfile.ZIP_STORED)
+        zf.writestr("big.txt", "X" * 1000)
+    container = Container(path)
+    original_limit = security.max_uncompressed_size
+    try:
+        security.max_uncompressed_size = 500
+        with container.open_part("big.txt") as stream:
+            with pytest.raises(SecurityError, match=r"ZIP entry 'big\.txt'"):
+                stream.read()
+    finally:
+        security.max_uncompressed_size = original_limit
+
+
+def _memory_container_with_image(samples):
+    container = Container(io.BytesIO(samples("frame_image.odp").read_bytes()))
+    container.set_part("Pictures/extra.png", b"\x89PNG\r\n\x1a\n" + b"A" * 5000)
+    container.set_part("Thumbnails/", b"")
+    return container
+
+
+def test_save_zip_compression_level(samples):
+    container = _memory_container_with_image(samples)
+    fast = io.BytesIO()
+    container.save(fast, compression_level=1)
+    best = io.BytesIO()
+    container.save(best, compression_level=9)
+    with zipfile.ZipFile(fast) as zf_fast, zipfile.ZipFile(best) as zf_best:
+        assert zf_fast.testzip() is None
+        assert zf_best.testzip() is None
+        assert zf_fast.read(ODF_CONTENT) == zf_best.read(ODF_CONTENT)
+        assert (
+            zf_fast.getinfo(ODF_CONTENT).compress_size
+            >= zf_best.getinfo(ODF_CONTENT).compress_size
+        )
+
+
+def test_save_zip_compression_level_invalid(samples):
+    container = _memory_container_with_image(samples)
+    with pytest.raises(ValueError):
+        container.save(io.BytesIO(), compression_level=10)
+
+
+def test_save_zip_workers_invalid(samples):
+    container = _memory_container_with_image(samples)
+    with pytest.raises(ValueError):
+        container.save(io.BytesIO(), workers=0)
+
+
+def test_save_zip_store_media(samples):
+    container = _memory_container_with_image(samples)
+    buffer = io.BytesIO()
+    container.save(buffer, store_media=True)
+    with zipfile.ZipFile(buffer) as zf:
+        assert zf.getinfo("Pictures/extra.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo(ODF_CONTENT).compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+
+
+@pytest.mark.parametrize("store_media", [False, True])
+def test_save_zip_workers(samples, store_media):
+    container = _memory_container_with_image(samples)
+    sequential = io.BytesIO()
+    container.save(sequential, compression_level=6, store_media=store_media)
+    parallel = io.BytesIO()
+    container.save(parallel, compression_level=6, store_media=store_media, workers=4)
+    with zipfile.ZipFile(sequential) as zf_seq, zipfile.ZipFile(parallel) as zf_par:
+        assert zf_par.testzip() is None
+        assert zf_par.namelist() == zf_seq.namelist()
+        assert zf_par.namelist()[0] == "mimetype"
+        assert zf_par.namelist()[-1] == ODF_MANIFEST
+        for name in zf_seq.namelist():
+            assert zf_par.read(name) == zf_seq.read(name)
+            if name.endswith("/"):
+                continue
+            info_seq = zf_seq.getinfo(name)
+            info_par = zf_par.getinfo(name)
+            assert info_par.compress_type == info_seq.compress_type
+            assert info_par.compress_size == info_seq.compress_size
+        assert zf_par.getinfo("Thumbnails/").is_dir()
+
+
+def test_save_zip_workers_with_raw_copy(samples):
+    container = Container(samples("example.odt"))
+    container.set_part(ODF_META, b"<meta/>")
+    buffer = io.BytesIO()
+    container.save(buffer, workers=2)
+    with zipfile.ZipFile(buffer) as zf:
+        assert zf.testzip() is None
+        assert zf.read(ODF_META) == b"<meta/>"
+        assert zf.read(ODF_CONTENT) == container.get_part(ODF_CONTENT)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_save_zip_without_raw_write(samples, tmp_path, workers):
+    src = samples("example.odt")
+    container = Container(src)
+    container.set_part(ODF_META, b"<meta/>")
+    target = tmp_path / "public_write.odt"
+    # as if ZipFile had not the private attributes of the raw copy
+    with (
+        patch("odfdo.container._RAW_WRITE_ATTRIBUTES", ("_no_such_attribute",)),
+        patch("odfdo.container._write_zip_entry") as write_entry,
+    ):
+        container.save(target, workers=workers)
+    write_entry.assert_not_called()
+    with zipfile.ZipFile(target) as zf, zipfile.ZipFile(src) as zf_src:
+        assert zf.testzip() is None
+        assert zf.namelist()[0] == "mimetype"
+        assert zf.read(ODF_META) == b"<meta/>"
+        for name in zf_src.namelist():
+            if name != ODF_META:
+                assert zf.read(name) == zf_src.read(name)
+                info = zf.getinfo(name)
+                assert info.compress_type == zf_src.getinfo(name).compress_type
+
+
+def _meta_writer(stream):
+    stream.write(b"<meta/>")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_save_zip_writers(samples, workers):
+    container = Container(samples("example.odt"))
+    buffer = io.BytesIO()
+    container.save(buffer, workers=workers, writers={ODF_META: _meta_writer})
+    with zipfile.ZipFile(buffer) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist()[0] == "mimetype"
+        assert zf.namelist()[-1] == ODF_MANIFEST
+        assert zf.read(ODF_META) == b"<meta/>"
+        assert zf.getinfo(ODF_META).compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read(ODF_CONTENT) == container.get_part(ODF_CONTENT)
+
+
+def test_save_zip_writers_same_path(samples, tmp_path):
+    path = tmp_path / "example.odt"
+    shutil.copy(samples("example.odt"), path)
+    container = Container(path)
+    container.save(path, writers={ODF_META: _meta_writer})
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert zf.read(ODF_META) == b"<meta/>"
+
+
+def test_save_zip_writers_new_part(samples):
+    container = Container(samples("example.odt"))
+    buffer = io.BytesIO()
+    container.save(buffer, writers={"extra.xml": _meta_writer})
+    with zipfile.ZipFile(buffer) as zf:
+        assert zf.read("extra.xml") == b"<meta/>"
+    assert "extra.xml" not in container.parts
+
+
+def test_save_folder_writers(samples, tmp_path):
+    container = Container(samples("example.odt"))
+    target = tmp_path / "example"
+    container.save(target, packaging=FOLDER, writers={ODF_META: _meta_writer})
+    saved = Path(str(target) + ".folder") / ODF_META
+    assert saved.read_bytes() == b"<meta/>"
+
+
+def test_save_zip_writers_zip64(samples):
+    container = Container(samples("example.odt"))
+    buffer = io.BytesIO()
+    container.save(buffer, writers={ODF_META: _meta_writer})
+    with zipfile.ZipFile(buffer) as zf:
+        # streamed parts may exceed 2 GiB, their size is not known in advance
+        assert zf.getinfo(ODF_META).extract_version >= zipfile.ZIP64_VERSION
@@ -32,8 +32,10 @@ import pytest
 import odfdo
 import odfdo.element
 from odfdo.body import Drawing
+from odfdo.cell import Cell
 from odfdo.const import ODF_CONTENT
 from odfdo.container import Container
+from odfdo.document import Document
 from odfdo.element import (
     FIRST_CHILD,
     NEXT_SIBLING,
@@ -41,15 +43,25 @@ from odfdo.element import (
     Element,
     _decode_qname,
     _generate_odf_namespaces,
+    _get_lxml_tag,
+    _get_prefixed_name,
     _uri_to_prefix,
     _xpath_text_descendant_no_annotation,
+    class_lookup_enabled,
+    enable_class_lookup,
+    enable_wrapper_cache,
     register_element_class,
+    set_xpath_cache_size,
+    wrapper_cache_enabled,
+    xpath_cache_info,
     xpath_compile,
 )
 from odfdo.image import DrawImage
 from odfdo.named_range import NamedRange
 from odfdo.paragraph import Paragraph
+from odfdo.row import Row
 from odfdo.section import Section
+from odfdo.table import Table
 from odfdo.tracked_changes import TextChangedRegion
 from odfdo.xmlpart import XmlPart
 
@@ -136,6 +148,32 @@ def test_uri_to_prefix_bad():
         _uri_to_prefix("wrong_uri")
 
 
+def test_uri_to_prefix_all():
+    for prefix, uri in odfdo.element.ODF_NAMESPACES.items():
+        assert _uri_to_prefix(uri) == prefix
+
+
+def test_get_prefixed_name():
+    lxml_tag = _get_lxml_tag("text:p")
+    assert lxml_tag == "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}p"
+    assert _get_prefixed_name(lxml_tag) == "text:p"
+    assert _get_prefixed_name("name") == ":name"
+
+
+def test_tag_caches_bounded():
+    for function in (_get_lxml_tag, _get_prefixed_name):
+        assert function.cache_info().maxsize == odfdo.element.TAG_CACHE_SIZE
+    for idx in range(odfdo.element.TAG_CACHE_SIZE + 10):
+        _get_lxml_tag(f"text:name{idx}")
+    info = _get_lxml_tag.cache_info()
+    assert info.currsize <= odfdo.element.TAG_CACHE_SIZE
+
+
+def test_get_lxml_tag_bad():
+    with pytest.raises(ValueError):
+        _get_lxml_tag("hip:hop")
+
+
 def test_etext_parent_1():
     element = Element.from_tag('<text:p style="aa"/>')
     lst = element.xpath("//@style")
@@ -261,6 +299,75 @@ def test_elements_repeated_sequence_2():
     assert result == []
 
 
+def test_xpath_cache_info():
+    set_xpath_cache_size(2)
+    try:
+        xpath_compile("descendant::text:p")
+        xpath_compile("descendant::text:p")
+        xpath_compile("descendant::text:h")
+        xpath_compile("descendant::text:span")
+        info = xpath_cache_info()
+        assert info.hits == 1
+        assert info.misses == 3
+        assert info.maxsize == 2
+        assert info.currsize == 2
+    finally:
+        set_xpath_cache_size()
+    assert xpath_cache_info().currsize == 0
+
+
+def test_filtered_elements_quoted_value():
+    para = Paragraph("aaa", style='a"b')
+    element = Element.from_tag("<office:text/>")
+    element.append(para)
+    result = element._filtered_elements("descendant::text:p", text_style='a"b')
+    assert len(result) == 1
+
+
+def _make_text_body():
+    body = Element.from_tag("<office:text/>")
+    for idx, style in enumerate(["s1", "s2", "s1", "s2", "s1"]):
+        body.append(Paragraph(f"text {idx}", style=style))
+    return body
+
+
+def test_filtered_element_position():
+    body = _make_text_body()
+    assert body._filtered_element("descendant::text:p", 0).text == "text 0"
+    assert body._filtered_element("descendant::text:p", 3).text == "text 3"
+    assert body._filtered_element("descendant::text:p", -2).text == "text 3"
+    assert body._filtered_element("descendant::text:p", 5) is None
+
+
+def test_filtered_element_position_attribute():
+    body = _make_text_body()
+    para = body._filtered_element("descendant::text:p", 1, text_style="s2")
+    assert para.text == "text 3"
+    para = body._filtered_element("descendant::text:p", -1, text_style="s1")
+    assert para.text == "text 4"
+    assert body._filtered_element("descendant::text:p", 2, text_style="s2") is None
+
+
+def test_filtered_element_position_content():
+    body = _make_text_body()
+    para = body._filtered_element("descendant::text:p", 1, content="[024]")
+    assert para.text == "text 2"
+    para = body._filtered_element(
+        "descendant::text:p", -1, content="[0-3]", text_style="s1"
+    )
+    assert para.text == "text 2"
+    assert body._filtered_element("descendant::text:p", 3, content="[024]") is None
+    assert body._filtered_element("descendant::text:p", -4, content="[024]") is None
+
+
+@pytest.mark.parametrize("content", [None, "b"])
+def test_filtered_element_table_cache(content):
+    table = Table("T")
+    table.set_values([["a", "b"], ["c", "d"]])
+    row = table._filtered_element("descendant::table:table-row", 0, content=content)
+    assert row._table_cache is table._table_cache
+
+
 def test_get_element_list(sample):
     content_part = sample.content
     elements = content_part.get_elements("//text:p")
@@ -1065,3 +1172,109 @@ def test_filtered_drawing_7(drawing_test):
     dt2 = datetime(2024, 3, 30, 12, 0, 1)
     res = drawing._filtered_elements("descendant::text:changed-region", dc_date=dt2)
     assert len(res) == 0
+
+
+@pytest.fixture
+def wrapper_cache() -> Iterable[None]:
+    enable_wrapper_cache()
+    yield
+    enable_wrapper_cache(False)
+
+
+def test_wrapper_cache_disabled_by_default():
+    assert not wrapper_cache_enabled()
+    paragraph = Paragraph("text")
+    paragraph.append(Element.from_tag("text:span"))
+    span = paragraph.children[0]
+    assert span.parent is not span.parent
+
+
+def test_wrapper_cache_enable(wrapper_cache):
+    assert wrapper_cache_enabled()
+    enable_wrapper_cache(False)
+    assert not wrapper_cache_enabled()
+
+
+def test_wrapper_cache_same_wrapper(wrapper_cache):
+    paragraph = Paragraph("text")
+    paragraph.append(Element.from_tag("text:span"))
+    span = paragraph.children[0]
+    assert span.parent is paragraph
+    assert paragraph.children[0] is span
+    assert paragraph.get_element("text:span") is span
+
+
+def test_wrapper_cache_class(wrapper_cache):
+    paragraph = Paragraph("text")
+    elem = paragraph._xml_element
+    assert Element.from_tag(elem) is paragraph
+    section = Section.from_tag(Element.from_tag("text:foo")._xml_element)
+    assert isinstance(section, Section)
+
+
+def test_wrapper_cache_keeps_table_cache(wrapper_cache):
+    table = odfdo.Table("table", width=3, height=3)
+    body = Element.from_tag("office:spreadsheet")
+    body.append(table)
+    found = body.get_element("table:table")
+    assert found is table
+    assert found._table_cache is table._table_cache
+
+
+def test_wrapper_cache_weak(wrapper_cache):
+    paragraph = Paragraph("text")
+    paragraph.append(Element.from_tag("text:span"))
+    count = len(odfdo.element._wrapper_cache)
+    paragraph.children[0]
+    assert len(odfdo.element._wrapper_cache) == count
+
+
+@pytest.fixture
+def class_lookup() -> Iterable[None]:
+    enable_class_lookup()
+    yield
+    enable_class_lookup(False)
+
+
+def test_class_lookup_disabled_by_default():
+    assert not class_lookup_enabled()
+    paragraph = Paragraph("text")
+    assert not isinstance(paragraph._xml_element, odfdo.element._OdfElementBase)
+
+
+def test_class_lookup_enable(class_lookup):
+    assert class_lookup_enabled()
+    enable_class_lookup(False)
+    assert not class_lookup_enabled()
+
+
+def test_class_lookup_new_element(class_lookup):
+    paragraph = Paragraph("text")
+    lxml_class = type(paragraph._xml_element)
+    assert issubclass(lxml_class, odfdo.element._OdfElementBase)
+    assert lxml_class._odf_class is Paragraph
+    assert type(Element.from_tag(paragraph._xml_element)) is Paragraph
+    unknown = Element.from_tag("text:foo")
+    assert not isinstance(unknown._xml_element, odfdo.element._OdfElementBase)
+    assert type(unknown) is Element
+
+
+def test_class_lookup_parsed_document(class_lookup, samples):
+    document = Document(samples("simple_table.ods"))
+    table = document.body.get_table(0)
+    assert isinstance(table, Table)
+    row = table.get_row(0)
+    assert isinstance(row, Row)
+    assert isinstance(row._xml_element, odfdo.element._OdfElementBase)
+    assert isinstance(row.get_cell(0), Cell)
+    assert (
+        table.get_values()
+        == Document(samples("simple_table.ods")).body.get_table(0).get_values()
+    )
+
+
+def test_class_lookup_disabled_after_parsing(class_lookup, samples):
+    document = Document(samples("simple_table.ods"))
+    body = document.body
+    enable_class_lookup(False)
+    assert isinstance(body.get_table(0).get_row(0), Row)
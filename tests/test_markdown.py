@@ -838,3 +838,26 @@ def test_md_table_text(document_tab):  # FAIL
     ).strip()
     print(repr(md.strip()))
     assert md.strip() == expected
+
+
+def test_md_inherited_text_style():
+    document = Document("text")
+    document.body.clear()
+    document.insert_style(
+        '<style:style style:name="bold_base" style:family="text">'
+        '<style:text-properties fo:font-weight="bold"/></style:style>'
+    )
+    document.insert_style(
+        '<style:style style:name="bold_mid" style:family="text" '
+        'style:parent-style-name="bold_base"/>'
+    )
+    document.insert_style(
+        '<style:style style:name="bold_child" style:family="text" '
+        'style:parent-style-name="bold_mid"/>',
+        automatic=True,
+    )
+    paragraph = Paragraph("")
+    paragraph.append_plain_text("some ")
+    paragraph.set_span("bold_child", regex="some")
+    document.body.append(paragraph)
+    assert document.to_markdown().strip() == "**some**"
@@ -0,0 +1,270 @@
+# Copyright 2018-2026 Jérôme Dumonteil
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Authors (odfdo project): jerome.dumonteil@gmail.com
+
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from odfdo.cell import Cell
+from odfdo.document import Document
+from odfdo.paragraph import Span
+from odfdo.row import Row
+from odfdo.stream import SpreadsheetWriter, iter_table_rows, iter_tables_rows
+from odfdo.style import Style
+from odfdo.table import Table
+
+
+def _stripped_values(table: Table) -> list[list]:
+    values = []
+    for row in table.get_values(complete=False):
+        used = [idx + 1 for idx, value in enumerate(row) if value is not None]
+        values.append(row[: max(used, default=0)])
+    while values and not values[-1]:
+        values.pop()
+    return values
+
+
+def _saved(document: Document) -> io.BytesIO:
+    output = io.BytesIO()
+    document.save(output)
+    output.seek(0)
+    return output
+
+
+def test_iter_table_rows_simple(samples):
+    path = samples("simple_table.ods")
+    rows = list(iter_table_rows(path))
+    assert rows == [
+        [1, 1, 1, 2, 3, 3, 3],
+        [1, 1, 1, 2, 3, 3, 3],
+        [1, 1, 1, 2, 3, 3, 3],
+        [1, 2, 3, 4, 5, 6, 7],
+    ]
+
+
+def test_iter_table_rows_same_as_table(samples):
+    for name in ("simple_table.ods", "rowgroup.ods", "spanned_cells.ods"):
+        path = samples(name)
+        for idx, table in enumerate(Document(path).body.tables):
+            expected = _stripped_values(table)
+            assert list(iter_table_rows(path, idx)) == expected
+            assert list(iter_table_rows(path, table.name)) == expected
+
+
+def test_iter_table_rows_big(samples):
+    path = samples("big.ods")
+    table = Document(path).body.get_table(0)
+    rows = list(iter_table_rows(path))
+    assert len(rows) == table.height
+    assert rows[-1] == _stripped_values(table)[-1]
+
+
+def test_iter_table_rows_flat(samples):
+    path = samples("test_flat_lo.fods")
+    table = Document(path).body.get_table(0)
+    assert list(iter_table_rows(path)) == _stripped_values(table)
+
+
+def test_iter_table_rows_no_rstrip(samples):
+    path = samples("simple_table.ods")
+    rows = list(iter_table_rows(path, "Example2", rstrip=False))
+    table = Document(path).body.get_table(name="Example2")
+    assert rows == table.get_values()
+
+
+def test_iter_table_rows_no_rstrip_width():
+    document = Document("spreadsheet")
+    table = Table("T", width=3)
+    row = Row()
+    row.append_cell(Cell("x"))
+    table.append_row(row)
+    table.append_row(Row())
+    document.body.append(table)
+    rows = list(iter_table_rows(_saved(document), "T", rstrip=False))
+    assert rows == [[None, None, None], ["x", None, None], [None, None, None]]
+    assert rows == list(table.iter_values())
+    rows = list(iter_table_rows(_saved(document), "T", get_type=True, rstrip=False))
+    assert rows[1] == [("x", "string"), (None, None), (None, None)]
+
+
+def test_iter_table_rows_get_type(samples):
+    path = samples("simple_table.ods")
+    rows = list(iter_table_rows(path, get_type=True))
+    assert rows[0][0] == (1, "float")
+
+
+def test_iter_table_rows_repeated():
+    document = Document("spreadsheet")
+    table = Table("T", width=3, height=1)
+    table.set_value("A1", "x")
+    table.set_value("B1", Decimal("2.5"))
+    row = Row(repeated=3)
+    row.set_values(["a", None, 3])
+    table.append_row(row)
+    table.append_row(Row(repeated=4))
+    table.append_row(Row())
+    table.set_value("A10", "end")
+    document.body.append(table)
+    rows = list(iter_table_rows(_saved(document), "T"))
+    assert rows == [
+        ["x", Decimal("2.5")],
+        ["a", None, 3],
+        ["a", None, 3],
+        ["a", None, 3],
+        [],
+        [],
+        [],
+        [],
+        [],
+        ["end"],
+    ]
+    rows[1].append(0)
+    assert rows[2] == ["a", None, 3]
+
+
+def test_iter_table_rows_markup():
+    document = Document("spreadsheet")
+    table = Table("T", width=1, height=1)
+    cell = table.get_cell("A1")
+    cell.set_value("hello ")
+    cell.del_attribute("office:string-value")
+    cell.get_paragraph().append(Span("world"))
+    table.set_cell("A1", cell)
+    document.body.append(table)
+    assert list(iter_table_rows(_saved(document), "T")) == table.get_values()
+    assert table.get_values() == [["hello world"]]
+
+
+def test_iter_table_rows_missing_table(samples):
+    path = samples("simple_table.ods")
+    with pytest.raises(ValueError):
+        list(iter_table_rows(path, 42))
+    with pytest.raises(ValueError):
+        list(iter_table_rows(path, "missing"))
+
+
+def test_iter_tables_rows(samples):
+    path = samples("simple_table.ods")
+    names = [name for name, _values in iter_tables_rows(path)]
+    assert names == ["Example1"] * 4 + ["Example3"] * 2
+
+
+def test_writer_values():
+    output = io.BytesIO()
+    rows = [["x", 1, 2.5, True, date(2024, 1, 2), None, Decimal("3.3")]]
+    with SpreadsheetWriter(output) as writer:
+        writer.add_sheet("Data")
+        for row in rows:
+            writer.write_row(row)
+    output.seek(0)
+    table = Document(output).body.get_table(name="Data")
+    assert table.get_values() == [
+        ["x", 1, Decimal("2.5"), True, date(2024, 1, 2), None, Decimal("3.3")]
+    ]
+    expected = Table("Data")
+    expected.set_values(rows)
+    assert table.get_cell("C1").serialize() == expected.get_cell("C1").serialize()
+
+
+def test_writer_mimetype_first():
+    output = io.BytesIO()
+    with SpreadsheetWriter(output) as writer:
+        writer.add_sheet("Data")
+    output.seek(0)
+    with zipfile.ZipFile(output) as filezip:
+        info = filezip.infolist()[0]
+        assert info.filename == "mimetype"
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert "META-INF/manifest.xml" in filezip.namelist()
+
+
+def test_writer_xml_parts_zip64():
+    output = io.BytesIO()
+    with SpreadsheetWriter(output) as writer:
+        writer.add_sheet("Data")
+    output.seek(0)
+    with zipfile.ZipFile(output) as filezip:
+        for path in ("content.xml", "styles.xml", "META-INF/manifest.xml"):
+            info = filezip.getinfo(path)
+            assert info.extract_version >= zipfile.ZIP64_VERSION
+
+
+def test_writer_repeated_rows():
+    output = io.BytesIO()
+    with SpreadsheetWriter(output) as writer:
+        writer.add_sheet("Data")
+        writer.write_row(["title"])
+        for _i in range(1000):
+            writer.write_row([1, 1, 1, "z"])
+    output.seek(0)
+    document = Document(output)
+    table = document.body.get_table(0)
+    assert table.height == 1001
+    assert table.width == 1
+    rows = table.get_elements("table:table-row")
+    assert len(rows) == 2
+    assert rows[1].repeated == 1000
+    assert len(rows[1].get_elements("table:table-cell")) == 2
+    assert table.get_values((0, 1000, 3, 1000)) == [[1, 1, 1, "z"]]
+
+
+def test_writer_sheets():
+    output = io.BytesIO()
+    with SpreadsheetWriter(output) as writer:
+        writer.add_sheet("A")
+        writer.write_row(["a"])
+        writer.add_sheet("B", width=3, style="ta1")
+        writer.add_sheet("C")
+        writer.write_row(["c", 2])
+    output.seek(0)
+    assert list(iter_tables_rows(output)) == [("A", ["a"]), ("C", ["c", 2])]
+    output.seek(0)
+    tables = Document(output).body.tables
+    assert [table.name for table in tables] == ["A", "B", "C"]
+    assert tables[1].width == 3
+    output.seek(0)
+    assert list(iter_table_rows(output, "B")) == []
+
+
+def test_writer_styles():
+    output = io.BytesIO()
+    with SpreadsheetWriter(output) as writer:
+        style = Style("table-cell", name="bold", area="text", bold=True)
+        writer.document.insert_style(style, automatic=True)
+        writer.add_sheet("Data")
+        writer.write_row(["a", "b"], cell_style="bold")
+    output.seek(0)
+    document = Document(output)
+    cell = document.body.get_table(0).get_cell("B1")
+    assert cell.style == "bold"
+    assert document.get_style("table-cell", "bold") is not None
+
+
+def test_writer_errors():
+    output = io.BytesIO()
+    writer = SpreadsheetWriter(output)
+    with pytest.raises(ValueError):
+        writer.write_row([1])
+    with pytest.raises(ValueError):
+        writer.add_sheet("A/B")
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.add_sheet("A")
+    writer.close()
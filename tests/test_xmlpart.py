@@ -21,6 +21,7 @@
 #          David Versmisse <david.versmisse@itaapy.com>
 
 from collections.abc import Iterable
+from io import BytesIO
 
 import pytest
 from lxml.etree import _ElementTree  # ty: ignore[unresolved-import]
@@ -28,7 +29,7 @@ from lxml.etree import _ElementTree  # ty: ignore[unresolved-import]
 from odfdo.const import ODF_CONTENT, ODF_META
 from odfdo.container import Container
 from odfdo.content import Content
-from odfdo.element import Element
+from odfdo.element import Element, _tree_style_mutation_count
 from odfdo.xmlpart import XmlPart
 
 
@@ -155,3 +156,184 @@ def test_pretty_serialize_internal_pretty2(samples):
     serialized = content.serialize(pretty=True)
     expected = b'This is an example with =&gt;</text:span><text:span text:style-name="T4"> v</text:span><text:span text:style-name="T5">8</text:span><text:span text:style-name="T4">.1.</text:span><text:span text:style-name="T5">4</text:span><text:span text:style-name="T4"> &lt;</text:span><text:span text:style-name="T6">= spaces </text:span><text:span text:style-name="T7">after reading and writing with odfdo.'
     assert expected in serialized
+
+
+def test_is_modified_not_loaded(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    assert not content.is_modified
+
+
+def test_is_modified_read_only(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.get_elements("//text:p")
+    assert not content.is_modified
+
+
+def test_is_modified_attribute(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = content.get_element("//text:p")
+    paragraph.set_attribute("text:style-name", "Other")
+    assert content.is_modified
+
+
+def test_is_modified_text(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = content.get_element("//text:p")
+    paragraph.text = "changed"
+    assert content.is_modified
+
+
+def test_is_modified_append(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.body.append(Element.from_tag("text:p"))
+    assert content.is_modified
+
+
+def test_is_modified_delete(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = content.get_element("//text:p")
+    paragraph.delete()
+    assert content.is_modified
+
+
+def test_style_mutation_count(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    root = content.root._xml_element
+    count = _tree_style_mutation_count(root)
+    content.body.append(Element.from_tag("text:p"))
+    assert _tree_style_mutation_count(root) == count
+    style = content.get_element("//office:automatic-styles/style:style")
+    style.get_element("style:*").set_attribute("fo:color", "#FF0000")
+    assert _tree_style_mutation_count(root) == count
+    style.set_attribute("style:name", "renamed")
+    assert _tree_style_mutation_count(root) == count + 1
+    content.get_element("//office:automatic-styles").append(
+        Element.from_tag("style:style")
+    )
+    assert _tree_style_mutation_count(root) == count + 2
+
+
+def test_is_modified_detached_element(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = content.get_element("//text:p").clone
+    paragraph.text = "changed"
+    assert not content.is_modified
+
+
+def test_is_modified_other_part(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    meta = XmlPart(ODF_META, exemple_container)
+    content.get_element("//text:p").text = "changed"
+    meta.root.get_attribute("office:version")
+    assert content.is_modified
+    assert not meta.is_modified
+
+
+def test_is_modified_moved_element(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    other = XmlPart(ODF_CONTENT, exemple_container.clone)
+    paragraph = other.get_element("//text:p")
+    content.body.append(paragraph)
+    assert content.is_modified
+    assert other.is_modified
+
+
+def test_is_modified_element_edited_after_move(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = Element.from_tag("text:p")
+    paragraph.set_attribute("text:style-name", "A")
+    content.body.append(paragraph)
+    content.mark_saved()
+    paragraph.set_attribute("text:style-name", "B")
+    assert content.is_modified
+
+
+def test_is_modified_element_edited_after_insert(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    paragraph = Element.from_tag("text:p")
+    paragraph.text = "new"
+    content.body.insert(paragraph, position=0)
+    content.mark_saved()
+    paragraph.text = "changed"
+    assert content.is_modified
+
+
+def test_style_mutation_count_tag_changed(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    root = content.root._xml_element
+    element = content.get_element("//office:automatic-styles")
+    count = _tree_style_mutation_count(root)
+    element.tag = "office:foo"
+    assert _tree_style_mutation_count(root) == count + 1
+    element.set_attribute("office:bar", "1")
+    assert _tree_style_mutation_count(root) == count + 1
+
+
+def test_mark_modified(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.root._xml_element.set("foo", "bar")
+    assert not content.is_modified
+    content.mark_modified()
+    assert content.is_modified
+
+
+def test_mark_saved(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.get_element("//text:p").text = "changed"
+    content.mark_saved()
+    assert not content.is_modified
+
+
+def test_is_modified_pretty_serialize(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.pretty_serialize()
+    assert content.is_modified
+
+
+def test_is_modified_clone(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.get_element("//text:p").text = "changed"
+    clone = content.clone
+    assert not clone.is_modified
+
+
+def test_write(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    stream = BytesIO()
+    content.write(stream)
+    assert stream.getvalue() == content.serialize()
+    assert stream.getvalue().startswith(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+
+
+def test_serialize_utf8(exemple_container):
+    content = XmlPart(ODF_CONTENT, exemple_container)
+    content.get_element("//text:p").text = "é€ 😀"
+    assert "é€ 😀".encode() in content.serialize()
+
+
+def test_get_root_child(exemple_container):
+    content = Content(ODF_CONTENT, exemple_container)
+    auto = content._get_root_child("office:automatic-styles")
+    assert auto.tag == "office:automatic-styles"
+    assert auto.parent.tag == "office:document-content"
+    assert content._get_root_child("office:master-styles") is None
+
+
+def test_get_root_child_replaced(exemple_container):
+    content = Content(ODF_CONTENT, exemple_container)
+    auto = content._get_root_child("office:automatic-styles")
+    auto.delete()
+    assert content._get_root_child("office:automatic-styles") is None
+    new_auto = Element.from_tag("office:automatic-styles")
+    content.root.append(new_auto)
+    found = content._get_root_child("office:automatic-styles")
+    assert found._xml_element is new_auto._xml_element
+
+
+def test_get_root_child_clone(exemple_container):
+    content = Content(ODF_CONTENT, exemple_container)
+    auto = content._get_root_child("office:automatic-styles")
+    clone = content.clone
+    found = clone._get_root_child("office:automatic-styles")
+    assert found.tag == "office:automatic-styles"
+    assert found._xml_element is not auto._xml_element
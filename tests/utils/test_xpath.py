@@ -86,3 +86,28 @@ def test_case_last_2_arg():
     query = make_xpath_query("descendant::text:p", position=-2)
     expected = "(descendant::text:p)[last()-1]"
     assert query == expected
+
+
+def test_variables():
+    variables = {}
+    query = make_xpath_query(
+        "descendant::text:h",
+        text_style="Standard",
+        outline_level=1,
+        variables=variables,
+    )
+    assert query == "descendant::text:h[@text:outline-level=$v0][@text:style-name=$v1]"
+    assert variables == {"v0": "1", "v1": "Standard"}
+
+
+def test_variables_same_query():
+    query1 = make_xpath_query("descendant::table:table", table_name="a", variables={})
+    query2 = make_xpath_query("descendant::table:table", table_name="b", variables={})
+    assert query1 == query2
+
+
+def test_variables_true_argument():
+    variables = {}
+    query = make_xpath_query("descendant::text:p", change_id=True, variables=variables)
+    assert query == "descendant::text:p[@text:change-id]"
+    assert variables == {}